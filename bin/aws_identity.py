@@ -0,0 +1,218 @@
+"""
+aws_identity.py - AWS 계정 ID / 리전 조회 (memoize + 디스크 TTL 캐시)
+
+sts.get_caller_identity 는 호출마다 네트워크 왕복이 필요하므로, 아래 순서로 조회하고
+처음 알아낸 값을 재사용합니다. (STS 는 앞 단계에서 계정 ID 를 못 찾았을 때만 호출)
+  1. 프로세스 내 memo
+  2. 환경 변수        : AWS_ACCOUNT_ID, AWS_REGION / AWS_DEFAULT_REGION
+  3. SageMaker 메타데이터 : TRAINING_JOB_ARN / PROCESSING_JOB_ARN 환경 변수,
+                         /opt/ml/metadata/resource-metadata.json 의 ResourceArn
+  4. boto3 Session 설정 : 리전만 (profile / config 파일, 네트워크 없음)
+  5. 디스크 캐시       : {.myenv}/.cache/aws_identity-{profile}-{자격 증명 hash}.json (TTL 기본 12시간)
+  6. STS get_caller_identity (결과를 디스크 캐시에 저장)
+디스크 캐시는 profile 과 자격 증명 (access key ID / AWS_ROLE_ARN) 별로 분리하며,
+AWS_ACCESS_KEY_ID 환경 변수로 자격 증명을 준 경우에는 사용하지 않습니다.
+
+환경 변수:
+  GS_ENV_IDENTITY_CACHE_DIR : 디스크 캐시 위치 (기본: .myenv 작업 디렉토리, 없으면 디스크 캐시 미사용)
+  GS_ENV_IDENTITY_TTL       : 디스크 캐시 TTL (초), 0 이면 디스크 캐시 미사용
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+
+DEFAULT_TTL_SECONDS = 12 * 60 * 60
+# create_env.sh / gs-env-create-kernel-smus.sh 가 쓰는 작업 디렉토리 (Notebook Instance / Studio)
+MYENV_DIRS = (
+    '/home/ec2-user/SageMaker/.myenv',
+    '/home/sagemaker-user/.myenv',
+)
+SAGEMAKER_METADATA_PATH = '/opt/ml/metadata/resource-metadata.json'
+SAGEMAKER_ARN_ENV_VARS = ('TRAINING_JOB_ARN', 'PROCESSING_JOB_ARN', 'TRANSFORM_JOB_ARN')
+
+_lock = threading.Lock()
+_memo = {}   # {(profile, access key, role): {'account_id': ..., 'region_name': ..., 'source': ...}}
+
+
+def _profile() -> str:
+    return os.environ.get('AWS_PROFILE') or 'default'
+
+
+def _memo_key() -> tuple:
+    return (_profile(), os.environ.get('AWS_ACCESS_KEY_ID'), os.environ.get('AWS_ROLE_ARN'))
+
+
+def _credential_id():
+    """
+    디스크 캐시를 나눌 자격 증명 식별자 (role ARN 또는 access key ID)
+    환경 변수 자격 증명이거나 자격 증명을 찾지 못하면 None (디스크 캐시 미사용)
+    """
+    if os.environ.get('AWS_ACCESS_KEY_ID'):
+        return None
+    if os.environ.get('AWS_ROLE_ARN'):
+        return os.environ['AWS_ROLE_ARN']
+    try:
+        import boto3
+        credentials = boto3.session.Session().get_credentials()
+        return credentials.access_key if credentials else None
+    except Exception:
+        return None
+
+
+def _parse_arn(arn: str) -> dict:
+    """arn:aws:sagemaker:{region}:{account}:... → {'region_name', 'account_id'}"""
+    parts = (arn or '').split(':')
+    if len(parts) < 6 or parts[0] != 'arn':
+        return {}
+    return {key: value for key, value in (('region_name', parts[3]), ('account_id', parts[4])) if value}
+
+
+def _from_environment() -> dict:
+    info = {}
+    region = os.environ.get('AWS_REGION') or os.environ.get('AWS_DEFAULT_REGION')
+    if region:
+        info['region_name'] = region
+    if os.environ.get('AWS_ACCOUNT_ID'):
+        info['account_id'] = os.environ['AWS_ACCOUNT_ID']
+    return info
+
+
+def _from_sagemaker_metadata() -> dict:
+    for name in SAGEMAKER_ARN_ENV_VARS:
+        info = _parse_arn(os.environ.get(name))
+        if info:
+            return info
+    try:
+        with open(SAGEMAKER_METADATA_PATH, 'r', encoding='utf-8') as f:
+            return _parse_arn(json.load(f).get('ResourceArn'))
+    except (OSError, ValueError):
+        return {}
+
+
+def cache_dir():
+    """디스크 캐시 디렉토리 (없으면 None)"""
+    configured = os.environ.get('GS_ENV_IDENTITY_CACHE_DIR')
+    if configured:
+        return Path(configured)
+    for myenv_dir in MYENV_DIRS:
+        if os.path.isdir(myenv_dir):
+            return Path(myenv_dir) / '.cache'
+    return None
+
+
+def _cache_path():
+    """현재 profile / 자격 증명의 디스크 캐시 경로 (사용할 수 없으면 None)"""
+    directory = cache_dir()
+    if directory is None:
+        return None
+    credential_id = _credential_id()
+    if credential_id is None:
+        return None
+    digest = hashlib.sha256(credential_id.encode('utf-8')).hexdigest()[:16]
+    return directory / f"aws_identity-{_profile()}-{digest}.json"
+
+
+def _read_disk_cache(path, ttl: float) -> dict:
+    if path is None or ttl <= 0:
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if time.time() - cached.get('cached_at', 0) > ttl:
+        return {}
+    return {key: cached[key] for key in ('account_id', 'region_name') if cached.get(key)}
+
+
+def _write_disk_cache(path, info: dict, ttl: float):
+    if path is None or ttl <= 0:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({**info, 'cached_at': time.time()}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # 캐시 저장 실패는 무시 (다음 호출에서 다시 조회)
+
+
+def _session_region():
+    import boto3
+    return boto3.session.Session().region_name
+
+
+def _sts_account_id(region_name: str = None) -> str:
+    import boto3
+    return boto3.client('sts', region_name=region_name).get_caller_identity()['Account']
+
+
+def get_identity(default_region: str = None, ttl: float = None, refresh: bool = False) -> dict:
+    """
+    {'account_id': ..., 'region_name': ..., 'source': ...} 반환
+
+    Args:
+        default_region: 어디서도 리전을 못 찾았을 때 쓸 값
+        ttl: 디스크 캐시 TTL (초, 기본 GS_ENV_IDENTITY_TTL 또는 12시간, 0 이면 디스크 캐시 미사용)
+        refresh: True 면 memo / 디스크 캐시를 무시하고 다시 조회
+    """
+    if ttl is None:
+        ttl = float(os.environ.get('GS_ENV_IDENTITY_TTL', DEFAULT_TTL_SECONDS))
+    key = _memo_key()
+    with _lock:
+        if refresh or key not in _memo:
+            _memo[key] = _lookup(ttl, refresh)
+        info = dict(_memo[key])
+    if not info.get('region_name'):
+        info['region_name'] = default_region
+    return info
+
+
+def _lookup(ttl: float, refresh: bool) -> dict:
+    """memo 를 제외한 조회 (환경 변수 → SageMaker 메타데이터 → session 리전 → 디스크 캐시 → STS)"""
+    info, sources = {}, []
+
+    def merge(source: str, found: dict):
+        found = {key: value for key, value in found.items() if value and key not in info}
+        if found:
+            info.update(found)
+            sources.append(source)
+
+    for source, lookup in (('env', _from_environment), ('sagemaker', _from_sagemaker_metadata)):
+        merge(source, lookup())
+        if 'account_id' in info and 'region_name' in info:
+            break
+
+    # 현재 session 설정의 리전이 디스크 캐시에 남은 리전보다 우선
+    if 'region_name' not in info:
+        merge('session', {'region_name': _session_region()})
+    if 'account_id' not in info:
+        path = _cache_path()
+        if not refresh:
+            merge('disk_cache', _read_disk_cache(path, ttl))
+        if 'account_id' not in info:
+            info['account_id'] = _sts_account_id(info.get('region_name'))
+            sources.append('sts')
+            _write_disk_cache(path, info, ttl)
+
+    info['source'] = '+'.join(sources)
+    return info
+
+
+def clear_cache(disk: bool = False):
+    """memo 초기화 (disk=True 면 현재 profile 의 디스크 캐시도 자격 증명과 관계없이 모두 삭제)"""
+    with _lock:
+        _memo.clear()
+    directory = cache_dir()
+    if not disk or directory is None or not directory.is_dir():
+        return
+    for path in directory.glob(f"aws_identity-{_profile()}-*.json"):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
@@ -39,12 +39,14 @@ REPO_NAME="gs-automl-base-containers/${ENV_NAME}_sm"
 aws ecr get-login-password --region ${REGION} \
   | docker login --username AWS --password-stdin ${ACCOUNT_ID}.dkr.ecr.${REGION}.amazonaws.com
 
-cp delete_untagged_images.py gen_dockerfile.py "../$ENV_NAME/sm_docker/"
+cp delete_untagged_images.py gen_dockerfile.py aws_identity.py aws_clients.py "../$ENV_NAME/sm_docker/"
 
 cd "../$ENV_NAME/sm_docker"
 
 echo "python gen_dockerfile.py --env ${ENV_NAME} --base_version ${BASE_VERSION} --my_version ${MY_VERSION}"
-python gen_dockerfile.py --env ${ENV_NAME} --base_version ${BASE_VERSION} --my_version ${MY_VERSION}
+# 위에서 조회한 계정 ID / 리전을 넘겨 gen_dockerfile.py 의 STS 재호출 생략
+AWS_ACCOUNT_ID=${ACCOUNT_ID} AWS_REGION=${REGION} \
+  python gen_dockerfile.py --env ${ENV_NAME} --base_version ${BASE_VERSION} --my_version ${MY_VERSION}
 
 docker build -f Dockerfile -t $REPO_NAME .
 
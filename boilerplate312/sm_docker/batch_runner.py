@@ -0,0 +1,256 @@
+"""
+batch_runner.py - 여러 실험 conf 를 프로세스 풀로 동시에 실행하는 batch 모드
+
+실험마다 SageMaker job 을 따로 띄우는 대신, 큰 인스턴스 한 대에서 sweep 을 돌립니다.
+- conf 경로 여러 개 또는 glob (예: s3://bucket/dev/{user_id}/{project}/*/) 를 실험 목록으로 확장
+- 실험마다 별도 work_dir ({batch_dir}/runs/{slug}) 과 로그 파일 사용
+- 데이터 다운로드는 공유 DatasetCache 로 한 번만 (여러 프로세스 동시 사용 가능)
+- 동시 실행 수는 CPU 수와 (전체 메모리 / 실험당 메모리) 중 작은 값으로 제한
+- warm 커널 풀을 지정하면 worker 프로세스마다 풀을 하나 띄우고,
+  그 worker 가 맡는 실험들이 같은 warm 커널을 이어서 사용 (실험 간 %reset -f)
+
+결과:
+  {batch_dir}/batch_summary.json
+"""
+
+import os
+import re
+import json
+import time
+import fnmatch
+import logging
+import multiprocessing
+import multiprocessing.util
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_RUN_MEMORY_GB = 4.0
+SUMMARY_FILENAME = 'batch_summary.json'
+GLOB_CHARS = ('*', '?', '[')
+
+
+# ============================================================
+# conf 경로 확장
+# ============================================================
+def _has_glob(text: str) -> bool:
+    return any(ch in text for ch in GLOB_CHARS)
+
+
+def _list_child_prefixes(client, bucket: str, prefix: str) -> list:
+    """prefix 바로 아래의 하위 prefix (폴더) 목록"""
+    children = []
+    paginator = client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/'):
+        children.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+    return children
+
+
+def expand_conf_paths(patterns: list, client) -> list:
+    """
+    conf 경로 / glob 목록 → 실제 conf prefix 목록 (중복 제거, 입력 순서 유지)
+
+    glob 은 경로 segment 단위로 매칭합니다.
+      s3://bucket/dev/user/project/*/        → project 아래 모든 실험
+      s3://bucket/dev/user/project/lgbm-*/   → lgbm- 으로 시작하는 실험
+    """
+    expanded = []
+    for pattern in patterns:
+        if not pattern.startswith('s3://'):
+            raise ValueError(f"conf path must start with s3://: {pattern}")
+        if not _has_glob(pattern):
+            expanded.append(pattern.rstrip('/') + '/')
+            continue
+
+        bucket, _, key_pattern = pattern[len('s3://'):].partition('/')
+        segments = [s for s in key_pattern.split('/') if s]
+        prefixes = ['']
+        for segment in segments:
+            if not _has_glob(segment):
+                prefixes = [p + segment + '/' for p in prefixes]
+                continue
+            matched = []
+            for prefix in prefixes:
+                for child in _list_child_prefixes(client, bucket, prefix):
+                    name = child[len(prefix):].rstrip('/')
+                    if fnmatch.fnmatchcase(name, segment):
+                        matched.append(child)
+            prefixes = sorted(matched)
+        if not prefixes:
+            logger.warning(f"  ⚠️  No conf prefix matched: {pattern}")
+        expanded.extend(f"s3://{bucket}/{p}" for p in prefixes)
+
+    return list(dict.fromkeys(expanded))
+
+
+# ============================================================
+# 동시 실행 수
+# ============================================================
+def _total_memory_bytes():
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def default_max_parallel(run_memory_gb: float = DEFAULT_RUN_MEMORY_GB) -> int:
+    """min(CPU 수, 전체 메모리 / 실험당 메모리), 최소 1"""
+    cpu_limit = os.cpu_count() or 1
+    total_memory = _total_memory_bytes()
+    if total_memory and run_memory_gb > 0:
+        memory_limit = int(total_memory // (run_memory_gb * 1024 ** 3))
+        return max(1, min(cpu_limit, memory_limit))
+    return max(1, cpu_limit)
+
+
+def run_slug(conf_s3_path: str) -> str:
+    """conf 경로 → work_dir 이름 ({project}__{experiment})"""
+    segments = [s for s in conf_s3_path.rstrip('/').split('/') if s]
+    slug = '__'.join(segments[-2:])
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', slug) or 'run'
+
+
+# ============================================================
+# 실험 1개 실행 (worker 프로세스)
+# ============================================================
+_worker_kernel_pool = None   # worker 프로세스별 warm 커널 풀 (_init_worker 에서 생성)
+
+
+def _init_worker(kernel_pool_kwargs: dict):
+    """worker 프로세스 시작 시 warm 커널 풀 기동 (프로세스 종료 시 커널도 종료)"""
+    global _worker_kernel_pool
+    if not kernel_pool_kwargs:
+        return
+    from kernel_pool import WarmKernelPool
+
+    _worker_kernel_pool = WarmKernelPool(**kernel_pool_kwargs)
+    _worker_kernel_pool.start(background=True)
+    multiprocessing.util.Finalize(_worker_kernel_pool, _worker_kernel_pool.shutdown, exitpriority=10)
+
+
+def _run_one(conf_s3_path: str, work_dir: str, runner_kwargs: dict) -> dict:
+    """worker 프로세스에서 PipelineRunner 1개 실행 (로그는 work_dir/run_pm.log 에도 기록)"""
+    from run_pm import PipelineRunner
+
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    handler = logging.FileHandler(work_dir / 'run_pm.log', encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s',
+                                           datefmt='%Y-%m-%d %H:%M:%S'))
+    logging.getLogger().addHandler(handler)
+
+    start = time.perf_counter()
+    record = {'conf_s3_path': conf_s3_path, 'work_dir': str(work_dir), 'pid': os.getpid()}
+    try:
+        runner = PipelineRunner(conf_s3_path=conf_s3_path, work_dir=work_dir,
+                                kernel_pool=_worker_kernel_pool, **runner_kwargs)
+        result = runner.run()
+        record.update({
+            'status': result['status'],
+            'run_id': result['run_id'],
+            'output_s3_path': result['output_s3_path'],
+            's3_requests': result.get('s3_requests', {}).get('totals'),
+        })
+    except Exception as e:
+        record.update({'status': 'failed', 'error': f"{type(e).__name__}: {e}"})
+    finally:
+        record['duration_seconds'] = round(time.perf_counter() - start, 3)
+        logging.getLogger().removeHandler(handler)
+        handler.close()
+    return record
+
+
+# ============================================================
+# batch 실행
+# ============================================================
+def run_batch(conf_paths: list, batch_dir: Path, runner_kwargs: dict,
+              max_parallel: int = None, run_memory_gb: float = DEFAULT_RUN_MEMORY_GB,
+              kernel_pool_kwargs: dict = None) -> dict:
+    """
+    conf_paths 를 프로세스 풀로 동시에 실행하고 batch_summary.json 저장
+
+    Args:
+        conf_paths: expand_conf_paths 로 확장된 conf prefix 목록
+        batch_dir: batch 루트 디렉토리 (runs/{slug} 아래 실험별 work_dir 생성)
+        runner_kwargs: 모든 실험에 공통으로 넘길 PipelineRunner 인자
+        max_parallel: 동시 실행 수 (None 이면 default_max_parallel)
+        run_memory_gb: 실험 1개당 예상 메모리 (max_parallel 자동 계산용)
+        kernel_pool_kwargs: worker 프로세스마다 띄울 WarmKernelPool 인자 (None 이면 미사용)
+    """
+    batch_dir = Path(batch_dir)
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    max_parallel = max(1, min(max_parallel or default_max_parallel(run_memory_gb), len(conf_paths)))
+    # 대역폭 제한은 프로세스별 limiter 이므로 worker 수로 나눠 batch 전체 합계를 맞춤
+    if runner_kwargs.get('max_bandwidth'):
+        runner_kwargs = dict(runner_kwargs, max_bandwidth=max(1, runner_kwargs['max_bandwidth'] // max_parallel))
+
+    # slug 가 겹치면 순번을 붙여 work_dir 분리
+    work_dirs, seen = [], {}
+    for conf_s3_path in conf_paths:
+        slug = run_slug(conf_s3_path)
+        seen[slug] = seen.get(slug, 0) + 1
+        if seen[slug] > 1:
+            slug = f"{slug}_{seen[slug]}"
+        work_dirs.append(batch_dir / 'runs' / slug)
+
+    logger.info("=" * 70)
+    logger.info(f"🧪 Batch: {len(conf_paths)} experiment(s), {max_parallel} in parallel")
+    logger.info(f"    Batch dir: {batch_dir}")
+    if runner_kwargs.get('cache_dir'):
+        logger.info(f"    Shared cache: {runner_kwargs['cache_dir']}")
+    if runner_kwargs.get('max_bandwidth'):
+        logger.info(f"    Bandwidth: {runner_kwargs['max_bandwidth'] / 1024 / 1024:.1f} MB/s per worker")
+    if kernel_pool_kwargs:
+        logger.info(f"    Warm kernels: {kernel_pool_kwargs.get('size', 1)} per worker "
+                    f"({kernel_pool_kwargs.get('kernel_name')})")
+    logger.info("=" * 70)
+
+    started_at = datetime.now()
+    start = time.perf_counter()
+    records = [None] * len(conf_paths)
+
+    # fork 시 부모의 boto3 client / 스레드 상태가 복제되지 않도록 spawn 사용
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_parallel, mp_context=context,
+                             initializer=_init_worker, initargs=(kernel_pool_kwargs,)) as executor:
+        futures = {
+            executor.submit(_run_one, conf_s3_path, str(work_dir), runner_kwargs): index
+            for index, (conf_s3_path, work_dir) in enumerate(zip(conf_paths, work_dirs))
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                record = future.result()
+            except Exception as e:  # worker 프로세스 비정상 종료 등
+                record = {'conf_s3_path': conf_paths[index], 'work_dir': str(work_dirs[index]),
+                          'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+            records[index] = record
+            done = sum(r is not None for r in records)
+            icon = '✅' if record['status'] == 'success' else '❌'
+            logger.info(f"  {icon} [{done}/{len(conf_paths)}] {record['conf_s3_path']} "
+                        f"({record.get('duration_seconds', 0):.1f}s)")
+            if record['status'] != 'success':
+                logger.error(f"      {record.get('error')}")
+
+    summary = {
+        'started_at': started_at.isoformat(),
+        'duration_seconds': round(time.perf_counter() - start, 3),
+        'max_parallel': max_parallel,
+        'total': len(records),
+        'succeeded': sum(r['status'] == 'success' for r in records),
+        'failed': sum(r['status'] != 'success' for r in records),
+        'runs': records,
+    }
+    summary_path = batch_dir / SUMMARY_FILENAME
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    logger.info("=" * 70)
+    logger.info(f"🧪 Batch finished: {summary['succeeded']} succeeded, {summary['failed']} failed "
+                f"in {summary['duration_seconds']:.1f}s")
+    logger.info(f"    Summary: {summary_path}")
+    logger.info("=" * 70)
+    return summary
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py - run_pm 진입점 기동 시간 측정 (CLI --help / 모듈 import)
+
+새 인터프리터로 대상 명령을 여러 번 실행해 wall-clock 기동 시간을 재고,
+python -X importtime 출력으로 import 시간이 큰 top-level 모듈을 보여줍니다.
+무거운 의존성 (boto3 / papermill / yaml / pandas) 이 다시 import 시점에 로딩되는지
+확인하는 용도이며, --budget-ms 를 주면 예산 초과 시 exit code 1 로 종료합니다.
+
+Usage:
+    python bench_startup.py                                   # python run_pm.py --help
+    python bench_startup.py --module run_pm                   # python -c "import run_pm"
+    python bench_startup.py --cwd ../../tabular312/sm_docker --module run_pm_utils
+    python bench_startup.py --repeat 10 --budget-ms 300 --json startup.json
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+DEFAULT_REPEAT = 5
+DEFAULT_TOP = 15
+# 기동 시 import 되면 안 되는 무거운 모듈 (실제 사용 시점에 lazy import)
+HEAVY_MODULES = ('boto3', 'botocore', 'papermill', 'yaml', 'pandas', 'jupyter_client', 'nbformat')
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$')
+
+
+def build_command(args) -> list:
+    if args.module:
+        return [sys.executable, '-c', f'import {args.module}']
+    return [sys.executable, args.script, *args.script_args]
+
+
+def measure_wall(command: list, cwd: Path, repeat: int) -> list:
+    """대상 명령을 repeat 번 실행한 wall-clock 시간 (ms)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def measure_imports(command: list, cwd: Path) -> dict:
+    """-X importtime 출력 파싱 → top-level 모듈별 누적 import 시간 (ms)"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    completed = subprocess.run([command[0], '-X', 'importtime', *command[1:]], cwd=cwd, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
+    top_level, loaded = {}, set()
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative_us, indent, name = match.groups()
+        loaded.add(name.split('.')[0])
+        if len(indent) <= 1:  # 들여쓰기가 없으면 top-level import
+            top_level[name] = top_level.get(name, 0) + int(cumulative_us) / 1000
+    return {
+        'total_ms': round(sum(top_level.values()), 1),
+        'modules': dict(sorted(((k, round(v, 1)) for k, v in top_level.items()), key=lambda kv: -kv[1])),
+        'heavy_loaded': sorted(m for m in HEAVY_MODULES if m in loaded),
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Measure startup time of run_pm entry points')
+    parser.add_argument('--script', default='run_pm.py', help='Script to run (default: run_pm.py)')
+    parser.add_argument('--module', default=None, help='Measure `import <module>` instead of running a script')
+    parser.add_argument('--cwd', default=str(Path(__file__).resolve().parent),
+                        help='Working directory (default: this directory)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help=f'Runs (default: {DEFAULT_REPEAT})')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help=f'Modules to list (default: {DEFAULT_TOP})')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='Fail (exit 1) if the median wall time exceeds this budget')
+    parser.add_argument('--json', default=None, help='Write results to this JSON file')
+    parser.add_argument('script_args', nargs='*', default=['--help'],
+                        help='Arguments for --script (default: --help)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    cwd = Path(args.cwd).resolve()
+    command = build_command(args)
+
+    subprocess.run(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)  # warm-up
+    timings = measure_wall(command, cwd, max(1, args.repeat))
+    imports = measure_imports(command, cwd)
+    result = {
+        'command': ' '.join(command[1:]),
+        'cwd': str(cwd),
+        'repeat': len(timings),
+        'wall_ms': {
+            'median': round(statistics.median(timings), 1),
+            'min': round(min(timings), 1),
+            'max': round(max(timings), 1),
+        },
+        'import_ms': imports['total_ms'],
+        'heavy_loaded': imports['heavy_loaded'],
+        'top_modules': dict(list(imports['modules'].items())[:args.top]),
+    }
+
+    print(f"⏱️  {result['command']}  (cwd={cwd})")
+    print(f"    wall:   median {result['wall_ms']['median']:.1f} ms "
+          f"(min {result['wall_ms']['min']:.1f}, max {result['wall_ms']['max']:.1f}, n={result['repeat']})")
+    print(f"    import: {result['import_ms']:.1f} ms (-X importtime, top-level cumulative)")
+    print(f"    heavy modules loaded at startup: {', '.join(result['heavy_loaded']) or 'none'}")
+    for name, ms in result['top_modules'].items():
+        print(f"      {ms:8.1f} ms  {name}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+    if args.budget_ms is not None and result['wall_ms']['median'] > args.budget_ms:
+        print(f"❌ Startup budget exceeded: {result['wall_ms']['median']:.1f} ms > {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+cell_profile.py - papermill 노트북 셀 단위 실행 프로파일
+
+papermill 이 실행 노트북의 각 셀 metadata.papermill 에 남기는
+start_time / end_time / duration 을 모으고, 실행 중 커널(자식 프로세스) 메모리를
+주기적으로 샘플링해 셀별 최대 메모리를 붙입니다.
+
+결과 (executed_notebook.ipynb 와 같은 폴더):
+  cell_profile.json
+    ├── cells       : 셀 실행 순서대로 시간 / 메모리
+    ├── slowest     : 실행 시간 상위 셀 순위
+    └── regressions : 이전 실행 프로파일 대비 느려진 셀
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+except ImportError:  # psutil 이 없으면 메모리 샘플링 없이 시간만 기록
+    psutil = None
+
+
+PROFILE_FILENAME = 'cell_profile.json'
+MEMORY_SAMPLE_INTERVAL = 1.0    # 초
+TOP_N = 10
+REGRESSION_RATIO = 0.2          # 이전 대비 20% 이상 느려지면
+REGRESSION_MIN_SECONDS = 1.0    # 그리고 1초 이상 늘어났을 때만 회귀로 판단
+
+
+# ============================================================
+# 커널 메모리 샘플러
+# ============================================================
+class KernelMemorySampler(threading.Thread):
+    """이 프로세스의 자식 프로세스 (jupyter 커널) RSS 합계를 주기적으로 기록"""
+
+    def __init__(self, interval: float = MEMORY_SAMPLE_INTERVAL):
+        super().__init__(daemon=True, name='kernel-memory-sampler')
+        self.interval = interval
+        self.samples = []   # [(epoch_seconds, rss_bytes), ...]
+        self._stop_event = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return psutil is not None
+
+    def _sample(self):
+        rss = 0
+        try:
+            for child in psutil.Process(os.getpid()).children(recursive=True):
+                try:
+                    rss += child.memory_info().rss
+                except psutil.Error:
+                    pass
+        except psutil.Error:
+            return
+        if rss:
+            self.samples.append((time.time(), rss))
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self._sample()
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        if self.enabled:
+            super().start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+
+# ============================================================
+# 프로파일 생성
+# ============================================================
+def _parse_time(value: str):
+    """papermill 시간 문자열 (UTC, tz 없는 isoformat) → epoch seconds"""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _source_text(cell: dict) -> str:
+    source = cell.get('source', '')
+    return ''.join(source) if isinstance(source, list) else source
+
+
+def cell_fingerprint(cell: dict) -> str:
+    """실행 간 같은 셀을 매칭하기 위한 키 (cell id 가 있으면 id, 없으면 source 해시)"""
+    if cell.get('id'):
+        return f"id:{cell['id']}"
+    return 'src:' + hashlib.sha1(_source_text(cell).encode('utf-8')).hexdigest()[:16]
+
+
+def build_cell_profile(executed_notebook: Path, memory_samples: list = None,
+                       top_n: int = TOP_N) -> dict:
+    """실행된 노트북 + 메모리 샘플 → 셀 프로파일 dict"""
+    with open(executed_notebook, 'r', encoding='utf-8') as f:
+        nb = json.load(f)
+    memory_samples = memory_samples or []
+
+    cells = []
+    for index, cell in enumerate(nb.get('cells', [])):
+        if cell.get('cell_type') != 'code':
+            continue
+        pm_meta = cell.get('metadata', {}).get('papermill', {})
+        duration = pm_meta.get('duration')
+        if duration is None:
+            continue  # 실행되지 않은 셀 (앞 셀 실패 등)
+
+        start, end = _parse_time(pm_meta.get('start_time')), _parse_time(pm_meta.get('end_time'))
+        window = [rss for ts, rss in memory_samples
+                  if start is not None and end is not None and start <= ts <= end]
+        first_line = _source_text(cell).strip().splitlines()
+        cells.append({
+            'index': index,
+            'fingerprint': cell_fingerprint(cell),
+            'tags': cell.get('metadata', {}).get('tags', []),
+            'source_preview': first_line[0][:80] if first_line else '',
+            'start_time': pm_meta.get('start_time'),
+            'end_time': pm_meta.get('end_time'),
+            'duration_seconds': round(float(duration), 3),
+            'status': pm_meta.get('status'),
+            'peak_kernel_rss_mb': round(max(window) / 1024 / 1024, 1) if window else None,
+        })
+
+    total = sum(c['duration_seconds'] for c in cells)
+    slowest = sorted(cells, key=lambda c: c['duration_seconds'], reverse=True)[:top_n]
+    return {
+        'version': '1.0',
+        'notebook': str(executed_notebook),
+        'total_cell_seconds': round(total, 3),
+        'memory_sampled': bool(memory_samples),
+        'cells': cells,
+        'slowest': [
+            {
+                'rank': rank,
+                'index': c['index'],
+                'duration_seconds': c['duration_seconds'],
+                'share': round(c['duration_seconds'] / total, 3) if total else 0.0,
+                'peak_kernel_rss_mb': c['peak_kernel_rss_mb'],
+                'source_preview': c['source_preview'],
+            }
+            for rank, c in enumerate(slowest, start=1)
+        ],
+        'regressions': [],
+    }
+
+
+def find_regressions(profile: dict, baseline: dict,
+                     ratio: float = REGRESSION_RATIO,
+                     min_seconds: float = REGRESSION_MIN_SECONDS) -> list:
+    """baseline 프로파일 대비 느려진 셀 목록"""
+    previous = {c['fingerprint']: c for c in baseline.get('cells', [])}
+    regressions = []
+    for cell in profile['cells']:
+        before = previous.get(cell['fingerprint'])
+        if before is None:
+            continue
+        delta = cell['duration_seconds'] - before['duration_seconds']
+        if delta >= min_seconds and cell['duration_seconds'] > before['duration_seconds'] * (1 + ratio):
+            regressions.append({
+                'index': cell['index'],
+                'duration_seconds': cell['duration_seconds'],
+                'baseline_seconds': before['duration_seconds'],
+                'delta_seconds': round(delta, 3),
+                'source_preview': cell['source_preview'],
+            })
+    return sorted(regressions, key=lambda r: r['delta_seconds'], reverse=True)
+
+
+def find_previous_profile(output_dir: Path, exclude_dir: Path = None):
+    """output/ 아래 다른 run 의 가장 최근 cell_profile.json 경로 (없으면 None)"""
+    candidates = [
+        p for p in Path(output_dir).glob(f'*/{PROFILE_FILENAME}')
+        if exclude_dir is None or p.parent.resolve() != Path(exclude_dir).resolve()
+    ]
+    return max(candidates, key=lambda p: p.stat().st_mtime) if candidates else None
+
+
+def write_cell_profile(executed_notebook: Path, memory_samples: list = None,
+                       baseline_path: Path = None) -> dict:
+    """셀 프로파일 생성 → 회귀 비교 → cell_profile.json 저장 및 요약 로깅"""
+    executed_notebook = Path(executed_notebook)
+    profile = build_cell_profile(executed_notebook, memory_samples)
+
+    if baseline_path and Path(baseline_path).exists():
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        profile['baseline'] = str(baseline_path)
+        profile['regressions'] = find_regressions(profile, baseline)
+
+    profile_path = executed_notebook.parent / PROFILE_FILENAME
+    with open(profile_path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, indent=2, ensure_ascii=False)
+
+    logger.info(f"\n  🐢 Slowest cells (total {profile['total_cell_seconds']:.1f}s):")
+    for row in profile['slowest'][:5]:
+        mem = f", {row['peak_kernel_rss_mb']:.0f} MB" if row['peak_kernel_rss_mb'] else ''
+        logger.info(f"    #{row['rank']} cell[{row['index']}] {row['duration_seconds']:.1f}s "
+                    f"({row['share'] * 100:.0f}%{mem}) {row['source_preview']}")
+    for row in profile['regressions']:
+        logger.warning(f"    ⚠️  Regression cell[{row['index']}] {row['baseline_seconds']:.1f}s → "
+                       f"{row['duration_seconds']:.1f}s (+{row['delta_seconds']:.1f}s) {row['source_preview']}")
+    logger.info(f"    Cell profile: {profile_path}")
+    return profile
@@ -0,0 +1,250 @@
+"""
+data_cache.py - 실행 간 공유되는 content-addressed 데이터셋 캐시
+
+S3 객체를 (bucket, key, ETag) 해시로 캐시 디렉토리에 한 번만 저장하고,
+각 실행의 work_dir 에는 hardlink (불가 시 symlink / copy) 로 연결합니다.
+- 같은 version 으로 여러 실험을 돌려도 /home 볼륨에는 한 벌만 저장
+- 캐시 용량 상한 (max_bytes) 초과 시 LRU 순서로 삭제
+- 여러 프로세스가 동시에 사용해도 안전하도록 index 갱신은 파일 lock 으로 보호
+- 객체별 lock (key_lock) 으로 조회 → 다운로드 → 등록 → 링크 구간을 보호
+  (같은 객체는 한 프로세스만 다운로드하고 나머지는 기다렸다가 링크, 사용 중인 객체는 evict 대상에서 제외)
+- symlink 로 연결한 객체는 close() 전까지 pin (공유 lock) 해 두어 다른 프로세스가 evict 하지 않음
+
+캐시 구조:
+  {cache_dir}/
+    ├── index.json          # {cache_key: {bucket, key, etag, size, last_access}}
+    ├── .lock
+    ├── locks/ab/abcdef….lock / .pin   # 객체별 lock (사용 중 표시)
+    ├── objects/ab/abcdef…  # 읽기 전용 캐시 파일
+    └── staging/            # 다운로드 중인 임시 파일
+"""
+
+import os
+import time
+import json
+import fcntl
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_BYTES = 50 * 1024 ** 3   # 50 GB
+LINK_MODES = ('hardlink', 'symlink', 'copy')
+KEY_LOCK_BATCH = 256   # 한 번에 잡고 있는 객체 lock 수 상한 (열린 파일 수 제한)
+
+
+def make_cache_key(bucket: str, key: str, etag: str) -> str:
+    """(bucket, key, ETag) → sha256 hex"""
+    return hashlib.sha256(f"{bucket}\n{key}\n{etag}".encode('utf-8')).hexdigest()
+
+
+class DatasetCache:
+    """content-addressed 로컬 데이터셋 캐시 (LRU + 용량 상한)"""
+
+    def __init__(self, cache_dir, max_bytes: int = DEFAULT_MAX_BYTES, link_mode: str = 'hardlink'):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"link_mode must be one of {LINK_MODES}: {link_mode}")
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_bytes = max_bytes
+        self.link_mode = link_mode
+        self.objects_dir = self.cache_dir / 'objects'
+        self.staging_dir = self.cache_dir / 'staging'
+        self.index_path = self.cache_dir / 'index.json'
+        self.lock_path = self.cache_dir / '.lock'
+        self.locks_dir = self.cache_dir / 'locks'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        self._pins = {}   # {cache_key: 공유 lock 을 잡고 있는 .pin 파일}
+
+    # ── 경로 ────────────────────────────────────────────────────
+
+    def object_path(self, cache_key: str) -> Path:
+        return self.objects_dir / cache_key[:2] / cache_key
+
+    def staging_path(self, cache_key: str) -> Path:
+        """다운로드 임시 경로 (프로세스별로 분리)"""
+        return self.staging_dir / f"{cache_key}.{os.getpid()}"
+
+    def _key_lock_path(self, cache_key: str, suffix: str) -> Path:
+        return self.locks_dir / cache_key[:2] / f"{cache_key}.{suffix}"
+
+    # ── 객체별 lock ─────────────────────────────────────────────
+
+    def _try_flock(self, path: Path, operation: int):
+        """path 에 flock, 성공하면 열린 lock 파일 / LOCK_NB 로 실패하면 None"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(path, 'a')
+        try:
+            fcntl.flock(lock_file, operation)
+        except BlockingIOError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    @contextmanager
+    def key_lock(self, cache_key: str, blocking: bool = True):
+        """
+        객체 1개의 배타 lock (lookup → 다운로드 → put → link 를 이 안에서 수행)
+        blocking=False 면 다른 프로세스가 잡고 있을 때 기다리지 않고 False 를 yield
+        """
+        operation = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        lock_file = self._try_flock(self._key_lock_path(cache_key, 'lock'), operation)
+        try:
+            yield lock_file is not None
+        finally:
+            if lock_file is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+
+    def _pin(self, cache_key: str):
+        """symlink 로 연결한 객체를 close() 전까지 evict 되지 않도록 공유 lock"""
+        if cache_key not in self._pins:
+            self._pins[cache_key] = self._try_flock(self._key_lock_path(cache_key, 'pin'), fcntl.LOCK_SH)
+
+    def _in_use(self, cache_key: str) -> bool:
+        """다른 곳에서 key_lock / pin 을 잡고 있으면 True (이 프로세스의 pin 포함)"""
+        for suffix in ('lock', 'pin'):
+            path = self._key_lock_path(cache_key, suffix)
+            if not path.exists():
+                continue
+            lock_file = self._try_flock(path, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            if lock_file is None:
+                return True
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+        return False
+
+    def close(self):
+        """이 실행에서 잡은 pin 해제 (이후 LRU eviction 대상이 됨)"""
+        for lock_file in self._pins.values():
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+        self._pins.clear()
+
+    # ── index (파일 lock 으로 보호) ─────────────────────────────
+
+    @contextmanager
+    def _locked_index(self):
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                index = self._read_index()
+                yield index
+                self._write_index(index)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_index(self) -> dict:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"  ⚠️  Rebuilding unreadable cache index {self.index_path}: {e}")
+            return {}
+
+    def _write_index(self, index: dict):
+        tmp_path = self.index_path.with_name(f"index.json.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.index_path)
+
+    # ── 조회 / 등록 ─────────────────────────────────────────────
+
+    def lookup(self, bucket: str, key: str, etag: str):
+        """
+        캐시 hit 이면 캐시 파일 경로, miss 면 None (hit 시 LRU 시각 갱신)
+        link 가 끝나기 전에 다른 프로세스가 evict 하지 않도록 key_lock 안에서 호출
+        """
+        cache_key = make_cache_key(bucket, key, etag)
+        path = self.object_path(cache_key)
+        with self._locked_index() as index:
+            entry = index.get(cache_key)
+            if entry is None or not path.is_file():
+                index.pop(cache_key, None)
+                return None
+            entry['last_access'] = time.time()
+        return path
+
+    def put(self, bucket: str, key: str, etag: str, staged_path: Path) -> Path:
+        """다운로드 완료된 임시 파일을 캐시에 등록하고 캐시 경로 반환 (key_lock 안에서 호출)"""
+        cache_key = make_cache_key(bucket, key, etag)
+        path = self.object_path(cache_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 캐시 파일은 읽기 전용: 노트북이 work_dir 의 링크를 덮어써서 캐시가 오염되는 것을 방지
+        os.chmod(staged_path, 0o444)
+        os.replace(staged_path, path)
+        with self._locked_index() as index:
+            index[cache_key] = {
+                'bucket': bucket,
+                'key': key,
+                'etag': etag,
+                'size': path.stat().st_size,
+                'last_access': time.time(),
+            }
+        return path
+
+    def link(self, cache_path: Path, dest_path: Path) -> str:
+        """캐시 파일을 dest_path 로 연결하고 실제 사용된 방식 반환"""
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        if dest_path.is_symlink() or dest_path.exists():
+            dest_path.unlink()
+
+        if self.link_mode == 'hardlink':
+            try:
+                os.link(cache_path, dest_path)
+                return 'hardlink'
+            except OSError:
+                # 캐시와 work_dir 이 다른 파일시스템이면 hardlink 불가 → symlink
+                pass
+        if self.link_mode in ('hardlink', 'symlink'):
+            try:
+                os.symlink(cache_path, dest_path)
+                self._pin(cache_path.name)
+                return 'symlink'
+            except OSError:
+                pass
+        shutil.copyfile(cache_path, dest_path)
+        return 'copy'
+
+    # ── LRU eviction ────────────────────────────────────────────
+
+    def evict(self, protect: set = None) -> int:
+        """
+        용량 상한을 넘으면 오래 사용되지 않은 항목부터 삭제. 삭제한 바이트 수 반환.
+        protect: 이번 실행에서 링크한 cache_key (symlink 가 끊기지 않도록 보호)
+        key_lock / pin 이 잡혀 있는 (다른 프로세스가 다운로드 / 링크 / 사용 중인) 항목은 건너뜀
+        """
+        protect = protect or set()
+        freed = 0
+        with self._locked_index() as index:
+            total = sum(entry['size'] for entry in index.values())
+            if total <= self.max_bytes:
+                return 0
+            for cache_key, entry in sorted(index.items(), key=lambda kv: kv[1]['last_access']):
+                if total <= self.max_bytes:
+                    break
+                if cache_key in protect or self._in_use(cache_key):
+                    continue
+                path = self.object_path(cache_key)
+                if path.exists():
+                    path.unlink()
+                del index[cache_key]
+                total -= entry['size']
+                freed += entry['size']
+        if freed:
+            logger.info(f"    🧹 Cache evicted {freed / 1024 / 1024:.1f} MB (LRU)")
+        return freed
+
+    def stats(self) -> dict:
+        index = self._read_index()
+        return {
+            'entries': len(index),
+            'bytes': sum(entry['size'] for entry in index.values()),
+            'max_bytes': self.max_bytes,
+        }
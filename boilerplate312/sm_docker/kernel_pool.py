@@ -0,0 +1,233 @@
+"""
+kernel_pool.py - 미리 띄워 둔 Jupyter 커널 풀 (opt-in)
+
+papermill 은 노트북마다 커널을 새로 띄우고, 노트북은 pandas / lightgbm / sklearn / mlflow 를
+처음부터 다시 import 합니다. 짧은 실험을 많이 돌리면 이 시간이 큰 비중을 차지하므로
+- 커널을 미리 띄우고 무거운 모듈을 import 해 둔 뒤 (warm)
+- 노트북 실행 시 해당 커널을 papermill 에 넘겨 (km=...) 재사용하고
+- 실행이 끝나면 %reset -f 로 사용자 namespace 만 비워 다음 노트북에 재사용합니다.
+  (import 된 모듈은 sys.modules 에 남아 있으므로 노트북의 import 문은 즉시 끝남)
+재사용은 같은 프로세스에서 노트북을 여러 개 실행할 때 (batch 모드의 worker 프로세스) 일어나며,
+단일 실행에서는 데이터 다운로드와 커널 기동 / preload 를 겹치는 효과만 있습니다.
+
+주의: 모듈 전역 상태 (matplotlib rcParams, 난수 seed 등) 는 reset 으로 초기화되지 않습니다.
+"""
+
+import time
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_KERNEL_NAME = 'conda_boilerplate312'
+DEFAULT_PRELOAD_MODULES = (
+    'numpy',
+    'pandas',
+    'sklearn',
+    'lightgbm',
+    'mlflow',
+    'matplotlib.pyplot',
+)
+DEFAULT_STARTUP_TIMEOUT = 120   # 초
+DEFAULT_ACQUIRE_TIMEOUT = 300   # 초
+ACQUIRE_POLL_SECONDS = 0.5
+
+
+def _preload_code(modules) -> str:
+    return (
+        "import importlib as _importlib\n"
+        f"for _name in {list(modules)!r}:\n"
+        "    try:\n"
+        "        _importlib.import_module(_name)\n"
+        "    except Exception as _e:\n"
+        "        print(f'[kernel_pool] preload skipped {_name}: {_e}')\n"
+        "del _importlib\n"
+    )
+
+
+RESET_CODE = (
+    "get_ipython().run_line_magic('reset', '-f')\n"
+    "try:\n"
+    "    import matplotlib.pyplot as _plt\n"
+    "    _plt.close('all')\n"
+    "    del _plt\n"
+    "except Exception:\n"
+    "    pass\n"
+    "import gc as _gc\n"
+    "_gc.collect()\n"
+    "del _gc\n"
+)
+
+
+class WarmKernelPool:
+    """
+    kernel_name 커널을 size 개 미리 띄워 두는 풀
+
+    Usage:
+        pool = WarmKernelPool('conda_boilerplate312', size=1)
+        pool.start()                     # 백그라운드로 커널 기동 + preload
+        km = pool.acquire('conda_boilerplate312', cwd=work_dir)
+        pm.execute_notebook(..., km=km)  # papermill 이 커널을 종료하지 않음
+        pool.release(km)
+        pool.shutdown()
+    """
+
+    def __init__(self, kernel_name: str = DEFAULT_KERNEL_NAME, size: int = 1,
+                 preload_modules=DEFAULT_PRELOAD_MODULES,
+                 startup_timeout: float = DEFAULT_STARTUP_TIMEOUT):
+        self.kernel_name = kernel_name
+        self.size = max(1, int(size))
+        self.preload_modules = tuple(preload_modules)
+        self.startup_timeout = startup_timeout
+        self._idle = queue.Queue()
+        self._managers = []
+        self._pending = 0       # 기동 중인 커널 수 (0 이고 살아 있는 커널도 없으면 기다릴 필요 없음)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # ── 기동 / 종료 ─────────────────────────────────────────────
+
+    def start(self, background: bool = True):
+        """커널 size 개 기동 (background=True 면 즉시 반환)"""
+        logger.info(f"    🔥 Warming {self.size} kernel(s): {self.kernel_name}")
+        with self._lock:
+            self._pending += self.size
+        threads = [threading.Thread(target=self._spawn, daemon=True, name=f'warm-kernel-{i}')
+                   for i in range(self.size)]
+        for thread in threads:
+            thread.start()
+        if not background:
+            for thread in threads:
+                thread.join()
+
+    def _spawn(self):
+        """커널 1개 기동 → preload import → idle 큐에 등록 (호출 전에 _pending 을 1 늘려 둠)"""
+        try:
+            self._start_one()
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _start_one(self):
+        km = None
+        try:
+            from jupyter_client import KernelManager
+
+            km = KernelManager(kernel_name=self.kernel_name)
+            km.start_kernel()
+            with self._lock:
+                self._managers.append(km)
+            self._execute(km, _preload_code(self.preload_modules))
+            if self._closed:  # 기동 중 shutdown 된 경우
+                self._discard(km)
+                return
+            self._idle.put(km)
+            logger.info(f"    🔥 Warm kernel ready (pid={self._pid(km)})")
+        except Exception as e:
+            logger.warning(f"  ⚠️  Warm kernel start failed: {e}")
+            if km is not None:
+                self._discard(km)
+
+    def shutdown(self):
+        """풀의 모든 커널 종료"""
+        self._closed = True
+        with self._lock:
+            managers, self._managers = self._managers, []
+        for km in managers:
+            try:
+                km.shutdown_kernel(now=True)
+            except Exception as e:
+                logger.warning(f"  ⚠️  Kernel shutdown failed: {e}")
+
+    @property
+    def idle_count(self) -> int:
+        """바로 대여 가능한 커널 수"""
+        return self._idle.qsize()
+
+    # ── 대여 / 반납 ─────────────────────────────────────────────
+
+    def acquire(self, kernel_name: str, cwd=None, timeout: float = DEFAULT_ACQUIRE_TIMEOUT):
+        """
+        warm 커널 대여. 커널 이름이 다르거나 준비된 커널이 없으면 None (papermill 기본 동작으로 실행)
+
+        기동 중이거나 다른 노트북이 쓰고 있는 커널이 있을 때만 timeout 까지 기다리고,
+        커널 기동이 모두 실패해 올 커널이 없으면 바로 None 을 반환합니다.
+        """
+        if self._closed or kernel_name != self.kernel_name:
+            return None
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                km = self._idle.get(timeout=max(0.0, min(ACQUIRE_POLL_SECONDS, deadline - time.monotonic())))
+                break
+            except queue.Empty:
+                with self._lock:
+                    can_arrive = self._pending > 0 or bool(self._managers)
+                if not can_arrive and self._idle.empty():
+                    logger.warning("  ⚠️  No warm kernel available (startup failed), using a cold kernel")
+                    return None
+                if time.monotonic() >= deadline:
+                    logger.warning(f"  ⚠️  No warm kernel ready within {timeout}s, using a cold kernel")
+                    return None
+        if not km.is_alive():
+            self._discard(km)
+            self._replace()
+            return None
+        if cwd is not None:
+            # 커널은 미리 떠 있으므로 papermill 의 cwd 가 적용되지 않음 → 커널 안에서 이동
+            self._execute(km, f"import os as _os\n_os.chdir({str(cwd)!r})\ndel _os\n")
+        logger.info(f"    🔥 Using warm kernel (pid={self._pid(km)})")
+        return km
+
+    def release(self, km):
+        """노트북 실행이 끝난 커널 반납 (namespace reset 후 재사용, 죽었으면 새로 기동)"""
+        if self._closed:
+            return
+        if not km.is_alive():
+            self._discard(km)
+            self._replace()
+            return
+        try:
+            self._execute(km, RESET_CODE)
+            self._idle.put(km)
+        except Exception as e:
+            logger.warning(f"  ⚠️  Kernel reset failed, replacing kernel: {e}")
+            self._discard(km)
+            self._replace()
+
+    # ── 내부 ────────────────────────────────────────────────────
+
+    def _execute(self, km, code: str):
+        kc = km.client()
+        kc.start_channels()
+        try:
+            kc.wait_for_ready(timeout=self.startup_timeout)
+            reply = kc.execute_interactive(code, timeout=self.startup_timeout,
+                                           output_hook=lambda msg: None)
+            if reply['content'].get('status') != 'ok':
+                raise RuntimeError(f"kernel execute failed: {reply['content'].get('evalue')}")
+        finally:
+            kc.stop_channels()
+
+    def _replace(self):
+        """죽거나 reset 에 실패한 커널 대신 새 커널 1개를 백그라운드로 기동"""
+        with self._lock:
+            self._pending += 1
+        threading.Thread(target=self._spawn, daemon=True, name='warm-kernel-replace').start()
+
+    def _discard(self, km):
+        with self._lock:
+            if km in self._managers:
+                self._managers.remove(km)
+        try:
+            km.shutdown_kernel(now=True)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _pid(km):
+        provisioner = getattr(km, 'provisioner', None)
+        process = getattr(provisioner, 'process', None)
+        return getattr(process, 'pid', '?')
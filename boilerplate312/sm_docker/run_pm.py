@@ -4,7 +4,7 @@ run_pm.py - GS Retail ML Pipeline Runner
 
 S3 conf 경로에서 모든 파일을 가져와 모델링을 실행하고 결과를 S3에 저장합니다.
 - yml 파일들 → conf/ 폴더
-- 나머지 파일들 (py, ipynb 등) → 현재 작업 폴더
+- 나머지 파일들 (py, ipynb 등) → 현재 작업 폴더 (실행할 노트북과 그 노트북이 참조하는 파일만)
 
 Usage:
     python run_pm.py --conf-s3-path s3://bucket/path/to/conf/
@@ -14,18 +14,41 @@ Example:
 """
 
 import os
+import re
 import sys
-import yaml
-import boto3
+import ast
+import json
 import shutil
 import logging
 import argparse
-import papermill as pm
 from pathlib import Path
 from datetime import datetime
 from uuid import uuid4
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
-from botocore.exceptions import ClientError
+
+from s3_transfer import (
+    TransferEngine,
+    TransferTask,
+    RangedDownloader,
+    BandwidthLimiter,
+    MB,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_PART_SIZE,
+    DEFAULT_PART_CONCURRENCY,
+    DEFAULT_MULTIPART_THRESHOLD,
+)
+from s3_sync import SyncManifest, plan_sync
+from data_cache import DatasetCache, make_cache_key, KEY_LOCK_BATCH, DEFAULT_MAX_BYTES as DEFAULT_CACHE_MAX_BYTES
+from run_profile import RunProfiler
+from cell_profile import KernelMemorySampler, write_cell_profile, find_previous_profile
+from kernel_pool import WarmKernelPool, DEFAULT_KERNEL_NAME, DEFAULT_PRELOAD_MODULES
+from batch_runner import run_batch, expand_conf_paths, DEFAULT_RUN_MEMORY_GB
+from stage_journal import StageJournal, snapshot_files, verify_files
+from streaming_upload import StreamingUploader
+from s3_metrics import S3RequestMetrics
 
 # ============================================================
 # Logging 설정
@@ -51,6 +74,8 @@ def parse_s3_uri(s3_uri: str) -> tuple:
 
 def load_yaml(filepath: Path) -> dict:
     """YAML 파일 로드"""
+    import yaml
+
     with open(filepath, 'r', encoding='utf-8') as f:
         return yaml.safe_load(f)
 
@@ -65,25 +90,141 @@ def is_yaml_file(filename: str) -> bool:
     return filename.endswith('.yml') or filename.endswith('.yaml')
 
 
+def read_source_text(path: Path) -> str:
+    """노트북이면 셀 source 를 이어 붙이고, 그 외 파일은 텍스트로 읽기"""
+    try:
+        if path.suffix == '.ipynb':
+            with open(path, 'r', encoding='utf-8') as f:
+                nb = json.load(f)
+            return '\n'.join(
+                ''.join(cell.get('source', [])) if isinstance(cell.get('source'), list) else cell.get('source', '')
+                for cell in nb.get('cells', [])
+            )
+        return path.read_text(encoding='utf-8', errors='ignore')
+    except (OSError, ValueError):
+        return ''
+
+
+# IPython magic / shell 명령 줄 (ast 파싱 전에 pass 로 치환)
+IPYTHON_LINE = re.compile(r'^(\s*)[%!].*$', re.MULTILINE)
+
+
+def read_code_sources(path: Path) -> list:
+    """노트북이면 code 셀 source 목록, .py 면 파일 내용 1개 (그 외 파일은 빈 목록)"""
+    try:
+        if path.suffix == '.ipynb':
+            with open(path, 'r', encoding='utf-8') as f:
+                nb = json.load(f)
+            return [
+                ''.join(cell.get('source', [])) if isinstance(cell.get('source'), list) else cell.get('source', '')
+                for cell in nb.get('cells', []) if cell.get('cell_type') == 'code'
+            ]
+        if path.suffix == '.py':
+            return [path.read_text(encoding='utf-8', errors='ignore')]
+    except (OSError, ValueError):
+        pass
+    return []
+
+
+def imported_modules(sources) -> set:
+    """
+    코드 source 목록에서 import 되는 최상위 모듈 이름 집합
+    (import os, helper / from helper.sub import x 등 모든 형태, 파싱 실패 시 None)
+    """
+    modules = set()
+    for source in sources:
+        if source.lstrip().startswith('%%'):   # cell magic (%%bash 등) 은 python 코드가 아님
+            continue
+        try:
+            tree = ast.parse(IPYTHON_LINE.sub(r'\1pass', source))
+        except (SyntaxError, ValueError):
+            return None
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules.update(alias.name.split('.')[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                modules.add(node.module.split('.')[0])
+    return modules
+
+
+def referenced_assets(path: Path, filenames) -> list:
+    """
+    path (노트북 / 스크립트) 에 파일명이 등장하거나 (.py 는) 모듈로 import 되는 파일 목록
+    (코드를 파싱할 수 없으면 참조 여부를 알 수 없으므로 전부 반환)
+    """
+    modules = imported_modules(read_code_sources(path))
+    if modules is None:
+        logger.warning(f"  ⚠️  Could not parse {path.name}, fetching all deferred assets")
+        return list(filenames)
+    text = read_source_text(path)
+    return [
+        filename for filename in filenames
+        if filename in text or (filename.endswith('.py') and Path(filename).stem in modules)
+    ]
+
+
 # ============================================================
 # S3 Helper 클래스
 # ============================================================
 class S3Helper:
     """S3 작업을 위한 헬퍼 클래스"""
     
-    def __init__(self, region: str = None):
+    def __init__(self, region: str = None, max_concurrency: int = DEFAULT_MAX_WORKERS,
+                 max_retries: int = DEFAULT_MAX_RETRIES, cache: DatasetCache = None,
+                 part_size: int = DEFAULT_PART_SIZE, part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+                 multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD, max_bandwidth: int = None,
+                 metrics: S3RequestMetrics = None):
         self.region = region
-        self.client = boto3.client('s3', region_name=region)
+        self.cache = cache
+        self.multipart_threshold = multipart_threshold
+        import boto3
+        from botocore.config import Config
+
+        # 병렬 전송 시 커넥션 풀이 부족하지 않도록 (파일 수 x part 수) 이상으로 설정
+        self.client = boto3.client(
+            's3',
+            region_name=region,
+            config=Config(max_pool_connections=max(10, max_concurrency * part_concurrency)),
+        )
+        # 요청 수 / 바이트 / 재시도 / throttling 집계 (event hook)
+        if metrics is not None:
+            metrics.attach(self.client)
+        # max_bandwidth 는 모든 업로드 / 다운로드 / byte-range part 가 하나의 limiter 로 공유
+        limiter = BandwidthLimiter(max_bandwidth) if max_bandwidth else None
+        # 대용량 객체는 byte-range 병렬 GET
+        self.ranged = RangedDownloader(
+            self.client,
+            part_size=part_size,
+            max_concurrency=part_concurrency,
+            limiter=limiter,
+            max_retries=max_retries,
+        )
+        self.engine = TransferEngine(
+            self.client,
+            max_workers=max_concurrency,
+            max_retries=max_retries,
+            ranged=self.ranged,
+            multipart_threshold=multipart_threshold,
+            limiter=limiter,
+        )
     
-    def download_file(self, s3_uri: str, local_path: Path) -> bool:
-        """S3에서 파일 다운로드"""
+    def download_file(self, s3_uri: str, local_path: Path, size: int = None) -> bool:
+        """S3에서 파일 다운로드 (multipart_threshold 이상이면 byte-range 병렬 다운로드)"""
         bucket, key = parse_s3_uri(s3_uri)
         try:
             ensure_dir(local_path.parent)
-            self.client.download_file(bucket, key, str(local_path))
+            etag = None
+            if size is None:
+                head = self.client.head_object(Bucket=bucket, Key=key)
+                size, etag = head['ContentLength'], head['ETag'].strip('"')
+            if size >= self.multipart_threshold:
+                self.ranged.download(bucket, key, local_path, size, etag)
+            else:
+                self.engine.download_file(bucket, key, local_path)
+            self.engine.record(size)
             logger.info(f"    ✅ {key.split('/')[-1]} -> {local_path}")
             return True
-        except ClientError as e:
+        except self.client.exceptions.ClientError as e:
             logger.error(f"    ❌ Failed to download {s3_uri}: {e}")
             return False
     
@@ -111,26 +252,26 @@ class S3Helper:
                     'key': key,
                     'filename': filename,
                     's3_uri': f"s3://{bucket}/{key}",
-                    'size': obj['Size']
+                    'size': obj['Size'],
+                    'etag': obj.get('ETag', '').strip('"'),
                 })
         
         return objects
     
-    def download_prefix(self, s3_uri: str, local_dir: Path) -> list:
-        """S3 prefix 아래 모든 파일 다운로드 (하위 폴더 구조 유지)"""
+    def download_prefix(self, s3_uri: str, local_dir: Path, objects: list = None) -> list:
+        """S3 prefix 아래 모든 파일 다운로드 (하위 폴더 구조 유지, objects: 미리 조회한 목록)"""
         bucket, prefix = parse_s3_uri(s3_uri)
         if not prefix.endswith('/'):
             prefix += '/'
         
-        downloaded = []
-        objects = self.list_objects(s3_uri)
+        if objects is None:
+            objects = self.list_objects(s3_uri)
+        items = [(obj, local_dir / obj['key'][len(prefix):]) for obj in objects]
+        oks = self._download_objects(bucket, items, label='Download')
         
-        for obj in objects:
-            key = obj['key']
-            relative_path = key[len(prefix):]
-            local_path = local_dir / relative_path
-            
-            if self.download_file(obj['s3_uri'], local_path):
+        downloaded = []
+        for (obj, local_path), ok in zip(items, oks):
+            if ok:
                 downloaded.append({
                     'filename': obj['filename'],
                     'local_path': local_path,
@@ -139,42 +280,190 @@ class S3Helper:
         
         return downloaded
     
+    def _download_objects(self, bucket: str, items: list, label: str) -> list:
+        """
+        [(obj, local_path), ...] 다운로드 후 입력 순서대로 성공 여부 목록 반환
+        - 캐시 미사용: 엔진으로 local_path 에 직접 다운로드
+        - 캐시 사용: hit 은 링크만, miss 는 캐시로 다운로드한 뒤 링크
+        """
+        if self.cache is None:
+            tasks = [
+                TransferTask('download', bucket, obj['key'], local_path, obj['size'], obj['etag'])
+                for obj, local_path in items
+            ]
+            return [result.ok for result in self.engine.run(tasks, label=label)]
+        
+        # 객체별 lock 을 잡은 채 조회 → 다운로드 → 등록 → 링크 (동시에 도는 batch worker 와 중복 다운로드 방지)
+        #   - 바로 잡힌 객체: 이 프로세스가 처리
+        #   - 다른 프로세스가 잡고 있는 객체: 먼저 잡은 쪽이 끝날 때까지 기다린 뒤 hit 이면 링크만
+        oks = [False] * len(items)
+        counts = {'hits': 0, 'misses': 0, 'waited': 0}
+        entries = [(i, obj, local_path, make_cache_key(bucket, obj['key'], obj['etag']))
+                   for i, (obj, local_path) in enumerate(items)]
+        for start in range(0, len(entries), KEY_LOCK_BATCH):
+            waiting = []
+            with ExitStack() as stack:
+                owned = []
+                for entry in entries[start:start + KEY_LOCK_BATCH]:
+                    if stack.enter_context(self.cache.key_lock(entry[3], blocking=False)):
+                        owned.append(entry)
+                    else:
+                        waiting.append(entry)
+                self._fill_from_cache(bucket, owned, oks, counts, label)
+            if waiting:
+                counts['waited'] += len(waiting)
+                with ExitStack() as stack:
+                    # 여러 프로세스가 같은 순서로 잡도록 cache_key 순으로 대기 (교착 방지)
+                    for entry in sorted(waiting, key=lambda e: e[3]):
+                        stack.enter_context(self.cache.key_lock(entry[3]))
+                    self._fill_from_cache(bucket, waiting, oks, counts, label)
+        
+        logger.info(f"    🗄️  Cache: {counts['hits']} hits, {counts['misses']} misses, "
+                    f"{counts['waited']} waited on other workers ({self.cache.cache_dir})")
+        self.cache.evict(protect={entry[3] for entry in entries})
+        return oks
+    
+    def _fill_from_cache(self, bucket: str, entries: list, oks: list, counts: dict, label: str):
+        """
+        key_lock 을 잡은 [(index, obj, local_path, cache_key), ...] 처리
+        hit 은 링크만, miss 는 캐시로 다운로드 후 등록 / 링크 (oks[index] 갱신)
+        """
+        misses = []
+        for i, obj, local_path, cache_key in entries:
+            cached_path = self.cache.lookup(bucket, obj['key'], obj['etag'])
+            if cached_path is not None:
+                self.cache.link(cached_path, local_path)
+                oks[i] = True
+                counts['hits'] += 1
+            else:
+                misses.append((i, obj, local_path, cache_key))
+        counts['misses'] += len(misses)
+        if not misses:
+            return
+        
+        tasks = [
+            TransferTask('download', bucket, obj['key'], self.cache.staging_path(cache_key),
+                         obj['size'], obj['etag'])
+            for _, obj, _, cache_key in misses
+        ]
+        results = self.engine.run(tasks, label=label)
+        for (i, obj, local_path, _), result in zip(misses, results):
+            if result.ok:
+                cached_path = self.cache.put(bucket, obj['key'], obj['etag'], result.task.local_path)
+                self.cache.link(cached_path, local_path)
+                oks[i] = True
+    
+    def sync_prefix(self, s3_uri: str, local_dir: Path, manifest_path: Path,
+                    delete: bool = False, objects: list = None) -> dict:
+        """
+        S3 prefix 를 로컬로 증분 동기화 (ETag / size 기반)
+        - 변경 없는 파일은 스킵, 새 파일/변경된 파일만 다운로드
+        - delete=True 면 S3 에서 사라진 파일을 로컬에서도 삭제 (manifest 에 기록된 파일만)
+        - objects: 미리 조회한 객체 목록 (없으면 여기서 조회)
+        """
+        bucket, prefix = parse_s3_uri(s3_uri)
+        if not prefix.endswith('/'):
+            prefix += '/'
+        
+        manifest = SyncManifest.load(manifest_path, s3_uri=f"s3://{bucket}/{prefix}")
+        if objects is None:
+            objects = self.list_objects(s3_uri)
+        plan = plan_sync(objects, prefix, local_dir, manifest)
+        
+        logger.info(f"    🔄 Sync plan: {len(plan['download'])} to download, "
+                    f"{len(plan['skip'])} unchanged, {len(plan['delete'])} removed from S3")
+        
+        items = [(obj, local_path) for _, obj, local_path in plan['download']]
+        oks = self._download_objects(bucket, items, label='Sync')
+        
+        downloaded = []
+        for (relative_path, obj, local_path), ok in zip(plan['download'], oks):
+            if ok:
+                manifest.record(relative_path, obj, local_path)
+                downloaded.append({
+                    'filename': obj['filename'],
+                    'local_path': local_path,
+                    's3_uri': obj['s3_uri']
+                })
+            else:
+                manifest.forget(relative_path)
+        
+        skipped = [
+            {'filename': obj['filename'], 'local_path': local_path, 's3_uri': obj['s3_uri']}
+            for _, obj, local_path in plan['skip']
+        ]
+        
+        deleted = []
+        for relative_path, local_path in plan['delete']:
+            if delete:
+                if local_path.is_file():
+                    local_path.unlink()
+                    logger.info(f"    🗑️  {relative_path} (removed from S3)")
+                deleted.append(local_path)
+                manifest.forget(relative_path)
+        
+        manifest.save()
+        return {'downloaded': downloaded, 'skipped': skipped, 'deleted': deleted}
+    
     def upload_file(self, local_path: Path, s3_uri: str) -> bool:
         """파일을 S3에 업로드"""
         bucket, key = parse_s3_uri(s3_uri)
         try:
-            self.client.upload_file(str(local_path), bucket, key)
+            self.engine.upload_file(local_path, bucket, key)
+            self.engine.record(local_path.stat().st_size)
             logger.info(f"    ✅ {local_path.name} -> {s3_uri}")
             return True
-        except ClientError as e:
+        except self.client.exceptions.ClientError as e:
             logger.error(f"    ❌ Failed to upload {local_path}: {e}")
             return False
     
-    def upload_directory(self, local_dir: Path, s3_uri: str) -> list:
-        """디렉토리 전체를 S3에 업로드"""
+    def upload_directory(self, local_dir: Path, s3_uri: str, exclude: set = None) -> list:
+        """디렉토리 전체를 S3에 업로드 (exclude: 건너뛸 상대 경로 집합)"""
         bucket, prefix = parse_s3_uri(s3_uri)
         if not prefix.endswith('/'):
             prefix += '/'
         
-        uploaded = []
+        tasks = []
         for root, dirs, files in os.walk(local_dir):
             for file in files:
                 local_path = Path(root) / file
                 relative_path = local_path.relative_to(local_dir)
+                if exclude and str(relative_path) in exclude:
+                    continue
                 s3_key = prefix + str(relative_path).replace('\\', '/')
-                s3_file_uri = f"s3://{bucket}/{s3_key}"
-                
-                if self.upload_file(local_path, s3_file_uri):
-                    uploaded.append(s3_file_uri)
+                tasks.append(TransferTask('upload', bucket, s3_key, local_path, local_path.stat().st_size))
+        
+        results = self.engine.run(tasks, label='Upload')
         
-        return uploaded
+        return [result.task.s3_uri for result in results if result.ok]
+    
+    def delete_files(self, s3_uris: list) -> int:
+        """S3 객체 삭제 (버킷별 1000개 단위 batch), 삭제 요청한 객체 수 반환"""
+        by_bucket = {}
+        for s3_uri in s3_uris:
+            bucket, key = parse_s3_uri(s3_uri)
+            by_bucket.setdefault(bucket, []).append(key)
+        deleted = 0
+        for bucket, keys in by_bucket.items():
+            for i in range(0, len(keys), 1000):
+                batch = keys[i:i + 1000]
+                try:
+                    self.client.delete_objects(
+                        Bucket=bucket, Delete={'Objects': [{'Key': k} for k in batch], 'Quiet': True}
+                    )
+                    deleted += len(batch)
+                except self.client.exceptions.ClientError as e:
+                    logger.error(f"    ❌ Failed to delete {len(batch)} objects in {bucket}: {e}")
+        if deleted:
+            logger.info(f"    🗑️  Deleted {deleted} stale object(s)")
+        return deleted
     
     def ensure_bucket_exists(self, bucket_name: str) -> bool:
         """버킷이 없으면 생성"""
         try:
             self.client.head_bucket(Bucket=bucket_name)
             return True
-        except ClientError as e:
+        except self.client.exceptions.ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == '404':
                 logger.info(f"  🆕 Creating bucket: {bucket_name}")
@@ -187,7 +476,7 @@ class S3Helper:
                             CreateBucketConfiguration={'LocationConstraint': self.region}
                         )
                     return True
-                except ClientError as create_error:
+                except self.client.exceptions.ClientError as create_error:
                     logger.error(f"  ❌ Failed to create bucket: {create_error}")
                     return False
             elif error_code == '403':
@@ -200,18 +489,52 @@ class S3Helper:
 # ============================================================
 # Pipeline Runner 클래스
 # ============================================================
+# 실행 단계 (--stages)
+#   prep  : conf / 데이터 다운로드 (입력 스냅샷 확정)
+#   model : 커널 확인 + 노트북 실행
+#   post  : 결과물 S3 업로드
+PIPELINE_STAGES = ('prep', 'model', 'post')
+STAGE_STATE_FILENAME = 'stage_state.json'
+
+
 class PipelineRunner:
     """ML Pipeline Runner"""
     
-    def __init__(self, conf_s3_path, work_dir=None, notebook_path=None):
+    def __init__(self, conf_s3_path, work_dir=None, notebook_path=None,
+                 max_concurrency=DEFAULT_MAX_WORKERS, max_retries=DEFAULT_MAX_RETRIES,
+                 sync=False, sync_delete=False,
+                 cache_dir=None, cache_max_bytes=DEFAULT_CACHE_MAX_BYTES, cache_link_mode='hardlink',
+                 part_size=DEFAULT_PART_SIZE, part_concurrency=DEFAULT_PART_CONCURRENCY,
+                 multipart_threshold=DEFAULT_MULTIPART_THRESHOLD, max_bandwidth=None,
+                 baseline_cell_profile=None, kernel_pool=None, resume_run_id=None,
+                 stages=PIPELINE_STAGES, fetch_all_assets=False, pipelined=False,
+                 stream_upload=False):
         self.conf_s3_path = conf_s3_path.rstrip('/')
         self.work_dir = work_dir or Path.cwd() 
         self.notebook_path = Path(notebook_path) if notebook_path else None
         
+        # S3 병렬 전송 설정
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        
+        # 대용량 객체 byte-range 병렬 다운로드 설정
+        self.part_size = part_size
+        self.part_concurrency = part_concurrency
+        self.multipart_threshold = multipart_threshold
+        self.max_bandwidth = max_bandwidth
+        
+        # 데이터 증분 동기화 설정
+        self.sync = sync
+        self.sync_delete = sync_delete
+        
+        # 실행 간 공유 데이터셋 캐시 (cache_dir 지정 시에만 사용)
+        self.cache = DatasetCache(cache_dir, cache_max_bytes, cache_link_mode) if cache_dir else None
+        
         # 로컬 디렉토리 구조
         self.conf_dir = self.work_dir / 'conf'
         self.data_dir = self.work_dir
         self.output_dir = self.work_dir / 'output'
+        self.state_dir = self.work_dir / '.run_pm'
         
         # 설정 및 S3 헬퍼 (나중에 초기화)
         self.env_config = None
@@ -223,9 +546,102 @@ class PipelineRunner:
         # 다운로드된 실행 파일들
         self.notebooks = []
         self.scripts = []
+        self.conf_files = []
+        self.data_files = []
+        self.uploaded_files = []
+        
+        # conf 의 yml 외 파일은 참조될 때만 다운로드 (fetch_all_assets=True 면 전부 미리)
+        self.fetch_all_assets = fetch_all_assets
+        self.deferred_assets = {}     # {filename: {'s3_uri', 'size'}}
+        self._data_listing = None     # (data_s3_path, Future) - conf 다운로드 중 시작한 목록 조회
+        
+        # 셀별 프로파일 (baseline 미지정 시 output/ 아래 직전 run 프로파일과 비교)
+        self.baseline_cell_profile = Path(baseline_cell_profile) if baseline_cell_profile else None
+        self.cell_profile = None
+        
+        # 미리 띄워 둔 커널 풀 (지정 시 노트북 커널과 이름이 같으면 재사용)
+        self.kernel_pool = kernel_pool
+        self.kernel_name = None
+        
+        # pipelined 모드: 데이터 다운로드 중 커널 기동 (풀이 없으면 이 run 전용 풀 생성 / 종료)
+        self.pipelined = pipelined
+        self._own_kernel_pool = None
+        
+        # 노트북 실행 중 결과물 스트리밍 업로드 (upload 단계는 변경분만 올리는 final pass)
+        self.stream_upload = stream_upload
+        self.stream_uploader = None
+        
+        # 단계별 프로파일 (S3 전송량 / 요청 수는 이 runner 가 만든 모든 S3 헬퍼 합계)
+        self.s3_metrics = S3RequestMetrics()
+        self._s3_helpers = []
+        self.profiler = RunProfiler(transfer_counter=self.transfer_totals)
+        
+        # 실행할 단계 (prep 없이 실행하면 resume_run_id 의 prep 결과를 재사용)
+        unknown = set(stages) - set(PIPELINE_STAGES)
+        if unknown:
+            raise ValueError(f"Unknown stage(s): {sorted(unknown)} (choices: {PIPELINE_STAGES})")
+        self.stages = tuple(stage for stage in PIPELINE_STAGES if stage in stages)
+        if 'prep' not in self.stages and not resume_run_id:
+            raise ValueError("run_id of a completed prep stage is required when 'prep' is not selected")
+        
+        # 단계 완료 journal (resume_run_id 지정 시 기존 journal 로 이어서 실행,
+        # 로컬에 없으면 conf 로드 후 S3 의 stage_state.json 에서 가져옴)
+        self.resume_run_id = resume_run_id
+        self._local_journal = bool(resume_run_id) and StageJournal.exists(self.state_dir, resume_run_id)
+        if self._local_journal:
+            self.journal = StageJournal.load(self.state_dir, resume_run_id)
+            if self.journal.conf_s3_path and self.journal.conf_s3_path != self.conf_s3_path:
+                logger.warning(f"⚠️  Resuming {resume_run_id} with a different conf path "
+                               f"(journal: {self.journal.conf_s3_path})")
+        else:
+            self.journal = StageJournal(self.state_dir, conf_s3_path=self.conf_s3_path)
 
 
     
+    def _make_s3_helper(self, region=None) -> S3Helper:
+        """병렬 전송 설정이 적용된 S3 헬퍼 생성"""
+        helper = S3Helper(
+            region=region,
+            max_concurrency=self.max_concurrency,
+            max_retries=self.max_retries,
+            cache=self.cache,
+            part_size=self.part_size,
+            part_concurrency=self.part_concurrency,
+            multipart_threshold=self.multipart_threshold,
+            max_bandwidth=self.max_bandwidth,
+            metrics=self.s3_metrics,
+        )
+        self._s3_helpers.append(helper)
+        return helper
+    
+    def transfer_totals(self) -> dict:
+        """지금까지 S3 로 주고받은 누적 파일 수 / 바이트 수 / 요청 수"""
+        totals = {'files': 0, 'bytes': 0, 'requests': self.s3_metrics.totals()['requests']}
+        for helper in self._s3_helpers:
+            helper_totals = helper.engine.totals()
+            totals['files'] += helper_totals['files']
+            totals['bytes'] += helper_totals['bytes']
+        return totals
+    
+    def s3_request_report(self) -> dict:
+        """run 단위 S3 요청 집계 (어느 project / experiment 가 S3 를 많이 쓰는지 비교용)"""
+        report = self.s3_metrics.report()
+        meta = self.meta_config or {}
+        report.update({
+            'run_id': self.run_id,
+            'user_id': meta.get('user_id'),
+            'project': meta.get('project'),
+            'experiment': meta.get('experiment'),
+        })
+        return report
+    
+    def save_s3_request_report(self, path: Path) -> Path:
+        path = Path(path)
+        ensure_dir(path.parent)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.s3_request_report(), f, indent=2, ensure_ascii=False)
+        return path
+    
     def setup_directories(self):
         """로컬 작업 디렉토리 생성"""
         logger.info("📁 Setting up local directories...")
@@ -236,15 +652,17 @@ class PipelineRunner:
     
     def download_conf_files(self):
         """
-        S3 conf 경로에서 모든 파일 다운로드
-        - yml 파일 → conf/ 폴더
-        - 그 외 파일 → work_dir (현재 작업 폴더)
+        S3 conf 경로에서 설정 파일 다운로드
+        - yml 파일 → conf/ 폴더 (동시 다운로드)
+        - env.yml / meta.yml 이 받아지는 즉시 데이터 prefix 목록 조회를 백그라운드로 시작
+        - 그 외 파일 (ipynb, py 등) → work_dir, 단 fetch_all_assets=False 면
+          실행할 노트북 / 스크립트가 참조하는 파일만 prepare_notebook 에서 나중에 다운로드
         """
         logger.info("📥 Downloading files from conf S3 path...")
         logger.info(f"    Source: {self.conf_s3_path}")
         
         # 임시 S3 헬퍼 (region 모름)
-        temp_s3 = S3Helper()
+        temp_s3 = self._make_s3_helper()
         
         # S3에서 파일 목록 조회
         objects = temp_s3.list_objects(self.conf_s3_path)
@@ -264,30 +682,56 @@ class PipelineRunner:
             if is_yaml_file(filename):
                 # yml 파일 → conf/ 폴더
                 local_path = self.conf_dir / filename
-                yml_files.append((s3_uri, local_path, filename))
+                yml_files.append((s3_uri, local_path, filename, obj['size']))
             else:
                 # 그 외 파일 → work_dir
                 local_path = self.work_dir / filename
-                other_files.append((s3_uri, local_path, filename))
-        
-        # yml 파일 다운로드
-        logger.info(f"\n  📂 YAML files → conf/")
-        for s3_uri, local_path, filename in yml_files:
-            if not temp_s3.download_file(s3_uri, local_path):
-                raise RuntimeError(f"Failed to download {filename}")
-        
-        # 그 외 파일 다운로드
-        if other_files:
-            logger.info(f"\n  📂 Other files → work_dir/")
-            for s3_uri, local_path, filename in other_files:
-                temp_s3.download_file(s3_uri, local_path)
+                other_files.append((s3_uri, local_path, filename, obj['size']))
                 
-                # 파일 유형별 분류
+                # 파일 유형별 분류 (다운로드 전이라도 경로는 확정)
                 if filename.endswith('.ipynb'):
                     self.notebooks.append(local_path)
                 elif filename.endswith('.py'):
                     self.scripts.append(local_path)
         
+        # yml 파일 동시 다운로드 (env.yml + meta.yml 이 오면 데이터 목록 조회 시작)
+        logger.info(f"\n  📂 YAML files → conf/")
+        prefetch = ThreadPoolExecutor(max_workers=len(yml_files) + 1, thread_name_prefix='conf-prefetch')
+        futures = {
+            prefetch.submit(temp_s3.download_file, s3_uri, local_path, size): (local_path, filename)
+            for s3_uri, local_path, filename, size in yml_files
+        }
+        loaded = set()
+        for future in as_completed(futures):
+            local_path, filename = futures[future]
+            if not future.result():
+                prefetch.shutdown(wait=False, cancel_futures=True)
+                raise RuntimeError(f"Failed to download {filename}")
+            self.conf_files.append(local_path)
+            loaded.add(filename)
+            if self._data_listing is None and {'env.yml', 'meta.yml'} <= loaded:
+                data_s3_path = self._data_s3_path(load_yaml(self.conf_dir / 'env.yml'),
+                                                  load_yaml(self.conf_dir / 'meta.yml'))
+                self._data_listing = (data_s3_path, prefetch.submit(temp_s3.list_objects, data_s3_path))
+        prefetch.shutdown(wait=False)
+        
+        # 그 외 파일: 전부 받거나 (fetch_all_assets) 나중에 필요한 것만 받도록 보류
+        if other_files:
+            self.deferred_assets = {
+                filename: {'s3_uri': s3_uri, 'size': size}
+                for s3_uri, local_path, filename, size in other_files
+            }
+            if self.fetch_all_assets:
+                logger.info(f"\n  📂 Other files → work_dir/")
+                self.fetch_assets(list(self.deferred_assets), s3=temp_s3)
+            else:
+                logger.info(f"\n  💤 {len(other_files)} other file(s) deferred until referenced: "
+                            f"{sorted(self.deferred_assets)}")
+        
+        self.load_conf_files()
+    
+    def load_conf_files(self):
+        """conf/ 의 필수 설정 파일 로드 후 region 에 맞춰 S3 헬퍼 초기화"""
         # 필수 설정 파일 확인 및 로드
         required_configs = ['env.yml', 'meta.yml', 'model.yml']
         for config_file in required_configs:
@@ -301,7 +745,7 @@ class PipelineRunner:
         self.model_config = load_yaml(self.conf_dir / 'model.yml')
         
         # region 정보로 S3 헬퍼 재초기화
-        self.s3 = S3Helper(region=self.env_config['region'])
+        self.s3 = self._make_s3_helper(region=self.env_config['region'])
         
         logger.info(f"\n  ✅ Config files loaded")
         logger.info(f"      env: {self.env_config['env']}")
@@ -314,23 +758,62 @@ class PipelineRunner:
         if self.scripts:
             logger.info(f"  📜 Scripts found: {[s.name for s in self.scripts]}")
     
+    @staticmethod
+    def _data_s3_path(env_config: dict, meta_config: dict) -> str:
+        """Data S3 경로 구성"""
+        env = env_config['env']
+        user_id = meta_config['user_id']
+        project = meta_config['project']
+        version = meta_config['version']
+        data_bucket = env_config['s3']['data_bucket']
+        return f"s3://{data_bucket}/{env}/{user_id}/{project}/{version}"
+    
+    def _prefetched_data_objects(self, data_s3_path: str):
+        """download_conf_files 에서 미리 시작한 데이터 목록 조회 결과 (없거나 실패하면 None)"""
+        if self._data_listing is None:
+            return None
+        listed_path, future = self._data_listing
+        self._data_listing = None
+        if listed_path != data_s3_path:
+            return None
+        from botocore.exceptions import ClientError
+
+        try:
+            return future.result()
+        except ClientError as e:
+            logger.warning(f"  ⚠️  Prefetched data listing failed, listing again: {e}")
+            return None
+    
     def download_data_files(self):
         """S3에서 데이터 파일 다운로드"""
         logger.info("\n📥 Downloading data files from S3...")
         
-        # Data S3 경로 구성
-        env = self.env_config['env']
-        user_id = self.meta_config['user_id']
-        project = self.meta_config['project']
-        version = self.meta_config['version']
-        data_bucket = self.env_config['s3']['data_bucket']
-        
-        data_s3_path = f"s3://{data_bucket}/{env}/{user_id}/{project}/{version}"
+        data_s3_path = self._data_s3_path(self.env_config, self.meta_config)
+        objects = self._prefetched_data_objects(data_s3_path)
         
         logger.info(f"    Source: {data_s3_path}")
         
+        if self.sync:
+            # 증분 동기화 (변경된 파일만 다운로드)
+            result = self.s3.sync_prefix(
+                data_s3_path,
+                self.data_dir,
+                manifest_path=self.state_dir / 'data_manifest.json',
+                delete=self.sync_delete,
+                objects=objects,
+            )
+            downloaded = result['downloaded']
+            self.data_files = [d['local_path'] for d in downloaded + result['skipped']]
+            if not downloaded and not result['skipped']:
+                logger.warning("  ⚠️  No data files found!")
+            else:
+                logger.info(f"\n  ✅ Synced data files: {len(downloaded)} downloaded, "
+                            f"{len(result['skipped'])} unchanged, {len(result['deleted'])} deleted")
+            return
+        
         # 데이터 파일 다운로드 (하위 구조 유지)
-        downloaded = self.s3.download_prefix(data_s3_path, self.data_dir)
+        downloaded = self.s3.download_prefix(data_s3_path, self.data_dir, objects=objects)
+        self.data_files = [d['local_path'] for d in downloaded]
         
         if not downloaded:
             logger.warning("  ⚠️  No data files downloaded!")
@@ -369,7 +852,7 @@ class PipelineRunner:
     
                 if not self.s3:
                     # s3 헬퍼가 아직 초기화 안 됐을 경우 대비
-                    self.s3 = S3Helper(region=self.env_config.get("region") if self.env_config else None)
+                    self.s3 = self._make_s3_helper(region=self.env_config.get("region") if self.env_config else None)
     
                 if not self.s3.download_file(notebook_str, local_path):
                     raise RuntimeError(f"S3 notebook 다운로드 실패: {notebook_str}")
@@ -420,6 +903,7 @@ class PipelineRunner:
     
         kernel_name = nb.get('metadata', {}).get('kernelspec', {}).get('name', 'python3') or "conda_boilerplate312"
         logger.info(f"    Notebook kernel: {kernel_name}")
+        self.kernel_name = kernel_name
     
         # 커널이 이미 있으면 그대로 사용
         if kernel_name in available_kernels:
@@ -442,16 +926,64 @@ class PipelineRunner:
     
         return notebook_path
     
-    def run_notebook(self):
-        """Papermill로 노트북 실행"""
-        logger.info("\n🚀 Running notebook with Papermill...")
+    def fetch_assets(self, filenames, s3: S3Helper = None) -> list:
+        """보류된 conf 파일들을 work_dir 로 동시 다운로드 (이미 같은 크기로 있으면 재사용)"""
+        s3 = s3 or self.s3
+        items = [(name, self.deferred_assets.pop(name)) for name in filenames if name in self.deferred_assets]
+        
+        fetched, tasks = [], []
+        for name, asset in items:
+            local_path = self.work_dir / name
+            if local_path.is_file() and local_path.stat().st_size == asset['size']:
+                fetched.append(local_path)
+                continue
+            bucket, key = parse_s3_uri(asset['s3_uri'])
+            tasks.append(TransferTask('download', bucket, key, local_path, asset['size']))
+        
+        for result in s3.engine.run(tasks, label='Assets'):
+            if result.ok:
+                fetched.append(result.task.local_path)
+            else:
+                logger.warning(f"  ⚠️  Failed to fetch {result.task.s3_uri}: {result.error}")
+        self.conf_files.extend(fetched)
+        return fetched
+    
+    def fetch_referenced_assets(self, entry_path: Path) -> list:
+        """entry_path (노트북 / 스크립트) 가 참조하는 보류 파일을 재귀적으로 다운로드"""
+        fetched = []
+        pending = [Path(entry_path)]
+        while pending and self.deferred_assets:
+            names = referenced_assets(pending.pop(), list(self.deferred_assets))
+            new_paths = self.fetch_assets(names)
+            fetched.extend(new_paths)
+            pending.extend(p for p in new_paths if p.suffix in ('.py', '.ipynb'))
         
+        if fetched:
+            logger.info(f"    📎 Referenced assets fetched: {[p.name for p in fetched]}")
+        if self.deferred_assets:
+            logger.info(f"    💤 Not referenced, skipped: {sorted(self.deferred_assets)}")
+        return fetched
+    
+    def prepare_notebook(self) -> Path:
+        """실행할 노트북을 찾고 (보류된 경우 다운로드) 참조 파일 준비 후 커널 확인 / 등록"""
         # 메인 노트북 찾기
         notebook_path = self.find_main_notebook()
         logger.info(f"    Notebook: {notebook_path.name}")
         
+        # conf 노트북이면 이 시점에 다운로드, 노트북이 참조하는 스크립트 / 파일도 함께
+        if notebook_path == self.work_dir / notebook_path.name:
+            self.fetch_assets([notebook_path.name])
+        self.fetch_referenced_assets(notebook_path)
+        
         # 커널 확인 및 등록
-        notebook_path = self._ensure_kernel(notebook_path)
+        return self._ensure_kernel(notebook_path)
+    
+    def run_notebook(self, notebook_path: Path = None):
+        """Papermill로 노트북 실행 (notebook_path 미지정 시 prepare_notebook 부터 수행)"""
+        logger.info("\n🚀 Running notebook with Papermill...")
+        
+        if notebook_path is None:
+            notebook_path = self.prepare_notebook()
         # 출력 노트북 경로
         output_notebook = self.output_dir / self.run_id / 'executed_notebook.ipynb'
         ensure_dir(output_notebook.parent)
@@ -459,11 +991,19 @@ class PipelineRunner:
         # 노트북 실행을 위한 작업 디렉토리 설정
         original_cwd = os.getcwd()
         
+        # 셀별 프로파일용 커널 메모리 샘플링
+        memory_sampler = KernelMemorySampler()
+        memory_sampler.start()
+        
+        # warm 커널 대여 (없거나 커널 이름이 다르면 papermill 이 새 커널 기동)
+        km = self.kernel_pool.acquire(self.kernel_name, cwd=self.work_dir) if self.kernel_pool else None
+        
         try:
             os.chdir(self.work_dir)
             logger.info(f"    Working directory: {self.work_dir}")
             
             # Papermill 실행
+            import papermill as pm
             pm.execute_notebook(
                 str(notebook_path),
                 str(output_notebook),
@@ -473,7 +1013,8 @@ class PipelineRunner:
                 },
                 cwd=str(self.work_dir),
                 progress_bar=True,
-                log_output=True
+                log_output=True,
+                **({'km': km} if km else {})
             )
             
             logger.info(f"\n  ✅ Notebook executed successfully")
@@ -484,19 +1025,39 @@ class PipelineRunner:
             raise
         finally:
             os.chdir(original_cwd)
+            memory_sampler.stop()
+            if km:
+                self.kernel_pool.release(km)
+            self._write_cell_profile(output_notebook, memory_sampler.samples)
     
-    def upload_artifacts(self) -> str:
-        """결과물을 S3에 업로드"""
-        logger.info("\n📤 Uploading artifacts to S3...")
-        
-        # Model S3 경로 구성
+    def _write_cell_profile(self, output_notebook: Path, memory_samples: list):
+        """실행 노트북 옆에 cell_profile.json 작성 (실패한 실행도 실행된 셀까지 기록)"""
+        if not output_notebook.exists():
+            return
+        baseline = self.baseline_cell_profile or find_previous_profile(
+            self.output_dir, exclude_dir=output_notebook.parent
+        )
+        try:
+            self.cell_profile = write_cell_profile(output_notebook, memory_samples, baseline_path=baseline)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"  ⚠️  Cell profile not written: {e}")
+    
+    def get_model_s3_path(self) -> str:
+        """Model (Output) S3 경로"""
         env = self.env_config['env']
         user_id = self.meta_config['user_id']
         project = self.meta_config['project']
         experiment = self.meta_config['experiment']
         model_bucket = self.env_config['s3']['model_bucket']
+        return f"s3://{model_bucket}/{env}/{user_id}/{project}/{experiment}/{self.run_id}/"
+    
+    def upload_artifacts(self, exclude: set = None) -> str:
+        """결과물을 S3에 업로드 (exclude: 이전 시도에서 이미 업로드된 상대 경로)"""
+        logger.info("\n📤 Uploading artifacts to S3...")
         
-        model_s3_path = f"s3://{model_bucket}/{env}/{user_id}/{project}/{experiment}/{self.run_id}/"
+        # Model S3 경로 구성
+        model_bucket = self.env_config['s3']['model_bucket']
+        model_s3_path = self.get_model_s3_path()
         
         logger.info(f"    Destination: {model_s3_path}")
         
@@ -507,6 +1068,9 @@ class PipelineRunner:
         run_output_dir = self.output_dir / self.run_id
         
         if not run_output_dir.exists():
+            # 단계 분리 / resume 실행에서는 다른 run 의 결과물을 올리지 않도록 추측하지 않음
+            if self.resume_run_id or self.stages != PIPELINE_STAGES:
+                raise RuntimeError(f"Output directory not found for run_id '{self.run_id}': {run_output_dir}")
             # output 폴더 내에서 가장 최근 폴더 찾기
             output_subdirs = [d for d in self.output_dir.iterdir() if d.is_dir()]
             if output_subdirs:
@@ -517,41 +1081,278 @@ class PipelineRunner:
                 return model_s3_path
         
         # 업로드
-        uploaded = self.s3.upload_directory(run_output_dir, model_s3_path)
+        uploaded = self.s3.upload_directory(run_output_dir, model_s3_path, exclude=exclude)
+        self.uploaded_files = [uri[len(model_s3_path):] for uri in uploaded]
+        
+        done = set(self.uploaded_files) | set(exclude or ())
+        pending = [
+            relative_path for relative_path in (
+                str(path.relative_to(run_output_dir)) for path in run_output_dir.rglob('*') if path.is_file()
+            )
+            if relative_path not in done
+        ]
+        if pending:
+            raise RuntimeError(f"Failed to upload {len(pending)} file(s): {pending[:5]}")
         
         logger.info(f"\n  ✅ Uploaded {len(uploaded)} files to S3")
         return model_s3_path
     
+    def _resume_stage(self, stage: str, base_dir: Path) -> bool:
+        """
+        resume 실행에서 journal 에 완료로 기록되어 있고 결과물 파일이 그대로 있으면 True (단계 건너뜀)
+        """
+        if not self.resume_run_id or not self.journal.is_completed(stage):
+            return False
+        entry = self.journal.get(stage)
+        mismatched = verify_files(entry.get('files', {}), base_dir)
+        if mismatched:
+            logger.info(f"    🔁 [{stage}] re-running: {len(mismatched)} file(s) missing or changed "
+                        f"(e.g. {mismatched[0]})")
+            return False
+        logger.info(f"    ⏭️  [{stage}] skipped (completed at {entry['completed_at']})")
+        self.profiler.skip(stage)
+        return True
+    
+    def _start_streaming_upload(self) -> StreamingUploader:
+        """output/{run_id} 감시 → 쓰기가 끝난 결과물을 노트북 실행 중 model S3 경로로 업로드"""
+        run_output_dir = self.output_dir / self.run_id
+        ensure_dir(run_output_dir)
+        self.s3.ensure_bucket_exists(self.env_config['s3']['model_bucket'])
+        self.stream_uploader = StreamingUploader(self.s3, run_output_dir, self.get_model_s3_path())
+        self.stream_uploader.start()
+        logger.info(f"    📡 Streaming outputs to {self.get_model_s3_path()}")
+        return self.stream_uploader
+    
+    def _prepare_kernel_async(self):
+        """
+        노트북 준비 (참조 파일 / 커널 확인) 와 커널 기동을 백그라운드로 시작하고 Future 반환
+        - kernel_pool 이 없으면 이 run 전용 풀 (커널 1개) 을 만들어 미리 띄움
+        - 커널 기동에 실패하면 풀 없이 진행 (papermill 이 평소처럼 커널 기동)
+        """
+        def prepare() -> Path:
+            # data_download 과 동시에 실행되므로 CPU / 전송량은 data_download 쪽에만 집계
+            with self.profiler.stage('kernel_check', background=True):
+                notebook_path = self.prepare_notebook()
+                if self.kernel_pool is None:
+                    pool = WarmKernelPool(kernel_name=self.kernel_name, size=1)
+                    self._own_kernel_pool = pool
+                    pool.start(background=False)
+                    if pool.idle_count:
+                        self.kernel_pool = pool
+            return notebook_path
+        
+        logger.info("    🔀 Pipelined: preparing notebook kernel while data downloads")
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='kernel-prepare')
+        future = executor.submit(prepare)
+        executor.shutdown(wait=False)
+        return future
+    
+    def _stage_state_s3_uri(self) -> str:
+        return f"{self.get_model_s3_path()}metadata/{STAGE_STATE_FILENAME}"
+    
+    def _push_stage_state(self):
+        """다른 인스턴스에서 이어서 실행할 수 있도록 journal 을 S3 에 복사"""
+        if self.s3 and self.journal.path and self.journal.path.exists():
+            self.s3.upload_file(self.journal.path, self._stage_state_s3_uri())
+    
+    def _pull_stage_state(self):
+        """로컬 journal 이 없으면 S3 의 stage_state.json 으로 복원 (로컬 conf 기록은 유지)"""
+        tmp_path = self.state_dir / f"{self.run_id}.{STAGE_STATE_FILENAME}"
+        if not self.s3.download_file(self._stage_state_s3_uri(), tmp_path):
+            raise FileNotFoundError(f"No stage state for run_id '{self.run_id}' "
+                                    f"(local journal or {self._stage_state_s3_uri()})")
+        local_stages = dict(self.journal.stages)
+        self.journal.read(tmp_path)
+        self.journal.stages.update(local_stages)
+        self.journal.save()
+        tmp_path.unlink()
+        logger.info(f"    📋 Stage state restored from {self._stage_state_s3_uri()}")
+    
+    def _verify_model_outputs(self):
+        """
+        post 단계 전에 model 단계 결과물이 이 인스턴스에 그대로 있는지 확인
+        (journal 은 S3 에서 받아 왔을 수 있으므로 완료 기록만으로는 판단하지 않음)
+        """
+        snapshot = self.journal.get('notebook_execution').get('files', {})
+        mismatched = verify_files(snapshot, self.work_dir) if snapshot else ['<no outputs recorded>']
+        if mismatched:
+            raise RuntimeError(f"Model outputs for run_id '{self.run_id}' are not available locally "
+                               f"({len(mismatched)} file(s) missing or changed, e.g. {mismatched[0]}); "
+                               f"run --stages post on the instance that ran the model stage")
+    
+    def _materialize_prep_data(self):
+        """
+        prep 단계 없이 model 단계를 실행할 때 prep 이 확정한 입력 데이터를 work_dir 에 준비
+        (로컬에 그대로 있으면 재사용, 없으면 다시 받아 prep 기록과 일치하는지 검증)
+        """
+        if not self.journal.is_completed('data_download'):
+            raise RuntimeError(f"prep stage has not completed for run_id '{self.run_id}' "
+                               f"(run with --stages prep first)")
+        snapshot = self.journal.get('data_download').get('files', {})
+        if not verify_files(snapshot, self.data_dir):
+            logger.info(f"    ♻️  Reusing prep data ({len(snapshot)} files)")
+            self.profiler.skip('data_download')
+            return
+        with self.profiler.stage('data_download'):
+            self.download_data_files()
+        mismatched = verify_files(snapshot, self.data_dir)
+        if mismatched:
+            raise RuntimeError(f"Input data changed since prep stage ({len(mismatched)} files, "
+                               f"e.g. {mismatched[0]}); rerun --stages prep")
+    
     def run(self):
-        """전체 파이프라인 실행"""
+        """
+        파이프라인 실행 (self.stages 에 포함된 단계만, resume_run_id 지정 시 완료된 단계는 건너뜀)
+        """
         start_time = datetime.now()
         logger.info("=" * 70)
         logger.info("🚀 GS Retail ML Pipeline Runner")
         logger.info("=" * 70)
         logger.info(f"  Conf S3 Path: {self.conf_s3_path}")
         logger.info(f"  Work Dir:     {self.work_dir}")
+        logger.info(f"  Stages:       {', '.join(self.stages)}")
+        if self.resume_run_id:
+            logger.info(f"  Resume:       {self.resume_run_id}")
         logger.info("=" * 70)
         
+        profiler = self.profiler
+        journal = self.journal
+        current_stage = 'setup'
+        kernel_ready = None
         try:
             # 1. 디렉토리 설정
-            self.setup_directories()
+            with profiler.stage('setup'):
+                self.setup_directories()
             
-            # 2. Conf S3에서 모든 파일 다운로드
+            # 2. Conf S3에서 모든 파일 다운로드 (모든 단계에서 설정 필요)
             #    - yml → conf/
             #    - 나머지 (ipynb, py 등) → work_dir/
-            self.download_conf_files()
+            #    (resume 시 받아 둔 파일이 그대로면 설정만 다시 로드)
+            current_stage = 'conf_download'
+            if self._resume_stage('conf_download', self.work_dir):
+                entry = journal.get('conf_download')
+                self.load_conf_files()
+                self.notebooks = [self.work_dir / p for p in entry.get('notebooks', [])]
+                self.scripts = [self.work_dir / p for p in entry.get('scripts', [])]
+                self.deferred_assets = dict(entry.get('deferred', {}))
+            else:
+                with profiler.stage('conf_download'):
+                    self.download_conf_files()
+                journal.complete(
+                    'conf_download',
+                    files=snapshot_files(self.conf_files, self.work_dir),
+                    notebooks=[str(p.relative_to(self.work_dir)) for p in self.notebooks],
+                    scripts=[str(p.relative_to(self.work_dir)) for p in self.scripts],
+                    deferred=dict(self.deferred_assets),
+                )
             
-            # 3. 데이터 파일 다운로드
-            self.download_data_files()
+            # 3. Run ID 생성 (resume 시 기존 run_id 사용) → journal 파일 저장 시작
+            if self.resume_run_id:
+                self.run_id = self.resume_run_id
+                logger.info(f"\n🏷️  Run ID: {self.run_id} (resumed)")
+            else:
+                self.generate_run_id()
+            journal.bind(self.run_id)
+            if self.resume_run_id and not self._local_journal:
+                self._pull_stage_state()
+            
+            # pipelined 모드: 데이터 다운로드와 동시에 노트북 준비 + 커널 기동
+            run_model = 'model' in self.stages and not self._resume_stage('notebook_execution', self.work_dir)
+            kernel_ready = self._prepare_kernel_async() if run_model and self.pipelined else None
             
-            # 4. Run ID 생성
-            self.generate_run_id()
+            # 4. [prep] 데이터 파일 다운로드
+            current_stage = 'data_download'
+            if 'prep' in self.stages:
+                if not self._resume_stage('data_download', self.data_dir):
+                    with profiler.stage('data_download'):
+                        self.download_data_files()
+                    journal.complete('data_download', files=snapshot_files(self.data_files, self.data_dir))
+                self._push_stage_state()
+            elif 'model' in self.stages:
+                # prep 결과 재사용 중 실패는 model 단계 실패로 기록 (완료된 data_download 는 유지)
+                current_stage = 'notebook_execution'
+                self._materialize_prep_data()
             
-            # 5. 노트북 실행
-            self.run_notebook()
+            # 5. [model] 노트북 실행 (커널 확인 / 실행 단계 분리 측정)
+            #    pipelined 모드에서는 데이터 + 커널이 모두 준비될 때까지 대기 (readiness barrier)
+            current_stage = 'notebook_execution'
+            if run_model:
+                if kernel_ready is not None:
+                    with profiler.stage('kernel_wait'):
+                        notebook_path = kernel_ready.result()
+                else:
+                    with profiler.stage('kernel_check'):
+                        notebook_path = self.prepare_notebook()
+                # 노트북을 다시 실행하면 결과물이 바뀌므로 이전 시도의 업로드 기록은 무효
+                journal.reset('upload')
+                stream = self._start_streaming_upload() if self.stream_upload and 'post' in self.stages else None
+                notebook_ok = False
+                try:
+                    with profiler.stage('notebook_execution'):
+                        self.run_notebook(notebook_path)
+                    notebook_ok = True
+                finally:
+                    if stream:
+                        stream.stop(flush=notebook_ok)
+                # 스트리밍 업로드 기록은 노트북이 성공했을 때만 남김
+                # (실패한 실행의 결과물은 재실행 시 다시 써지므로 건너뛰면 S3 에 이전 시도 파일이 남음)
+                if stream:
+                    journal.update('upload', uploaded=sorted(
+                        set(journal.get('upload').get('uploaded', [])) | stream.unchanged_files()
+                    ))
+                run_output_dir = self.output_dir / self.run_id
+                journal.complete('notebook_execution', files=snapshot_files(
+                    [path for path in run_output_dir.rglob('*') if path.is_file()], self.work_dir
+                ))
+                self._push_stage_state()
+            
+            # 6. [post] 결과물 S3 업로드 (run_profile.json 을 먼저 써서 함께 업로드)
+            #    (resume 시 이전 시도에서 업로드된 파일은 제외)
+            current_stage = 'upload'
+            suffix = '' if self.stages == PIPELINE_STAGES else f"_{'-'.join(self.stages)}"
+            profile_name = f"run_profile{suffix}.json"
+            requests_name = f"s3_requests{suffix}.json"
+            profile_path = self.output_dir / self.run_id / 'metadata' / profile_name
+            requests_path = self.output_dir / self.run_id / 'metadata' / requests_name
+            model_s3_path = self.get_model_s3_path()
+            if 'post' in self.stages:
+                if not journal.is_completed('notebook_execution'):
+                    raise RuntimeError(f"model stage has not completed for run_id '{self.run_id}' "
+                                       f"(run with --stages model first)")
+                if journal.is_completed('upload'):
+                    logger.info(f"    ⏭️  [upload] skipped (completed at {journal.get('upload')['completed_at']})")
+                    profiler.skip('upload')
+                else:
+                    self._verify_model_outputs()
+                    previously_uploaded = set(journal.get('upload').get('uploaded', []))
+                    if self.stream_uploader:
+                        # final pass: 스트리밍 후 변경된 파일만 다시 올리고, 로컬에서 지워진 파일은 S3 에서도 삭제
+                        previously_uploaded = (previously_uploaded - set(self.stream_uploader.uploaded)
+                                               | self.stream_uploader.unchanged_files())
+                        removed = self.stream_uploader.removed_files()
+                        if removed:
+                            self.s3.delete_files([f"{model_s3_path}{p}" for p in removed])
+                            previously_uploaded -= set(removed)
+                    previously_uploaded.discard(f"metadata/{profile_name}")
+                    previously_uploaded.discard(f"metadata/{requests_name}")
+                    profiler.save(profile_path)
+                    self.save_s3_request_report(requests_path)
+                    try:
+                        with profiler.stage('upload'):
+                            model_s3_path = self.upload_artifacts(exclude=previously_uploaded)
+                    finally:
+                        journal.update('upload', uploaded=sorted(previously_uploaded | set(self.uploaded_files)))
+                    journal.complete('upload', uploaded=journal.get('upload')['uploaded'],
+                                     output_s3_path=model_s3_path)
+                    self._push_stage_state()
             
-            # 6. 결과물 S3 업로드
-            model_s3_path = self.upload_artifacts()
+            # upload 단계까지 포함한 최종 프로파일 / S3 요청 집계로 갱신
+            profiler.save(profile_path)
+            self.save_s3_request_report(requests_path)
+            if 'post' in self.stages and self.s3:
+                self.s3.upload_file(profile_path, f"{model_s3_path}metadata/{profile_name}")
+                self.s3.upload_file(requests_path, f"{model_s3_path}metadata/{requests_name}")
+            s3_requests = self.s3_request_report()
             
             # 완료
             end_time = datetime.now()
@@ -562,23 +1363,44 @@ class PipelineRunner:
             logger.info("✅ Pipeline completed successfully!")
             logger.info("=" * 70)
             logger.info(f"  Run ID:      {self.run_id}")
+            logger.info(f"  Stages:      {', '.join(self.stages)}")
             logger.info(f"  Duration:    {duration:.1f} seconds")
             logger.info(f"  Output S3:   {model_s3_path}")
+            logger.info(f"  S3 requests: {s3_requests['totals']['requests']} "
+                        f"({s3_requests['totals']['retries']} retries, "
+                        f"{s3_requests['totals']['throttles']} throttled, "
+                        f"~${s3_requests['totals']['estimated_request_cost_usd']:.4f})")
             logger.info("=" * 70)
             
             return {
                 'status': 'success',
                 'run_id': self.run_id,
+                'stages': list(self.stages),
                 'duration_seconds': duration,
-                'output_s3_path': model_s3_path
+                'output_s3_path': model_s3_path,
+                'resumed': bool(self.resume_run_id),
+                'profile': profiler.to_dict(),
+                's3_requests': s3_requests,
             }
             
         except Exception as e:
+            journal.fail(current_stage, f"{type(e).__name__}: {e}")
+            if self.run_id and self.s3:
+                self._push_stage_state()
             logger.error("")
             logger.error("=" * 70)
             logger.error(f"❌ Pipeline failed: {e}")
+            if self.run_id:
+                logger.error(f"   Resume with: --resume {self.run_id}")
             logger.error("=" * 70)
             raise
+        finally:
+            if kernel_ready is not None:
+                kernel_ready.exception()  # 실패 시에도 백그라운드 커널 준비가 끝난 뒤 정리
+            if self._own_kernel_pool:
+                self._own_kernel_pool.shutdown()
+            if self.cache:
+                self.cache.close()
 
 
 # ============================================================
@@ -600,6 +1422,17 @@ Examples:
   # Dry run (다운로드만)
   python run_pm.py --conf-s3-path s3://bucket/path/ --dry-run
 
+  # 실패한 run 이어서 실행 (완료된 단계는 건너뛰고 실패한 단계부터)
+  python run_pm.py --conf-s3-path s3://bucket/path/ --work-dir /opt/ml/code/ --resume 20250101_lgbm_v1_1a2b3c4d
+
+  # 단계별 실행 (prep 은 저렴한 인스턴스에서 한 번, model 은 compute 인스턴스에서 prep 결과 재사용)
+  python run_pm.py --conf-s3-path s3://bucket/path/ --stages prep
+  python run_pm.py --conf-s3-path s3://bucket/path/ --stages model,post --run-id 20250101_lgbm_v1_1a2b3c4d
+
+  # Batch 실행 (여러 실험을 프로세스 풀로 동시에, runs/{project}__{experiment}/ 에 각각 실행)
+  python run_pm.py --conf-s3-path s3://bucket/dev/user/project/exp-a/ s3://bucket/dev/user/project/exp-b/
+  python run_pm.py --conf-s3-path 's3://bucket/dev/user/project/*/' --max-parallel 4
+
 S3 Conf 경로 구조:
   s3://gs-retail-awesome-conf-{region}/{env}/{user_id}/{project}/{experiment}/
     ├── env.yml              → conf/env.yml
@@ -609,9 +1442,10 @@ S3 Conf 경로 구조:
 S3 Data 경로 (env.yml 참조):
   s3://gs-retail-awesome-data-{region}/{env}/{user_id}/{project}/{version}/
     └── data/
-        ├── train.csv
-        ├── validation.csv
-        └── test.csv
+        ├── train.csv         (또는 train.parquet / train.feather / train/ partitioned parquet)
+        ├── validation.csv    (또는 validation.parquet / validation.feather)
+        └── test.csv          (또는 test.parquet / test.feather)
+    ※ 하위 폴더 구조는 그대로 내려받으므로 hive partitioned parquet (train/dt=.../*.parquet) 도 지원
 
 S3 Model 경로 (Output):
   s3://gs-retail-awesome-model-{region}/{env}/{user_id}/{project}/{experiment}/{run_id}/
@@ -626,8 +1460,10 @@ S3 Model 경로 (Output):
     parser.add_argument(
         '--conf-s3-path',
         type=str,
+        nargs='+',
         required=True,
-        help='S3 path containing config files and notebooks'
+        help='S3 path containing config files and notebooks '
+             '(여러 개 또는 glob 지정 시 batch 모드)'
     )
 
     parser.add_argument(
@@ -644,6 +1480,161 @@ S3 Model 경로 (Output):
         help='Local working directory (default: ./run_pm)'
     )
     
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f'S3 병렬 전송 동시 파일 수 (default: {DEFAULT_MAX_WORKERS}, 1이면 순차 전송)'
+    )
+    
+    parser.add_argument(
+        '--max-retries',
+        type=int,
+        default=DEFAULT_MAX_RETRIES,
+        help=f'파일 단위 S3 전송 재시도 횟수 (default: {DEFAULT_MAX_RETRIES})'
+    )
+    
+    parser.add_argument(
+        '--part-size-mb',
+        type=int,
+        default=DEFAULT_PART_SIZE // MB,
+        help='대용량 객체 byte-range 병렬 다운로드 part 크기 MB (default: %(default)s)'
+    )
+    
+    parser.add_argument(
+        '--part-concurrency',
+        type=int,
+        default=DEFAULT_PART_CONCURRENCY,
+        help='객체 1개당 동시 byte-range GET 수 (default: %(default)s)'
+    )
+    
+    parser.add_argument(
+        '--multipart-threshold-mb',
+        type=int,
+        default=DEFAULT_MULTIPART_THRESHOLD // MB,
+        help='이 크기 이상인 객체는 byte-range 병렬 다운로드 (default: %(default)s)'
+    )
+    
+    parser.add_argument(
+        '--max-bandwidth-mb',
+        type=float,
+        default=None,
+        help='S3 업로드 / 다운로드 전체 합산 최대 대역폭 MB/s (default: 제한 없음)'
+    )
+    
+    parser.add_argument(
+        '--sync',
+        action='store_true',
+        help='데이터 증분 동기화 (ETag/size 가 같은 파일은 다시 받지 않음)'
+    )
+    
+    parser.add_argument(
+        '--sync-delete',
+        action='store_true',
+        help='--sync 시 S3 에서 삭제된 데이터 파일을 로컬에서도 삭제'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=os.environ.get('RUN_PM_CACHE_DIR'),
+        help='실행 간 공유 데이터 캐시 디렉토리 (default: $RUN_PM_CACHE_DIR, 미지정 시 캐시 미사용)'
+    )
+    
+    parser.add_argument(
+        '--cache-max-gb',
+        type=float,
+        default=DEFAULT_CACHE_MAX_BYTES / 1024 ** 3,
+        help='데이터 캐시 용량 상한 GB, 초과 시 LRU 삭제 (default: %(default)s)'
+    )
+    
+    parser.add_argument(
+        '--cache-link',
+        type=str,
+        default='hardlink',
+        choices=['hardlink', 'symlink', 'copy'],
+        help='캐시 파일을 work_dir 에 연결하는 방식 (default: hardlink)'
+    )
+    
+    parser.add_argument(
+        '--baseline-cell-profile',
+        type=str,
+        default=None,
+        help='셀 실행 시간 회귀 비교용 이전 cell_profile.json (default: output/ 아래 직전 run)'
+    )
+    
+    parser.add_argument(
+        '--fetch-all-assets',
+        action='store_true',
+        help='Download every non-YAML conf file up front '
+             '(default: only files referenced by the selected notebook / scripts)'
+    )
+    
+    parser.add_argument(
+        '--pipelined',
+        action='store_true',
+        help='Prepare the notebook and boot its kernel while data is downloading'
+    )
+    
+    parser.add_argument(
+        '--stream-upload',
+        action='store_true',
+        help='Upload finished files in output/{run_id} while the notebook is still running'
+    )
+    
+    parser.add_argument(
+        '--warm-kernels',
+        type=int,
+        default=0,
+        help='Number of pre-started kernels with heavy modules preloaded (default: 0 = disabled). '
+             'In batch mode each worker process keeps its own pool and reuses the kernels '
+             'across the experiments it runs; a single run only overlaps kernel startup with downloads'
+    )
+    
+    parser.add_argument(
+        '--warm-kernel-name',
+        default=DEFAULT_KERNEL_NAME,
+        help=f'Kernel name for the warm pool (default: {DEFAULT_KERNEL_NAME})'
+    )
+    
+    parser.add_argument(
+        '--preload-modules',
+        default=','.join(DEFAULT_PRELOAD_MODULES),
+        help='Comma-separated modules imported in warm kernels'
+    )
+    
+    parser.add_argument(
+        '--max-parallel',
+        type=int,
+        default=None,
+        help='Batch mode: experiments run at once (default: min(CPU count, memory / --run-memory-gb))'
+    )
+    
+    parser.add_argument(
+        '--run-memory-gb',
+        type=float,
+        default=DEFAULT_RUN_MEMORY_GB,
+        help=f'Batch mode: expected memory per experiment in GB (default: {DEFAULT_RUN_MEMORY_GB:g})'
+    )
+    
+    parser.add_argument(
+        '--resume', '--run-id',
+        dest='resume',
+        metavar='RUN_ID',
+        default=None,
+        help='Continue an existing run, skipping completed stages '
+             '(journal: {work_dir}/.run_pm/journal/{run_id}.json, '
+             'or {model_s3_path}/metadata/stage_state.json on another instance)'
+    )
+    
+    parser.add_argument(
+        '--stages',
+        default=','.join(PIPELINE_STAGES),
+        help='Comma-separated stages to run: prep (conf/data download), model (notebook), '
+             'post (upload). Without prep, --run-id of a completed prep is required '
+             '(default: prep,model,post)'
+    )
+    
     parser.add_argument(
         '--clean',
         action='store_true',
@@ -659,6 +1650,43 @@ S3 Model 경로 (Output):
     return parser.parse_args()
 
 
+def kernel_pool_kwargs(args):
+    """--warm-kernels 옵션 → WarmKernelPool 인자 (비활성이면 None)"""
+    if args.warm_kernels <= 0:
+        return None
+    return dict(
+        kernel_name=args.warm_kernel_name,
+        size=args.warm_kernels,
+        preload_modules=[m.strip() for m in args.preload_modules.split(',') if m.strip()],
+    )
+
+
+def run_batch_mode(args, batch_dir: Path, runner_kwargs: dict) -> dict:
+    """여러 conf 경로 (또는 glob) 를 프로세스 풀로 동시에 실행"""
+    if args.resume or 'prep' not in runner_kwargs['stages']:
+        raise SystemExit("--resume / stages without prep are only supported for a single --conf-s3-path")
+    conf_paths = expand_conf_paths(args.conf_s3_path, S3Helper().client)
+    if not conf_paths:
+        raise RuntimeError(f"No conf path matched: {args.conf_s3_path}")
+    
+    # 실험 간 데이터 다운로드 공유 (캐시 미지정 시 batch_dir/.cache 사용)
+    if not runner_kwargs.get('cache_dir'):
+        runner_kwargs = dict(runner_kwargs, cache_dir=str(batch_dir / '.cache'))
+    
+    if args.dry_run:
+        logger.info(f"🔍 Dry run mode - {len(conf_paths)} experiment(s) matched")
+        for conf_s3_path in conf_paths:
+            logger.info(f"    {conf_s3_path}")
+        return {'status': 'dry_run', 'conf_paths': conf_paths}
+    
+    summary = run_batch(conf_paths, batch_dir, runner_kwargs,
+                        max_parallel=args.max_parallel, run_memory_gb=args.run_memory_gb,
+                        kernel_pool_kwargs=kernel_pool_kwargs(args))
+    if summary['failed']:
+        sys.exit(1)
+    return summary
+
+
 def main():
     """메인 함수"""
     args = parse_args()
@@ -666,22 +1694,59 @@ def main():
     # 작업 디렉토리
     work_dir = Path(args.work_dir) if args.work_dir else None
     
+    if args.resume and args.clean:
+        raise SystemExit("--resume cannot be combined with --clean (the journal lives in the work dir)")
+    
     # 클린 옵션
     if args.clean and work_dir and work_dir.exists():
         logger.info(f"🧹 Cleaning work directory: {work_dir}")
         shutil.rmtree(work_dir)
     
+    # 모든 실험에 공통인 PipelineRunner 설정
+    runner_kwargs = dict(
+        notebook_path=args.notebook_path,
+        max_concurrency=args.max_concurrency,
+        max_retries=args.max_retries,
+        sync=args.sync,
+        sync_delete=args.sync_delete,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=int(args.cache_max_gb * 1024 ** 3),
+        cache_link_mode=args.cache_link,
+        part_size=args.part_size_mb * MB,
+        part_concurrency=args.part_concurrency,
+        multipart_threshold=args.multipart_threshold_mb * MB,
+        max_bandwidth=int(args.max_bandwidth_mb * MB) if args.max_bandwidth_mb else None,
+        baseline_cell_profile=args.baseline_cell_profile,
+        stages=[stage.strip() for stage in args.stages.split(',') if stage.strip()],
+        fetch_all_assets=args.fetch_all_assets,
+        pipelined=args.pipelined,
+        stream_upload=args.stream_upload,
+    )
+    
+    # conf 경로가 여러 개이거나 glob 이면 batch 모드
+    if len(args.conf_s3_path) > 1 or any(ch in args.conf_s3_path[0] for ch in '*?['):
+        return run_batch_mode(args, work_dir or Path.cwd(), runner_kwargs)
+    
+    # warm 커널 풀은 다운로드와 병행해 백그라운드로 기동
+    kernel_pool = None
+    if args.warm_kernels > 0 and not args.dry_run:
+        kernel_pool = WarmKernelPool(**kernel_pool_kwargs(args))
+        kernel_pool.start(background=True)
+    
     # 파이프라인 실행
     runner = PipelineRunner(
-        conf_s3_path=args.conf_s3_path,
+        conf_s3_path=args.conf_s3_path[0],
         work_dir=work_dir,
-        notebook_path=args.notebook_path,
+        kernel_pool=kernel_pool,
+        resume_run_id=args.resume,
+        **runner_kwargs,
     )
     
     if args.dry_run:
         logger.info("🔍 Dry run mode - downloading files only")
         runner.setup_directories()
         runner.download_conf_files()
+        runner.fetch_assets(list(runner.deferred_assets))
         runner.download_data_files()
         runner.generate_run_id()
         
@@ -696,7 +1761,11 @@ def main():
         logger.info("=" * 70)
         logger.info("✅ Dry run completed")
     else:
-        result = runner.run()
+        try:
+            result = runner.run()
+        finally:
+            if kernel_pool:
+                kernel_pool.shutdown()
         return result
 
 
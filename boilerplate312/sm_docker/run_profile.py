@@ -0,0 +1,191 @@
+"""
+run_profile.py - PipelineRunner 단계별 시간 / 리소스 측정
+
+단계(stage)마다 다음 값을 기록합니다.
+- wall_seconds      : 경과 시간
+- cpu_seconds       : 이 프로세스 + 종료된 자식 프로세스(커널 등)의 CPU 시간
+- peak_rss_mb       : 단계 중 (이 프로세스 + 자식 프로세스) RSS 최대값
+- bytes_transferred : S3 전송 바이트 수
+- files_transferred : S3 전송 파일 수
+- s3_requests       : S3 API 요청 수 (재시도 포함)
+
+cpu_seconds 가 wall_seconds 에 가까우면 compute-bound,
+wall_seconds 는 긴데 cpu_seconds 가 작고 bytes_transferred 가 크면 I/O-bound 입니다.
+
+CPU / RSS / 전송량은 프로세스 전체 누적값의 차이이므로, 다른 단계와 동시에 도는
+백그라운드 단계 (background=True) 는 wall_seconds 만 기록하고 'background': true 로 표시합니다.
+"""
+
+import os
+import json
+import time
+import logging
+import resource
+import threading
+from pathlib import Path
+from datetime import datetime
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+except ImportError:  # psutil 이 없으면 ru_maxrss (프로세스 전체 최대값) 로 대체
+    psutil = None
+
+
+RSS_SAMPLE_INTERVAL = 0.5  # 초
+
+
+def _cpu_seconds() -> float:
+    self_usage = resource.getrusage(resource.RUSAGE_SELF)
+    child_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return (self_usage.ru_utime + self_usage.ru_stime
+            + child_usage.ru_utime + child_usage.ru_stime)
+
+
+def _maxrss_mb() -> float:
+    """ru_maxrss (Linux: KB) 기반 최대 RSS"""
+    self_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    child_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(self_kb, child_kb) / 1024
+
+
+class _RssSampler(threading.Thread):
+    """단계 실행 중 (이 프로세스 + 자식 프로세스) RSS 합계의 최대값 샘플링"""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        super().__init__(daemon=True, name='rss-sampler')
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop_event = threading.Event()
+        self._process = psutil.Process(os.getpid())
+
+    def sample(self):
+        try:
+            rss = self._process.memory_info().rss
+            for child in self._process.children(recursive=True):
+                try:
+                    rss += child.memory_info().rss
+                except psutil.Error:
+                    pass
+        except psutil.Error:
+            return
+        self.peak_bytes = max(self.peak_bytes, rss)
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self.sample()
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.sample()
+
+
+class RunProfiler:
+    """
+    단계별 프로파일 수집기
+
+    Usage:
+        profiler = RunProfiler(transfer_counter=runner.transfer_totals)
+        with profiler.stage('data_download'):
+            ...
+        profiler.save(output_dir / 'metadata' / 'run_profile.json')
+    """
+
+    def __init__(self, transfer_counter=None):
+        # transfer_counter: () -> {'bytes': int, 'files': int, 'requests': int} 누적 S3 전송량
+        self.transfer_counter = transfer_counter
+        self.stages = []
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+
+    def _transfer_totals(self) -> dict:
+        if self.transfer_counter is None:
+            return {'bytes': 0, 'files': 0}
+        return self.transfer_counter()
+
+    @contextmanager
+    def stage(self, name: str, background: bool = False):
+        """
+        with 블록 하나를 단계로 측정 (예외가 나도 기록 후 다시 raise)
+        background=True 면 다른 단계와 겹쳐 실행되는 단계로 보고 wall_seconds 만 기록
+        """
+        if background:
+            with self._background_stage(name):
+                yield
+            return
+        sampler = _RssSampler() if psutil else None
+        if sampler:
+            sampler.start()
+        transfer_before = self._transfer_totals()
+        cpu_before = _cpu_seconds()
+        wall_before = time.perf_counter()
+        status = 'success'
+        try:
+            yield
+        except BaseException:
+            status = 'failed'
+            raise
+        finally:
+            wall = time.perf_counter() - wall_before
+            cpu = _cpu_seconds() - cpu_before
+            if sampler:
+                sampler.stop()
+                peak_rss_mb = sampler.peak_bytes / 1024 / 1024
+            else:
+                peak_rss_mb = _maxrss_mb()
+            transfer_after = self._transfer_totals()
+            record = {
+                'stage': name,
+                'status': status,
+                'wall_seconds': round(wall, 3),
+                'cpu_seconds': round(cpu, 3),
+                'cpu_utilization': round(cpu / wall, 3) if wall > 0 else 0.0,
+                'peak_rss_mb': round(peak_rss_mb, 1),
+                'bytes_transferred': transfer_after['bytes'] - transfer_before['bytes'],
+                'files_transferred': transfer_after['files'] - transfer_before['files'],
+                's3_requests': transfer_after.get('requests', 0) - transfer_before.get('requests', 0),
+            }
+            self.stages.append(record)
+            logger.info(f"    ⏱️  [{name}] {record['wall_seconds']:.1f}s wall, "
+                        f"{record['cpu_seconds']:.1f}s cpu, {record['peak_rss_mb']:.0f} MB peak, "
+                        f"{record['bytes_transferred'] / 1024 / 1024:.1f} MB / "
+                        f"{record['files_transferred']} files")
+
+    @contextmanager
+    def _background_stage(self, name: str):
+        wall_before = time.perf_counter()
+        status = 'success'
+        try:
+            yield
+        except BaseException:
+            status = 'failed'
+            raise
+        finally:
+            wall = time.perf_counter() - wall_before
+            self.stages.append({'stage': name, 'status': status, 'background': True,
+                                'wall_seconds': round(wall, 3)})
+            logger.info(f"    ⏱️  [{name}] {wall:.1f}s wall (background)")
+
+    def skip(self, name: str):
+        """resume 등으로 건너뛴 단계 기록"""
+        self.stages.append({'stage': name, 'status': 'skipped'})
+
+    def to_dict(self) -> dict:
+        return {
+            'version': '1.0',
+            'started_at': self.started_at.isoformat(),
+            'total_wall_seconds': round(time.perf_counter() - self._start, 3),
+            'rss_source': 'psutil' if psutil else 'ru_maxrss',
+            'stages': list(self.stages),
+        }
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
@@ -0,0 +1,120 @@
+"""
+s3_metrics.py - S3 client 요청 계측 (operation 별 요청 수 / 바이트 / 재시도 / throttling)
+
+botocore event hook 으로 client 에 붙이므로 S3Helper, s3transfer, byte-range 다운로드 등
+같은 client 를 쓰는 모든 호출이 집계됩니다.
+- after-call  : operation 별 호출 수, 에러 수, 재시도 횟수 (ResponseMetadata.RetryAttempts), 수신 바이트
+- before-call : 송신 바이트 (PutObject / UploadPart body)
+- needs-retry : 시도 단위 throttling (SlowDown / 503 등) 횟수
+
+요청 비용은 S3 Standard 요청 단가 기준 추정치입니다 (리전 / 스토리지 클래스별로 다름).
+"""
+
+import threading
+from collections import defaultdict
+
+# 요청 단가 (USD / 1,000 requests, S3 Standard, us-east-1 기준 추정)
+TIER1_PRICE_PER_1K = 0.005    # PUT, COPY, POST, LIST
+TIER2_PRICE_PER_1K = 0.0004   # GET, HEAD 및 그 외
+TIER1_OPERATIONS = {
+    'PutObject', 'CopyObject', 'UploadPart', 'UploadPartCopy', 'CreateMultipartUpload',
+    'CompleteMultipartUpload', 'ListObjects', 'ListObjectsV2', 'ListBuckets',
+    'ListMultipartUploads', 'ListParts', 'CreateBucket', 'PutObjectTagging',
+}
+FREE_OPERATIONS = {'DeleteObject', 'DeleteObjects', 'AbortMultipartUpload'}
+THROTTLE_CODES = {'SlowDown', 'Throttling', 'ThrottlingException', 'RequestLimitExceeded',
+                  'TooManyRequestsException', '503'}
+
+
+def _body_length(body) -> int:
+    """bytes / s3transfer ReadFileChunk 등 길이를 알 수 있는 body 의 크기 (모르면 0)"""
+    try:
+        return len(body) if body is not None else 0
+    except TypeError:
+        return 0
+
+
+class S3RequestMetrics:
+    """
+    S3 요청 집계기 (여러 client / 스레드에서 공유)
+
+    Usage:
+        metrics = S3RequestMetrics()
+        metrics.attach(s3_client)
+        ...
+        metrics.report()   # {'totals': {...}, 'operations': {...}}
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ops = defaultdict(lambda: {
+            'requests': 0, 'errors': 0, 'retries': 0, 'throttles': 0,
+            'bytes_in': 0, 'bytes_out': 0,
+        })
+
+    def attach(self, client):
+        """client 에 event hook 등록 (같은 client 에 두 번 붙여도 한 번만 집계)"""
+        events = client.meta.events
+        events.register('before-call.s3', self._before_call, unique_id=f's3-metrics-before-{id(self)}')
+        events.register('after-call.s3', self._after_call, unique_id=f's3-metrics-after-{id(self)}')
+        events.register('needs-retry.s3', self._needs_retry, unique_id=f's3-metrics-retry-{id(self)}')
+        return client
+
+    # ── event handlers ──────────────────────────────────────────
+
+    def _before_call(self, model, params, **kwargs):
+        if model.name in ('PutObject', 'UploadPart'):
+            size = _body_length(params.get('body'))
+            with self._lock:
+                self._ops[model.name]['bytes_out'] += size
+
+    def _after_call(self, model, http_response, parsed, **kwargs):
+        metadata = parsed.get('ResponseMetadata', {}) if isinstance(parsed, dict) else {}
+        status = getattr(http_response, 'status_code', None) or metadata.get('HTTPStatusCode', 0)
+        with self._lock:
+            op = self._ops[model.name]
+            op['requests'] += 1 + metadata.get('RetryAttempts', 0)
+            op['retries'] += metadata.get('RetryAttempts', 0)
+            if status >= 400 or 'Error' in (parsed or {}):
+                op['errors'] += 1
+            if model.name == 'GetObject' and status < 400:
+                op['bytes_in'] += parsed.get('ContentLength', 0) or 0
+
+    def _needs_retry(self, response=None, operation=None, caught_exception=None, **kwargs):
+        if response is None or operation is None:
+            return None
+        http_response, parsed = response
+        code = str((parsed or {}).get('Error', {}).get('Code', ''))
+        if code in THROTTLE_CODES or getattr(http_response, 'status_code', None) == 503:
+            with self._lock:
+                self._ops[operation.name]['throttles'] += 1
+        return None  # 재시도 여부는 botocore 재시도 정책에 맡김
+
+    # ── 조회 ────────────────────────────────────────────────────
+
+    def totals(self) -> dict:
+        with self._lock:
+            ops = {name: dict(values) for name, values in self._ops.items()}
+        totals = {'requests': 0, 'errors': 0, 'retries': 0, 'throttles': 0, 'bytes_in': 0, 'bytes_out': 0}
+        for values in ops.values():
+            for field in totals:
+                totals[field] += values[field]
+        return totals
+
+    def report(self) -> dict:
+        """operation 별 / 전체 집계 + 요청 비용 추정"""
+        with self._lock:
+            ops = {name: dict(values) for name, values in sorted(self._ops.items())}
+        cost = 0.0
+        for name, values in ops.items():
+            if name in FREE_OPERATIONS:
+                price = 0.0
+            elif name in TIER1_OPERATIONS:
+                price = TIER1_PRICE_PER_1K
+            else:
+                price = TIER2_PRICE_PER_1K
+            values['estimated_request_cost_usd'] = round(values['requests'] / 1000 * price, 6)
+            cost += values['estimated_request_cost_usd']
+        totals = self.totals()
+        totals['estimated_request_cost_usd'] = round(cost, 6)
+        return {'totals': totals, 'operations': ops}
@@ -0,0 +1,129 @@
+"""
+s3_sync.py - S3 prefix 증분 동기화 (ETag / size 기반)
+
+로컬 manifest 에 파일별 key, ETag, size, mtime 을 기록해 두고
+다음 실행 시 변경되지 않은 객체는 다운로드를 건너뜁니다.
+- 새 객체 / 변경된 객체만 다운로드
+- (옵션) S3 에서 사라진 객체의 로컬 파일 삭제
+  → manifest 에 기록된 파일만 삭제하므로 conf, 노트북 등 다른 파일은 건드리지 않음
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+MANIFEST_VERSION = 1
+
+
+# ============================================================
+# Manifest
+# ============================================================
+class SyncManifest:
+    """
+    로컬 동기화 manifest
+
+    {
+      "version": 1,
+      "s3_uri": "s3://bucket/prefix/",
+      "files": {
+        "data/train.csv": {"key": ..., "etag": ..., "size": ..., "mtime": ...}
+      }
+    }
+    """
+
+    def __init__(self, path: Path, s3_uri: str = None):
+        self.path = Path(path)
+        self.s3_uri = s3_uri
+        self.files = {}
+
+    @classmethod
+    def load(cls, path: Path, s3_uri: str = None) -> 'SyncManifest':
+        """manifest 로드 (없거나 다른 prefix 의 manifest 면 빈 manifest)"""
+        manifest = cls(path, s3_uri)
+        if not manifest.path.exists():
+            return manifest
+        try:
+            with open(manifest.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"  ⚠️  Ignoring unreadable sync manifest {manifest.path}: {e}")
+            return manifest
+
+        if data.get('version') != MANIFEST_VERSION:
+            return manifest
+        if s3_uri and data.get('s3_uri') != s3_uri:
+            logger.info(f"    Sync manifest is for {data.get('s3_uri')}, starting fresh")
+            return manifest
+        manifest.files = data.get('files', {})
+        return manifest
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체 (중간에 죽어도 manifest 가 깨지지 않음)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MANIFEST_VERSION,
+                's3_uri': self.s3_uri,
+                'files': self.files,
+            }, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def record(self, relative_path: str, obj: dict, local_path: Path):
+        """다운로드 완료된 파일 기록"""
+        self.files[relative_path] = {
+            'key': obj['key'],
+            'etag': obj.get('etag'),
+            'size': obj['size'],
+            'mtime': local_path.stat().st_mtime,
+        }
+
+    def forget(self, relative_path: str):
+        self.files.pop(relative_path, None)
+
+    def is_unchanged(self, relative_path: str, obj: dict, local_path: Path) -> bool:
+        """S3 객체와 로컬 파일이 manifest 기록과 모두 일치하는지 확인"""
+        entry = self.files.get(relative_path)
+        if not entry or not local_path.is_file():
+            return False
+        if entry.get('etag') != obj.get('etag') or entry.get('size') != obj['size']:
+            return False
+        # 로컬 파일이 수정된 경우 (노트북에서 덮어쓴 경우 등) 다시 받음
+        stat = local_path.stat()
+        return stat.st_size == obj['size'] and stat.st_mtime == entry.get('mtime')
+
+
+# ============================================================
+# 동기화 계획
+# ============================================================
+def plan_sync(objects: list, prefix: str, local_dir: Path, manifest: SyncManifest) -> dict:
+    """
+    S3 객체 목록과 manifest 를 비교해 동기화 계획 수립
+
+    Returns:
+        {
+          'download': [(relative_path, obj, local_path), ...],
+          'skip':     [(relative_path, obj, local_path), ...],
+          'delete':   [(relative_path, local_path), ...],
+        }
+    """
+    plan = {'download': [], 'skip': [], 'delete': []}
+    remote_paths = set()
+
+    for obj in objects:
+        relative_path = obj['key'][len(prefix):]
+        remote_paths.add(relative_path)
+        local_path = local_dir / relative_path
+        if manifest.is_unchanged(relative_path, obj, local_path):
+            plan['skip'].append((relative_path, obj, local_path))
+        else:
+            plan['download'].append((relative_path, obj, local_path))
+
+    for relative_path in sorted(set(manifest.files) - remote_paths):
+        plan['delete'].append((relative_path, local_dir / relative_path))
+
+    return plan
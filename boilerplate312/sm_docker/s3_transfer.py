@@ -0,0 +1,377 @@
+"""
+s3_transfer.py - S3 병렬 전송 엔진
+
+run_pm.py 의 S3Helper 가 prefix 다운로드 / 디렉토리 업로드에 사용하는
+bounded thread-pool 전송 엔진입니다.
+- 동시 전송 수 제한 (max_workers)
+- 파일 단위 재시도 (지수 백오프)
+- 전체 진행률 / 처리량(MB/s) 로깅
+- 대용량 단일 객체는 byte-range 병렬 GET 으로 분할 다운로드 (RangedDownloader)
+- 전체 대역폭 제한 (BandwidthLimiter, 업로드 / 다운로드 / byte-range part 가 공유)
+"""
+
+import os
+import time
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+# boto3 / botocore 는 실제 전송 시점에 import (run_pm --help 등 CLI 기동 시간 단축)
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 1.0       # 초, 재시도마다 2배
+DEFAULT_PROGRESS_INTERVAL = 5.0   # 초
+
+MB = 1024 * 1024
+DEFAULT_PART_SIZE = 16 * MB
+DEFAULT_PART_CONCURRENCY = 8
+DEFAULT_MULTIPART_THRESHOLD = 64 * MB
+READ_CHUNK_SIZE = 1 * MB
+
+# 재시도해도 결과가 바뀌지 않는 에러 코드
+NON_RETRYABLE_CODES = {'403', '404', '412', 'AccessDenied', 'NoSuchKey', 'NoSuchBucket',
+                       'PreconditionFailed'}
+
+
+# ============================================================
+# 전송 단위
+# ============================================================
+@dataclass
+class TransferTask:
+    """파일 1개 전송 작업"""
+    direction: str          # 'download' | 'upload'
+    bucket: str
+    key: str
+    local_path: Path
+    size: int = 0
+    etag: str = None
+
+    @property
+    def s3_uri(self) -> str:
+        return f"s3://{self.bucket}/{self.key}"
+
+
+@dataclass
+class TransferResult:
+    """파일 1개 전송 결과"""
+    task: TransferTask
+    ok: bool
+    attempts: int
+    seconds: float
+    error: str = None
+
+
+class TransferStats:
+    """전송 진행 상황 집계 (스레드 안전)"""
+
+    def __init__(self, total_files: int = 0, total_bytes: int = 0):
+        self._lock = threading.Lock()
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.done_files = 0
+        self.done_bytes = 0
+        self.failed_files = 0
+        self.retries = 0
+        self.started_at = time.monotonic()
+        self.finished_at = None
+
+    def add_done(self, size: int):
+        with self._lock:
+            self.done_files += 1
+            self.done_bytes += size
+
+    def add_failed(self):
+        with self._lock:
+            self.failed_files += 1
+
+    def add_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def finish(self):
+        self.finished_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at or time.monotonic()
+        return max(end - self.started_at, 1e-6)
+
+    def snapshot(self) -> dict:
+        """현재 집계값을 dict 로 반환"""
+        with self._lock:
+            return {
+                'total_files': self.total_files,
+                'total_bytes': self.total_bytes,
+                'done_files': self.done_files,
+                'done_bytes': self.done_bytes,
+                'failed_files': self.failed_files,
+                'retries': self.retries,
+                'elapsed_seconds': round(self.elapsed, 3),
+                'throughput_mb_s': round(self.done_bytes / self.elapsed / 1024 / 1024, 3),
+            }
+
+
+# ============================================================
+# 대역폭 제한 / byte-range 병렬 다운로드
+# ============================================================
+class BandwidthLimiter:
+    """token bucket 방식 전체 대역폭 제한 (여러 스레드가 공유)"""
+
+    def __init__(self, max_bytes_per_sec: float):
+        self.rate = float(max_bytes_per_sec)
+        self._lock = threading.Lock()
+        self._tokens = self.rate
+        self._last = time.monotonic()
+
+    def consume(self, nbytes: int):
+        """nbytes 만큼 토큰 소비, 부족하면 채워질 때까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= nbytes
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RangedDownloader:
+    """
+    대용량 단일 객체를 part_size 단위 byte-range GET 으로 병렬 다운로드
+
+    - 미리 크기를 잡아 둔 임시 파일에 각 part 를 offset 위치로 직접 기록 (pwrite)
+    - etag 를 알면 IfMatch 로 요청해 다운로드 중 객체가 바뀌는 경우를 감지
+    - 완료 후 임시 파일을 최종 경로로 교체
+    """
+
+    def __init__(self, client, part_size: int = DEFAULT_PART_SIZE,
+                 max_concurrency: int = DEFAULT_PART_CONCURRENCY,
+                 limiter: BandwidthLimiter = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 retry_backoff: float = DEFAULT_RETRY_BACKOFF):
+        self.client = client
+        self.part_size = max(int(part_size), 1 * MB)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.limiter = limiter
+        self.max_retries = max(0, int(max_retries))
+        self.retry_backoff = retry_backoff
+
+    def download(self, bucket: str, key: str, local_path: Path, size: int, etag: str = None):
+        local_path = Path(local_path)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_path.with_name(f"{local_path.name}.{os.getpid()}.part")
+        ranges = [(start, min(start + self.part_size, size) - 1)
+                  for start in range(0, size, self.part_size)]
+
+        fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            workers = min(self.max_concurrency, max(len(ranges), 1))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='s3-range') as pool:
+                futures = [pool.submit(self._fetch_range, fd, bucket, key, start, end, etag)
+                           for start, end in ranges]
+                try:
+                    for future in futures:
+                        future.result()
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        except Exception:
+            os.close(fd)
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+        os.replace(tmp_path, local_path)
+        logger.debug(f"    ✅ {key.split('/')[-1]} ({len(ranges)} parts)")
+
+    def _fetch_range(self, fd: int, bucket: str, key: str, start: int, end: int, etag: str):
+        """part 1개 다운로드 (연결 오류 등은 part 단위로 재시도)"""
+        kwargs = {'Bucket': bucket, 'Key': key, 'Range': f"bytes={start}-{end}"}
+        if etag:
+            kwargs['IfMatch'] = f'"{etag}"'
+
+        attempt = 0
+        while True:
+            attempt += 1
+            offset = start
+            try:
+                body = self.client.get_object(**kwargs)['Body']
+                for chunk in body.iter_chunks(READ_CHUNK_SIZE):
+                    if self.limiter:
+                        self.limiter.consume(len(chunk))
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                if offset != end + 1:
+                    raise IOError(f"Incomplete range {start}-{end}: got {offset - start} bytes")
+                return
+            except self.client.exceptions.ClientError:
+                # 412 (IfMatch 불일치), 403 등은 파일 단위로 처리
+                raise
+            except Exception as e:
+                if attempt > self.max_retries:
+                    raise
+                wait = self.retry_backoff * (2 ** (attempt - 1))
+                logger.warning(f"    🔁 Retry range {start}-{end} of {key.split('/')[-1]} in {wait:.1f}s: {e}")
+                time.sleep(wait)
+
+
+# ============================================================
+# 전송 엔진
+# ============================================================
+class TransferEngine:
+    """
+    boto3 S3 client 를 공유하는 스레드 풀 기반 전송 엔진
+
+    boto3 client 는 스레드 간 공유가 가능하므로 client 는 하나만 사용하고,
+    client 의 max_pool_connections 는 max_workers 이상으로 설정해야 합니다.
+    ranged 가 주어지면 multipart_threshold 이상인 다운로드는 byte-range 병렬 GET 으로 처리합니다.
+    limiter 가 주어지면 업로드 / 다운로드 모두 전송 callback 에서 같은 limiter 를 소비하므로,
+    RangedDownloader 와 같은 limiter 를 넘기면 동시 전송 수와 관계없이 전체 합계가 제한됩니다.
+    """
+
+    def __init__(self, client, max_workers: int = DEFAULT_MAX_WORKERS,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+                 progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+                 ranged: RangedDownloader = None,
+                 multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD,
+                 limiter: BandwidthLimiter = None):
+        self.client = client
+        self.ranged = ranged
+        self.multipart_threshold = multipart_threshold
+        self.limiter = limiter
+        self.max_workers = max(1, int(max_workers))
+        self.max_retries = max(0, int(max_retries))
+        self.retry_backoff = retry_backoff
+        self.progress_interval = progress_interval
+        self.last_stats = None
+        self._last_log = 0.0
+        self._log_lock = threading.Lock()
+        # 엔진 생성 이후 누적 전송량 (단계별 프로파일링용)
+        self._totals_lock = threading.Lock()
+        self._total_files = 0
+        self._total_bytes = 0
+
+    def record(self, size: int):
+        """전송 완료 1건 누적 (엔진 밖에서 직접 전송한 경우에도 호출)"""
+        with self._totals_lock:
+            self._total_files += 1
+            self._total_bytes += size
+
+    def totals(self) -> dict:
+        with self._totals_lock:
+            return {'files': self._total_files, 'bytes': self._total_bytes}
+
+    def download_file(self, bucket: str, key: str, local_path: Path):
+        """객체 1개 다운로드 (limiter 적용, 엔진 밖의 단건 다운로드도 이 메서드 사용)"""
+        self.client.download_file(bucket, key, str(local_path), Callback=self._throttle_callback())
+
+    def upload_file(self, local_path: Path, bucket: str, key: str):
+        """파일 1개 업로드 (limiter 적용)"""
+        self.client.upload_file(str(local_path), bucket, key, Callback=self._throttle_callback())
+
+    def _throttle_callback(self):
+        """boto3 전송 진행 callback (전송된 bytes 만큼 limiter 토큰 소비)"""
+        if self.limiter is None:
+            return None
+
+        def callback(nbytes: int):
+            # 재시도 시 음수로 되돌리는 호출은 무시
+            if nbytes > 0:
+                self.limiter.consume(nbytes)
+        return callback
+
+    def run(self, tasks: list, label: str = 'Transfer') -> list:
+        """
+        작업 목록을 병렬 실행하고 입력 순서대로 TransferResult 목록 반환
+        """
+        tasks = list(tasks)
+        stats = TransferStats(
+            total_files=len(tasks),
+            total_bytes=sum(t.size for t in tasks),
+        )
+        self.last_stats = stats
+        if not tasks:
+            stats.finish()
+            return []
+
+        workers = min(self.max_workers, len(tasks))
+        logger.info(f"    ⚡ {label}: {len(tasks)} files, "
+                    f"{stats.total_bytes / 1024 / 1024:.1f} MB, {workers} workers")
+
+        self._last_log = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='s3-transfer') as pool:
+            futures = [pool.submit(self._run_one, task, stats) for task in tasks]
+            results = [f.result() for f in futures]
+        stats.finish()
+
+        snap = stats.snapshot()
+        logger.info(f"    ⚡ {label} done: {snap['done_files']}/{snap['total_files']} files, "
+                    f"{snap['done_bytes'] / 1024 / 1024:.1f} MB in {snap['elapsed_seconds']:.1f}s "
+                    f"({snap['throughput_mb_s']:.1f} MB/s, retries={snap['retries']}, "
+                    f"failed={snap['failed_files']})")
+        return results
+
+    def _run_one(self, task: TransferTask, stats: TransferStats) -> TransferResult:
+        """파일 1개 전송 (재시도 포함)"""
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self._transfer(task)
+                stats.add_done(task.size)
+                self.record(task.size)
+                logger.debug(f"    ✅ {task.key.split('/')[-1]} ({task.direction})")
+                self._log_progress(stats)
+                return TransferResult(task, True, attempt, time.monotonic() - start)
+            except Exception as e:
+                if attempt > self.max_retries or not self._is_retryable(e):
+                    stats.add_failed()
+                    logger.error(f"    ❌ Failed to {task.direction} {task.s3_uri}: {e}")
+                    return TransferResult(task, False, attempt, time.monotonic() - start, str(e))
+                stats.add_retry()
+                wait = self.retry_backoff * (2 ** (attempt - 1))
+                logger.warning(f"    🔁 Retry {attempt}/{self.max_retries} "
+                               f"{task.key.split('/')[-1]} in {wait:.1f}s: {e}")
+                time.sleep(wait)
+
+    def _transfer(self, task: TransferTask):
+        if task.direction == 'download':
+            if self.ranged and task.size >= self.multipart_threshold:
+                self.ranged.download(task.bucket, task.key, task.local_path, task.size, task.etag)
+                return
+            task.local_path.parent.mkdir(parents=True, exist_ok=True)
+            self.download_file(task.bucket, task.key, task.local_path)
+        elif task.direction == 'upload':
+            self.upload_file(task.local_path, task.bucket, task.key)
+        else:
+            raise ValueError(f"Unknown transfer direction: {task.direction}")
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        from botocore.exceptions import ClientError
+
+        if isinstance(error, ClientError):
+            code = str(error.response.get('Error', {}).get('Code', ''))
+            return code not in NON_RETRYABLE_CODES
+        return not isinstance(error, (ValueError, FileNotFoundError, PermissionError))
+
+    def _log_progress(self, stats: TransferStats):
+        """progress_interval 마다 한 번씩 전체 진행률 로깅"""
+        now = time.monotonic()
+        with self._log_lock:
+            if now - self._last_log < self.progress_interval:
+                return
+            self._last_log = now
+        snap = stats.snapshot()
+        pct = snap['done_files'] / max(snap['total_files'], 1) * 100
+        logger.info(f"    ⏳ {snap['done_files']}/{snap['total_files']} files ({pct:.0f}%), "
+                    f"{snap['done_bytes'] / 1024 / 1024:.1f} MB, {snap['throughput_mb_s']:.1f} MB/s")
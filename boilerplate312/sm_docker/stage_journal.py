@@ -0,0 +1,148 @@
+"""
+stage_journal.py - PipelineRunner 단계 완료 기록 (checkpoint / resume)
+
+run_id 별로 완료된 단계와 그 결과물 (파일 목록 / 크기) 을 work_dir 에 기록해 두고,
+--resume <run_id> 로 다시 실행하면 결과물이 그대로 남아 있는 단계는 건너뜁니다.
+
+저장 위치:
+  {work_dir}/.run_pm/journal/{run_id}.json
+    {
+      "run_id": "...",
+      "conf_s3_path": "...",
+      "stages": {
+        "conf_download": {"status": "completed", "completed_at": "...", "files": {...}, ...},
+        "data_download": {...},
+        "notebook_execution": {...},
+        "upload": {"status": "failed", "uploaded": [...]}
+      }
+    }
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+JOURNAL_DIRNAME = 'journal'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+
+def snapshot_files(paths, base_dir: Path) -> dict:
+    """파일 목록 → {base_dir 기준 상대 경로: 크기} (검증용)"""
+    base_dir = Path(base_dir)
+    snapshot = {}
+    for path in paths:
+        path = Path(path)
+        if path.is_file():
+            snapshot[str(path.relative_to(base_dir))] = path.stat().st_size
+    return snapshot
+
+
+def verify_files(snapshot: dict, base_dir: Path) -> list:
+    """snapshot 과 비교해 없어졌거나 크기가 달라진 파일 목록 (비어 있으면 검증 통과)"""
+    base_dir = Path(base_dir)
+    mismatched = []
+    for relative_path, size in snapshot.items():
+        path = base_dir / relative_path
+        if not path.is_file() or path.stat().st_size != size:
+            mismatched.append(relative_path)
+    return mismatched
+
+
+class StageJournal:
+    """
+    run_id 단위 단계 완료 journal
+
+    run_id 가 정해지기 전 (conf 다운로드 중) 에는 메모리에만 기록하고,
+    bind(run_id) 이후부터 매 갱신마다 파일에 atomic 하게 저장합니다.
+    """
+
+    def __init__(self, state_dir: Path, conf_s3_path: str = None):
+        self.journal_dir = Path(state_dir) / JOURNAL_DIRNAME
+        self.conf_s3_path = conf_s3_path
+        self.run_id = None
+        self.stages = {}
+
+    @property
+    def path(self):
+        return self.journal_dir / f"{self.run_id}.json" if self.run_id else None
+
+    @staticmethod
+    def exists(state_dir: Path, run_id: str) -> bool:
+        return (Path(state_dir) / JOURNAL_DIRNAME / f"{run_id}.json").exists()
+
+    @classmethod
+    def load(cls, state_dir: Path, run_id: str) -> 'StageJournal':
+        """기존 run 의 journal 로딩 (없으면 FileNotFoundError)"""
+        journal = cls(state_dir)
+        journal.run_id = run_id
+        if not journal.path.exists():
+            raise FileNotFoundError(f"No stage journal for run_id '{run_id}': {journal.path}")
+        journal.read(journal.path)
+        return journal
+
+    def read(self, path: Path):
+        """journal 파일 (로컬 또는 S3 에서 받은 사본) 내용으로 단계 기록 교체"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.conf_s3_path = data.get('conf_s3_path') or self.conf_s3_path
+        self.stages = data.get('stages', {})
+
+    def bind(self, run_id: str):
+        """run_id 확정 → 지금까지의 기록을 파일로 저장"""
+        self.run_id = run_id
+        self.save()
+
+    def save(self):
+        if self.path is None:
+            return
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'run_id': self.run_id,
+                'conf_s3_path': self.conf_s3_path,
+                'updated_at': datetime.now().isoformat(),
+                'stages': self.stages,
+            }, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    # ── 단계 기록 / 조회 ────────────────────────────────────────
+
+    def get(self, stage: str) -> dict:
+        return self.stages.get(stage, {})
+
+    def is_completed(self, stage: str) -> bool:
+        return self.get(stage).get('status') == COMPLETED
+
+    def complete(self, stage: str, **details):
+        self.stages[stage] = {'status': COMPLETED, 'completed_at': datetime.now().isoformat(), **details}
+        self.save()
+
+    def fail(self, stage: str, error: str, **details):
+        """실패 기록 (이미 완료된 단계는 completed 를 유지하고 마지막 오류만 남김)"""
+        if self.is_completed(stage):
+            self.stages[stage] = {
+                **self.get(stage), 'last_error': error, 'last_failed_at': datetime.now().isoformat(),
+            }
+        else:
+            self.stages[stage] = {
+                **self.get(stage), 'status': FAILED,
+                'failed_at': datetime.now().isoformat(), 'error': error, **details,
+            }
+        self.save()
+
+    def reset(self, stage: str):
+        """단계 기록 삭제 (앞 단계를 다시 실행해 결과물이 바뀌는 경우)"""
+        if self.stages.pop(stage, None) is not None:
+            self.save()
+
+    def update(self, stage: str, **details):
+        """단계 상태는 그대로 두고 세부 정보만 갱신 (예: 업로드된 파일 목록)"""
+        self.stages[stage] = {**self.get(stage), **details}
+        self.save()
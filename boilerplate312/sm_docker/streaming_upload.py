@@ -0,0 +1,193 @@
+"""
+streaming_upload.py - 노트북 실행 중 output/{run_id} 결과물을 S3 로 바로 업로드
+
+노트북이 앞쪽 셀에서 쓴 모델 파일 / 차트 / 지표를 실행이 끝날 때까지 기다리지 않고
+쓰기가 끝난 파일부터 model S3 prefix 로 올립니다.
+- 쓰기 완료 판단: inotify CLOSE_WRITE / MOVED_TO 이벤트, 또는 (inotify 미사용 시)
+  크기 / mtime 이 settle_seconds 동안 변하지 않은 파일
+- 업로드 후 다시 수정된 파일은 다음 스캔에서 재업로드
+- 노트북 종료 후 stop() → 남은 파일을 한 번 더 스캔 / 업로드하고,
+  final pass 에서 변경된 파일만 다시 올리면 되도록 업로드 기록 (크기, mtime) 을 제공
+"""
+
+import time
+import logging
+import threading
+from pathlib import Path
+
+from s3_transfer import TransferTask
+
+logger = logging.getLogger(__name__)
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # inotify 가 없으면 polling 만 사용
+    INotify = None
+
+
+DEFAULT_POLL_INTERVAL = 1.0   # 초
+DEFAULT_SETTLE_SECONDS = 3.0  # 이 시간 동안 변하지 않으면 쓰기 완료로 간주
+# papermill 이 셀마다 다시 저장하는 파일 등 실행 중에는 올리지 않을 파일
+DEFAULT_IGNORE = ('executed_notebook.ipynb', 'cell_profile.json')
+
+
+def _file_state(path: Path):
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+class StreamingUploader(threading.Thread):
+    """
+    local_dir 를 감시하면서 쓰기가 끝난 파일을 s3_prefix 아래로 업로드하는 스레드
+
+    Usage:
+        uploader = StreamingUploader(s3_helper, output_dir / run_id, model_s3_path)
+        uploader.start()
+        ... 노트북 실행 ...
+        uploader.stop()                       # 남은 파일까지 업로드
+        exclude = uploader.unchanged_files()  # final pass 에서 건너뛸 파일
+    """
+
+    def __init__(self, s3_helper, local_dir: Path, s3_prefix: str,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+                 ignore=DEFAULT_IGNORE):
+        super().__init__(daemon=True, name='streaming-uploader')
+        self.s3 = s3_helper
+        self.local_dir = Path(local_dir)
+        self.s3_prefix = s3_prefix if s3_prefix.endswith('/') else s3_prefix + '/'
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        self.ignore = set(ignore)
+
+        self.uploaded = {}      # {상대 경로: (size, mtime_ns)} - 업로드 당시 상태
+        self._seen = {}         # {상대 경로: ((size, mtime_ns), 처음 관측 시각)}
+        self._closed = set()    # inotify 로 쓰기 완료가 확인된 상대 경로
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._inotify = None
+        self._watches = {}      # {wd: 디렉토리}
+
+    # ── inotify ─────────────────────────────────────────────────
+
+    def _init_inotify(self):
+        if INotify is None:
+            return
+        try:
+            self._inotify = INotify()
+        except OSError as e:
+            logger.warning(f"  ⚠️  inotify unavailable, polling only: {e}")
+            self._inotify = None
+
+    def _watch(self, directory: Path):
+        if self._inotify is None or directory in self._watches.values():
+            return
+        mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE
+        try:
+            self._watches[self._inotify.add_watch(str(directory), mask)] = directory
+        except OSError:
+            pass
+
+    def _drain_events(self, timeout: float):
+        """inotify 이벤트 수집 (없으면 timeout 동안 대기)"""
+        if self._inotify is None:
+            self._stop_event.wait(timeout)
+            return
+        for event in self._inotify.read(timeout=int(timeout * 1000)):
+            directory = self._watches.get(event.wd)
+            if directory is None or not event.name:
+                continue
+            path = directory / event.name
+            if event.mask & (flags.CLOSE_WRITE | flags.MOVED_TO) and path.is_file():
+                self._closed.add(str(path.relative_to(self.local_dir)))
+
+    # ── 스캔 / 업로드 ───────────────────────────────────────────
+
+    def _ready_files(self, final: bool) -> list:
+        """업로드할 파일 (쓰기 완료 + 마지막 업로드 이후 변경된 파일) 목록"""
+        now = time.monotonic()
+        ready = []
+        for path in self.local_dir.rglob('*'):
+            if path.is_dir():
+                self._watch(path)
+                continue
+            if not path.is_file():
+                continue
+            relative_path = str(path.relative_to(self.local_dir))
+            if relative_path in self.ignore:
+                continue
+            try:
+                state = _file_state(path)
+            except OSError:
+                continue
+            if self.uploaded.get(relative_path) == state:
+                continue
+
+            previous = self._seen.get(relative_path)
+            if previous is None or previous[0] != state:
+                self._seen[relative_path] = (state, now)
+                previous = self._seen[relative_path]
+            settled = now - previous[1] >= self.settle_seconds
+            if final or relative_path in self._closed or settled:
+                ready.append((relative_path, path, state))
+        return ready
+
+    def _upload(self, ready: list):
+        if not ready:
+            return
+        bucket, _, prefix = self.s3_prefix[len('s3://'):].partition('/')
+        tasks = [
+            TransferTask('upload', bucket, prefix + relative_path.replace('\\', '/'), path, state[0])
+            for relative_path, path, state in ready
+        ]
+        results = self.s3.engine.run(tasks, label='Stream upload')
+        with self._lock:
+            for (relative_path, path, state), result in zip(ready, results):
+                self._closed.discard(relative_path)
+                if result.ok:
+                    self.uploaded[relative_path] = state
+
+    def scan_once(self, final: bool = False):
+        self._upload(self._ready_files(final))
+
+    def run(self):
+        self._init_inotify()
+        self._watch(self.local_dir)
+        while not self._stop_event.is_set():
+            try:
+                self._drain_events(self.poll_interval)
+                self.scan_once()
+            except Exception as e:  # 스트리밍 실패는 final pass 가 보완하므로 경고만
+                logger.warning(f"  ⚠️  Streaming upload scan failed: {e}")
+                self._stop_event.wait(self.poll_interval)
+
+    def stop(self, flush: bool = True):
+        """감시 종료 (flush=True 면 노트북 종료 후 남은 파일을 settle 대기 없이 업로드)"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+        if self._inotify is not None:
+            self._inotify.close()
+        if flush:
+            self.scan_once(final=True)
+        logger.info(f"    📡 Streamed {len(self.uploaded)} file(s) to {self.s3_prefix}")
+
+    # ── final pass 용 조회 ──────────────────────────────────────
+
+    def unchanged_files(self) -> set:
+        """업로드 후 변경되지 않은 파일 (final pass 에서 건너뜀)"""
+        unchanged = set()
+        with self._lock:
+            for relative_path, state in self.uploaded.items():
+                path = self.local_dir / relative_path
+                try:
+                    if _file_state(path) == state:
+                        unchanged.add(relative_path)
+                except OSError:
+                    pass
+        return unchanged
+
+    def removed_files(self) -> list:
+        """업로드했지만 로컬에서 삭제된 파일 (S3 에서도 지워야 할 임시 파일 등)"""
+        with self._lock:
+            return sorted(p for p in self.uploaded if not (self.local_dir / p).exists())
@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
@@ -138,6 +139,179 @@ def filter_missing_values(df, target_col):
     return df_cleaned
 
 
+# ============================================================
+# 컬럼형 (Parquet / Arrow IPC) 데이터 입출력
+# ============================================================
+
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+FEATHER_SUFFIXES = ('.feather', '.arrow', '.ipc')
+
+
+def infer_file_format(path):
+    """
+    경로로부터 데이터 포맷을 추정하는 함수.
+
+    :param path: 파일 또는 디렉토리 경로 (디렉토리는 partitioned parquet 로 간주)
+    :return: 'parquet', 'feather', 'csv' 중 하나
+    """
+    path = str(path).rstrip('/')
+    lower = path.lower()
+    if lower.endswith(PARQUET_SUFFIXES) or os.path.isdir(path):
+        return 'parquet'
+    if lower.endswith(FEATHER_SUFFIXES):
+        return 'feather'
+    if lower.endswith('.csv') or lower.endswith('.csv.gz'):
+        return 'csv'
+    raise ValueError(f"Unsupported data format: {path}. Use csv, parquet or feather/arrow.")
+
+
+def get_feature_columns(features):
+    """
+    model.yml 의 features 섹션에서 로딩할 컬럼 목록을 만드는 함수.
+
+    index_col, target_col 과 '*_col' 리스트(numeric_col, categorical_col, base_col 등)를
+    순서대로 모으고, drop_col 에 있는 컬럼은 제외한다.
+
+    :param features: model.yml 의 features 딕셔너리
+    :return: 중복이 제거된 컬럼 리스트
+    """
+    drop_cols = set(features.get('drop_col') or [])
+    columns = []
+    for key, value in features.items():
+        if key == 'drop_col' or not key.endswith('_col') or not value:
+            continue
+        for col in (value if isinstance(value, list) else [value]):
+            if col not in drop_cols and col not in columns:
+                columns.append(col)
+    return columns
+
+
+def build_range_filters(column, start=None, end=None):
+    """
+    column 이 [start, end] 범위에 있는 행만 읽도록 predicate pushdown 필터를 만드는 함수.
+
+    :param column: 필터 기준 컬럼 (보통 features.index_col)
+    :param start: 시작값 (포함, None 이면 제한 없음)
+    :param end: 종료값 (포함, None 이면 제한 없음)
+    :return: [(column, op, value), ...] 형식의 필터 리스트 (조건이 없으면 None)
+    """
+    filters = []
+    if start is not None:
+        filters.append((column, '>=', start))
+    if end is not None:
+        filters.append((column, '<=', end))
+    return filters or None
+
+
+def read_dataset(path, columns=None, filters=None, file_format=None):
+    """
+    CSV / Parquet(단일 파일 또는 hive partitioned 디렉토리) / Feather 데이터를 로딩하는 함수.
+
+    Parquet 는 columns 로 필요한 컬럼만 읽고(column projection),
+    filters 는 row group 통계와 파티션 디렉토리 단위로 미리 걸러낸다(predicate pushdown).
+    CSV 는 usecols 로 컬럼만 제한하고 filters 는 로딩 후 적용한다.
+
+    :param path: 데이터 경로 (로컬 경로 또는 s3:// URI)
+    :param columns: 읽을 컬럼 리스트 (None 이면 전체)
+    :param filters: [(column, op, value), ...] 형식의 필터 (op: ==, !=, <, <=, >, >=, in, not in)
+    :param file_format: 'csv', 'parquet', 'feather' (None 이면 경로로 추정)
+    :return: 데이터프레임
+    """
+    file_format = file_format or infer_file_format(path)
+
+    if file_format == 'csv':
+        df = pd.read_csv(path, usecols=columns)
+        return _apply_filters(df, filters)
+
+    try:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("pyarrow is required for parquet/feather data") from exc
+
+    if file_format == 'parquet':
+        dataset = ds.dataset(str(path), format='parquet', partitioning='hive')
+        expression = pq.filters_to_expression(filters) if filters else None
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+    if file_format == 'feather':
+        dataset = ds.dataset(str(path), format='ipc')
+        expression = pq.filters_to_expression(filters) if filters else None
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+    raise ValueError(f"Unsupported file_format: {file_format}")
+
+
+def _apply_filters(df, filters):
+    """read_dataset 필터를 pandas 데이터프레임에 적용"""
+    if not filters:
+        return df
+    ops = {
+        '==': lambda s, v: s == v,
+        '=': lambda s, v: s == v,
+        '!=': lambda s, v: s != v,
+        '<': lambda s, v: s < v,
+        '<=': lambda s, v: s <= v,
+        '>': lambda s, v: s > v,
+        '>=': lambda s, v: s >= v,
+        'in': lambda s, v: s.isin(v),
+        'not in': lambda s, v: ~s.isin(v),
+    }
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        mask &= ops[op](df[column], value)
+    return df[mask]
+
+
+def save_dataset(df, path, file_format=None, partition_cols=None):
+    """
+    데이터프레임을 CSV / Parquet / Feather 로 저장하는 함수.
+
+    :param df: 저장할 데이터프레임
+    :param path: 저장 경로 (partition_cols 지정 시 디렉토리)
+    :param file_format: 'csv', 'parquet', 'feather' (None 이면 경로로 추정)
+    :param partition_cols: parquet hive 파티션 컬럼 리스트
+    :return: 저장 경로
+    """
+    file_format = file_format or ('parquet' if partition_cols else infer_file_format(path))
+    parent = os.path.dirname(str(path).rstrip('/'))
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+    if file_format == 'csv':
+        df.to_csv(path, index=False)
+    elif file_format == 'parquet':
+        df.to_parquet(path, index=False, partition_cols=partition_cols)
+    elif file_format == 'feather':
+        df.reset_index(drop=True).to_feather(path)
+    else:
+        raise ValueError(f"Unsupported file_format: {file_format}")
+    return path
+
+
+def load_splits(data_dir, features, file_format='parquet', splits=('train', 'validation', 'test'), filters=None):
+    """
+    data_dir 아래 train / validation / test 데이터를 features 컬럼만 로딩하는 함수.
+
+    :param data_dir: 데이터 디렉토리 (예: 'data')
+    :param features: model.yml 의 features 딕셔너리 (컬럼 projection 에 사용)
+    :param file_format: 'csv', 'parquet', 'feather'
+    :param splits: 로딩할 split 이름
+    :param filters: 모든 split 에 적용할 필터
+    :return: {split: 데이터프레임}
+    """
+    suffix = {'csv': '.csv', 'parquet': '.parquet', 'feather': '.feather'}[file_format]
+    columns = get_feature_columns(features)
+    result = {}
+    for split in splits:
+        path = os.path.join(data_dir, split + suffix)
+        if file_format == 'parquet' and not os.path.exists(path) and os.path.isdir(os.path.join(data_dir, split)):
+            # partitioned parquet: data/train/part=.../*.parquet
+            path = os.path.join(data_dir, split)
+        result[split] = read_dataset(path, columns=columns, filters=filters, file_format=file_format)
+    return result
+
+
 
 # import pandas as pd
 
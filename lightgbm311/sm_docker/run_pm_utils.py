@@ -1,12 +1,7 @@
-import pandas as pd
 import json
-import yaml
 import os
 import shutil
 
-import boto3
-from botocore.exceptions import NoCredentialsError, PartialCredentialsError, ClientError, BotoCoreError
-from boto3.dynamodb.conditions import Key
 import time
 from datetime import datetime
 import pytz
@@ -14,39 +9,74 @@ import zlib
 import base64
 import pickle
 import traceback
+import threading
 
 # user
 import conf
+from aws_clients import get_client, get_resource
+from secret_cache import SecretCache
 
 import pprint
 pp = pprint.PrettyPrinter(indent=4)
-    
-conf_data = conf.get_info()
-region_name = conf_data['region_name']
 
-# S3 클라이언트 초기화
-s3 = boto3.client('s3', region_name=region_name)
 
+# ============================================================
+# 공용 boto3 client (aws_clients.py, 프로세스 전체에서 재사용)
+# ============================================================
+# import 시점에는 STS 호출 / conf 조회를 하지 않습니다 (모두 최초 사용 시).
+_conf_lock = threading.Lock()
+_conf_data = None
 
-def get_secret_key(secret_name):
 
-    # Create a Secrets Manager client
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
+def get_conf_data() -> dict:
+    """conf.get_info() 결과 (계정 / 리전, 최초 호출 시 1회 조회)"""
+    global _conf_data
+    if _conf_data is None:
+        with _conf_lock:
+            if _conf_data is None:
+                _conf_data = conf.get_info()
+    return _conf_data
+
+
+def get_region_name() -> str:
+    return get_conf_data()['region_name']
+
+
+def get_table(table_name: str):
+    """공용 dynamodb resource 의 Table 객체"""
+    return get_resource('dynamodb', get_region_name()).Table(table_name)
+
+
+def get_s3_client():
+    """공용 S3 client (conf 리전)"""
+    return get_client('s3', get_region_name())
 
-    try:
-        get_secret_value_response = client.get_secret_value(
-            SecretId=secret_name
-        )
-    except ClientError as e:
-        # For a list of exceptions thrown, see
-        # https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetSecretValue.html
-        raise e
 
-    secret = json.loads(get_secret_value_response['SecretString'])
+def __getattr__(name):
+    """기존 모듈 속성 (utils.conf_data / utils.region_name / utils.s3) 은 처음 접근할 때 초기화"""
+    if name == 'conf_data':
+        return get_conf_data()
+    if name == 'region_name':
+        return get_region_name()
+    if name == 's3':
+        return get_s3_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _fetch_secret_string(secret_name, region_name):
+    # For a list of exceptions thrown, see
+    # https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetSecretValue.html
+    client = get_client('secretsmanager', region_name)
+    return client.get_secret_value(SecretId=secret_name)['SecretString']
+
+
+# Secrets Manager 캐시 (TTL / 백그라운드 갱신, GS_SECRET_CACHE_KEY 가 있으면 암호화 로컬 캐시)
+secret_cache = SecretCache(_fetch_secret_string)
+
+
+def get_secret_key(secret_name):
+
+    secret = json.loads(secret_cache.get(secret_name, get_region_name()))
 
     # Your code goes here.
     return secret
@@ -54,11 +84,8 @@ def get_secret_key(secret_name):
 
 def get_experiment_item(table_name, project_hashkey, file_hashkey):
     try:
-        # DynamoDB 리소스 생성
-        dynamodb = boto3.resource('dynamodb', region_name=region_name)
-
-        # 테이블 객체 생성
-        table = dynamodb.Table(table_name)
+        # 테이블 객체 (공용 DynamoDB 리소스)
+        table = get_table(table_name)
 
         # 키 조건 설정
         key = {
@@ -77,11 +104,8 @@ def get_experiment_item(table_name, project_hashkey, file_hashkey):
         
 def get_dataset_item(table_name, project_hashkey, file_hashkey):
     try:
-        # DynamoDB 리소스 생성
-        dynamodb = boto3.resource('dynamodb', region_name=region_name)
-
-        # 테이블 객체 생성
-        table = dynamodb.Table(table_name)
+        # 테이블 객체 (공용 DynamoDB 리소스)
+        table = get_table(table_name)
 
         # 키 조건 설정
         key = {
@@ -100,11 +124,8 @@ def get_dataset_item(table_name, project_hashkey, file_hashkey):
         
 def get_model_repo_item(table_name, model_hashkey):
     try:
-        # DynamoDB 리소스 생성
-        dynamodb = boto3.resource('dynamodb', region_name=region_name)
-
-        # 테이블 객체 생성
-        table = dynamodb.Table(table_name)
+        # 테이블 객체 (공용 DynamoDB 리소스)
+        table = get_table(table_name)
 
         # 키 조건 설정
         key = {
@@ -126,8 +147,7 @@ def put_item_to_ddb(table_name, item):
     :param item: 딕셔너리 형태의 저장할 속성
     """
     try:
-        dynamodb = boto3.resource('dynamodb', region_name=region_name)
-        table = dynamodb.Table(table_name)
+        table = get_table(table_name)
 
         table.put_item(Item=item)
         print(f"Success : {table_name} table에 item이 저장되었습니다.")
@@ -139,9 +159,8 @@ def put_item_to_ddb(table_name, item):
         
         
 def check_record_exists(table_name, pk_key, pk_value, sk_key=None, sk_value=None):
-    # DynamoDB 리소스 생성
-    dynamodb = boto3.resource('dynamodb', region_name=region_name)
-    table = dynamodb.Table(table_name)
+    # 테이블 객체 (공용 DynamoDB 리소스)
+    table = get_table(table_name)
     
     try:
         key = {
@@ -157,7 +176,7 @@ def check_record_exists(table_name, pk_key, pk_value, sk_key=None, sk_value=None
         # 항목 존재 여부 확인
         return 'Item' in response
 
-    except ClientError as e:
+    except table.meta.client.exceptions.ClientError as e:
         print(f"오류 발생: {e.response['Error']['Message']}")
         return False
     
@@ -186,7 +205,7 @@ def download_s3_files_to_directory(bucket_name: str, s3_prefix: str, local_dir:
     - s3_prefix (str): 다운로드할 S3 키(prefix), 예: 'folder1/subfolder2/'
     - local_dir (str): 다운로드한 파일을 저장할 로컬 디렉토리
     """
-    s3 = boto3.client('s3')
+    s3 = get_s3_client()
     
     paginator = s3.get_paginator('list_objects_v2')
     for page in paginator.paginate(Bucket=bucket_name, Prefix=s3_prefix):
@@ -218,7 +237,7 @@ def download_s3_file_to_directory(bucket, key, directory=None):
     
     # 파일 다운로드
     try:
-        s3.download_file(bucket, key, filepath)
+        get_s3_client().download_file(bucket, key, filepath)
         print(f"{key} 로부터 {filename} 파일이 '{filepath}'에 다운로드되었습니다.")
         with open(filepath, "r", encoding="utf-8") as file:
             temp = file.read()
@@ -284,7 +303,7 @@ def upload_directory_to_s3(local_directory, bucket, s3_prefix):
             
             # 파일 업로드
             try:
-                s3.upload_file(local_file_path, bucket, s3_file_path)
+                get_s3_client().upload_file(local_file_path, bucket, s3_file_path)
                 print(f"Uploaded {local_file_path} to s3://{bucket}/{s3_file_path}")
 
                 # artifacts 딕셔너리에 파일 추가
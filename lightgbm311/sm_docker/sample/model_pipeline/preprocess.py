@@ -2,26 +2,56 @@ import argparse
 import os
 import pandas as pd
 import yaml
-import boto3
-from io import BytesIO
 
+from .s3_reader import read_csv, iter_csv_chunks, read_parquet, read_feather
 
 
-def load_data(bucket,data_prefix):
+COLUMN_RENAMES = {
+    'PassengerId': 'passenger_id',
+    'Survived': 'target',
+    'Pclass': 'pclass',
+    'Name': 'name',
+    'Sex': 'sex',
+    'Age': 'age',
+    'SibSp': 'sibsp',
+    'Parch': 'parch',
+    'Ticket': 'ticket',
+    'Fare': 'fare',
+    'Cabin': 'cabin',
+    'Embarked': 'embarked',
+}
+
+
+def load_data(bucket, data_prefix, chunksize=None, usecols=None, filename="train.csv", filters=None):
     """
-    데이터 로딩
+    데이터 로딩 (S3 body 를 pandas 로 직접 스트리밍, 로컬 디스크 / 전체 bytes 버퍼 미사용)
     
     Args:
-        data_path: 원본 데이터 폴더 경로
+        bucket: S3 버킷
+        data_prefix: 원본 데이터 S3 prefix
+        chunksize: 지정 시 chunksize 행 단위 DataFrame iterator 반환 (CSV 전용)
+        usecols: 읽을 컬럼 목록 (None 이면 전체)
+        filename: 데이터 파일명 (train.csv / train.parquet / train.feather / train.arrow
+                  / 확장자 없는 partitioned parquet 폴더명 train)
+        filters: parquet / feather predicate pushdown 필터 [(column, op, value), ...]
 
     Returns:
-        df: 전체 데이터프레임
+        df: 전체 데이터프레임 (chunksize 지정 시 청크 iterator)
     """
-    key = f"{data_prefix}/train.csv"
-    s3 = boto3.client("s3")
-    obj = s3.get_object(Bucket=bucket, Key=key)
-    df = pd.read_csv(BytesIO(obj["Body"].read()))
-        
+    key = f"{data_prefix}/{filename}"
+    extension = os.path.splitext(filename.rstrip("/"))[1].lower()
+    if extension == ".csv":
+        if chunksize:
+            print(f"🔍 Streaming s3://{bucket}/{key} in chunks of {chunksize} rows")
+            return iter_csv_chunks(bucket, key, chunksize=chunksize, usecols=usecols)
+        df = read_csv(bucket, key, usecols=usecols)
+    elif extension in (".feather", ".arrow", ".ipc"):
+        df = read_feather(bucket, key, columns=usecols, filters=filters)
+    elif extension in (".parquet", ""):
+        df = read_parquet(bucket, key, columns=usecols, filters=filters)
+    else:
+        raise ValueError(f"Unsupported data file: {filename} (csv / parquet / feather / arrow)")
+
     print(f"🔍 Data shape: {df.shape}")
     print(f"🔍 Columns: {list(df.columns)}")
     return df
@@ -31,29 +61,18 @@ def preprocess_data(df):
     데이터 전처리
     
     Args:
-        df: 원본 데이터프레임
+        df: 원본 데이터프레임 (또는 load_data(chunksize=...) 의 청크 iterator)
     
     Returns:
-        df: 전처리한 데이터프레임
+        df: 전처리한 데이터프레임 (청크 iterator 입력 시 preprocess_chunks iterator)
 
     """
+    if not isinstance(df, pd.DataFrame):
+        return preprocess_chunks(df)
     
     df = df.copy()
 
-    df = df.rename(columns={
-        'PassengerId': 'passenger_id',
-        'Survived': 'target',
-        'Pclass': 'pclass',
-        'Name': 'name',
-        'Sex': 'sex',
-        'Age': 'age',
-        'SibSp': 'sibsp',
-        'Parch': 'parch',
-        'Ticket': 'ticket',
-        'Fare': 'fare',
-        'Cabin': 'cabin',
-        'Embarked': 'embarked',
-    })
+    df = df.rename(columns=COLUMN_RENAMES)
 
     
     # 기본 결측치 처리 + 타입 기준 단순 전처리
@@ -82,11 +101,72 @@ def preprocess_data(df):
     return df
 
 
+def preprocess_chunks(chunks, fill_values=None):
+    """
+    청크 단위 데이터 전처리 (전체 데이터를 메모리에 올리지 않음)
+    
+    Args:
+        chunks: 원본 데이터프레임 청크 iterator
+        fill_values: 범주형 컬럼 결측 대체값 {컬럼: 값} (없으면 첫 청크의 최빈값)
+    
+    Yields:
+        df: 전처리한 청크 데이터프레임
+
+    - 수치형 / 범주형 구분은 첫 청크 기준
+    - 범주형 인코딩은 전체 청크에 걸쳐 등장 순서대로 번호를 매기므로
+      전체 데이터에 pd.factorize 를 적용한 결과와 같은 코드를 갖는다
+    """
+    fill_values = dict(fill_values or {})
+    codes = {}
+    numeric_cols = None
+    object_cols = None
+
+    for chunk in chunks:
+        df = chunk.rename(columns=COLUMN_RENAMES)
+
+        if numeric_cols is None:
+            numeric_cols = list(df.select_dtypes(include="number").columns)
+            object_cols = [col for col in df.columns if col not in numeric_cols]
+            for col in object_cols:
+                if col not in fill_values:
+                    non_null = df[col].dropna()
+                    fill_values[col] = "" if non_null.empty else non_null.mode()[0]
+
+        for col in numeric_cols:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+
+        for col in object_cols:
+            values = df[col].fillna(fill_values[col]).astype(str)
+            mapping = codes.setdefault(col, {})
+            for value in values.unique():
+                if value not in mapping:
+                    mapping[value] = len(mapping)
+            df[col] = values.map(mapping)
+
+        yield df
+
+
 def save_preprocessed(df, output_dir, filename):
+    """
+    전처리 결과 저장 (파일 확장자로 포맷 결정: .csv / .parquet / .feather)
+    """
     os.makedirs(output_dir, exist_ok=True)
     output_path = os.path.join(output_dir, filename)
 
-    df.to_csv(output_path, index=False)
+    if filename.endswith(".parquet"):
+        if not isinstance(df, pd.DataFrame):
+            df = pd.concat(df, ignore_index=True)
+        df.to_parquet(output_path, index=False)
+    elif filename.endswith((".feather", ".arrow")):
+        if not isinstance(df, pd.DataFrame):
+            df = pd.concat(df, ignore_index=True)
+        df.reset_index(drop=True).to_feather(output_path)
+    elif isinstance(df, pd.DataFrame):
+        df.to_csv(output_path, index=False)
+    else:
+        # 청크 iterator 는 순서대로 이어 쓰기 (헤더는 첫 청크만)
+        for i, chunk in enumerate(df):
+            chunk.to_csv(output_path, index=False, mode="w" if i == 0 else "a", header=(i == 0))
     print(f"💾 Saved: {output_path}")
 
 
@@ -0,0 +1,169 @@
+import io
+
+import boto3
+import pandas as pd
+
+
+DEFAULT_CHUNKSIZE = 100_000          # pandas 청크 행 수
+DEFAULT_BLOCK_SIZE = 16 * 1024 ** 2  # pyarrow 스트리밍 블록 크기 (bytes)
+
+
+class S3BodyStream(io.RawIOBase):
+    """
+    botocore StreamingBody 를 file-like 객체로 감싸는 래퍼
+
+    pandas / pyarrow 가 필요한 만큼만 body 에서 읽어가므로
+    객체 전체를 bytes 로 읽어 BytesIO 로 감쌀 때처럼 메모리를 두 배로 쓰지 않는다.
+    """
+
+    def __init__(self, body):
+        self._body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._body.read(len(buffer))
+        n = len(data)
+        buffer[:n] = data
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._body.close()
+        super().close()
+
+
+def open_s3_stream(bucket, key, s3=None, buffer_size=io.DEFAULT_BUFFER_SIZE * 128):
+    """
+    S3 객체를 버퍼링된 읽기 스트림으로 연다.
+
+    Args:
+        bucket: S3 버킷
+        key: S3 키
+        s3: boto3 S3 client (없으면 생성)
+        buffer_size: 읽기 버퍼 크기
+
+    Returns:
+        io.BufferedReader
+    """
+    s3 = s3 or boto3.client("s3")
+    obj = s3.get_object(Bucket=bucket, Key=key)
+    return io.BufferedReader(S3BodyStream(obj["Body"]), buffer_size=buffer_size)
+
+
+def read_csv(bucket, key, s3=None, **read_csv_kwargs):
+    """
+    S3 CSV 를 로컬 디스크 / 전체 bytes 버퍼 없이 DataFrame 으로 로딩
+
+    Args:
+        bucket: S3 버킷
+        key: S3 키
+        s3: boto3 S3 client
+        **read_csv_kwargs: pd.read_csv 인자 (usecols, dtype 등)
+
+    Returns:
+        df: 데이터프레임
+    """
+    with open_s3_stream(bucket, key, s3=s3) as stream:
+        return pd.read_csv(stream, **read_csv_kwargs)
+
+
+def iter_csv_chunks(bucket, key, chunksize=DEFAULT_CHUNKSIZE, s3=None, **read_csv_kwargs):
+    """
+    S3 CSV 를 chunksize 행 단위 DataFrame 으로 순차 yield
+
+    인스턴스 메모리보다 큰 데이터도 청크 단위로 처리할 수 있다.
+
+    Args:
+        bucket: S3 버킷
+        key: S3 키
+        chunksize: 청크당 행 수
+        s3: boto3 S3 client
+        **read_csv_kwargs: pd.read_csv 인자
+
+    Yields:
+        df: 청크 데이터프레임
+    """
+    with open_s3_stream(bucket, key, s3=s3) as stream:
+        with pd.read_csv(stream, chunksize=chunksize, **read_csv_kwargs) as reader:
+            for chunk in reader:
+                yield chunk
+
+
+def iter_arrow_batches(bucket, key, columns=None, block_size=DEFAULT_BLOCK_SIZE, s3=None):
+    """
+    pyarrow 스트리밍 CSV 리더로 S3 CSV 를 record batch 단위 DataFrame 으로 yield
+
+    pandas 파서보다 빠르고, columns 지정 시 해당 컬럼만 변환한다.
+
+    Args:
+        bucket: S3 버킷
+        key: S3 키
+        columns: 읽을 컬럼 목록 (None 이면 전체)
+        block_size: 배치 블록 크기 (bytes)
+        s3: boto3 S3 client
+
+    Yields:
+        df: 배치 데이터프레임
+    """
+    try:
+        import pyarrow.csv as pv
+    except ImportError as exc:
+        raise RuntimeError("pyarrow is required for iter_arrow_batches") from exc
+
+    read_options = pv.ReadOptions(block_size=block_size)
+    convert_options = pv.ConvertOptions(include_columns=columns) if columns else None
+    with open_s3_stream(bucket, key, s3=s3) as stream:
+        reader = pv.open_csv(stream, read_options=read_options, convert_options=convert_options)
+        for batch in reader:
+            yield batch.to_pandas()
+
+
+def read_parquet(bucket, prefix, columns=None, filters=None):
+    """
+    S3 의 parquet 파일 또는 hive partitioned parquet prefix 를 DataFrame 으로 로딩
+
+    columns 는 column projection, filters 는 파티션 / row group 단위 predicate pushdown 으로
+    처리되어 필요한 컬럼 / 행만 S3 에서 읽는다.
+
+    Args:
+        bucket: S3 버킷
+        prefix: parquet 파일 키 또는 partitioned 데이터셋 prefix
+        columns: 읽을 컬럼 목록 (None 이면 전체)
+        filters: [(column, op, value), ...] 형식의 필터
+
+    Returns:
+        df: 데이터프레임
+    """
+    return _read_arrow_dataset(bucket, prefix, "parquet", columns=columns, filters=filters)
+
+
+def read_feather(bucket, key, columns=None, filters=None):
+    """
+    S3 의 Feather / Arrow IPC 파일을 DataFrame 으로 로딩
+
+    Args:
+        bucket: S3 버킷
+        key: .feather / .arrow 파일 키
+        columns: 읽을 컬럼 목록 (None 이면 전체)
+        filters: [(column, op, value), ...] 형식의 필터
+
+    Returns:
+        df: 데이터프레임
+    """
+    return _read_arrow_dataset(bucket, key, "ipc", columns=columns, filters=filters)
+
+
+def _read_arrow_dataset(bucket, prefix, file_format, columns=None, filters=None):
+    """pyarrow dataset 으로 S3 parquet / ipc 데이터 로딩"""
+    try:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError(f"pyarrow is required for {file_format} data") from exc
+
+    partitioning = "hive" if file_format == "parquet" else None
+    dataset = ds.dataset(f"s3://{bucket}/{prefix}", format=file_format, partitioning=partitioning)
+    expression = pq.filters_to_expression(filters) if filters else None
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
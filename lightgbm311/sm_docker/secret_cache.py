@@ -0,0 +1,238 @@
+"""
+secret_cache.py - Secrets Manager 값 캐시 (TTL + 백그라운드 갱신 + 선택적 암호화 로컬 캐시)
+
+get_secret / get_secret_key 가 호출마다 GetSecretValue 를 부르지 않도록
+(region, secret_name) 별 SecretString 을 메모리에 보관합니다.
+- TTL 의 refresh_ratio (기본 80%) 가 지나면 캐시 값을 바로 돌려주고 백그라운드에서 갱신
+- TTL 이 지나면 동기 갱신 (같은 secret 은 한 스레드만 호출하고 나머지는 결과 공유)
+- 갱신이 실패하면 (throttling 등) stale_grace 동안은 이전 값을 사용하고,
+  실패한 secret 은 backoff (5초부터 2배씩, 최대 5분) 가 지날 때까지 다시 호출하지 않음
+- GS_SECRET_CACHE_KEY (Fernet key) 가 있고 cryptography 가 설치돼 있으면
+  암호화된 로컬 캐시를 함께 사용 (커널 재시작 / 동시에 뜨는 여러 run 사이에서 재사용)
+
+환경 변수:
+  GS_SECRET_CACHE_KEY : 로컬 캐시 암호화 키 (Fernet.generate_key() 값), 없으면 로컬 캐시 미사용
+  GS_SECRET_CACHE_DIR : 로컬 캐시 위치 (기본: {.myenv}/.cache/secrets)
+  GS_SECRET_CACHE_TTL : TTL (초, 기본 3600)
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_TTL_SECONDS = 60 * 60
+DEFAULT_REFRESH_RATIO = 0.8
+FAILURE_BACKOFF_SECONDS = 5
+FAILURE_BACKOFF_MAX_SECONDS = 5 * 60
+KEY_ENV = 'GS_SECRET_CACHE_KEY'
+DIR_ENV = 'GS_SECRET_CACHE_DIR'
+TTL_ENV = 'GS_SECRET_CACHE_TTL'
+MYENV_DIRS = (
+    '/home/ec2-user/SageMaker/.myenv',
+    '/home/sagemaker-user/.myenv',
+)
+
+
+def _default_disk_dir():
+    if os.environ.get(DIR_ENV):
+        return Path(os.environ[DIR_ENV])
+    for myenv_dir in MYENV_DIRS:
+        if os.path.isdir(myenv_dir):
+            return Path(myenv_dir) / '.cache' / 'secrets'
+    return None
+
+
+def _make_fernet(encryption_key):
+    """암호화 키가 있고 cryptography 가 설치돼 있을 때만 Fernet 반환"""
+    if not encryption_key:
+        return None
+    try:
+        from cryptography.fernet import Fernet
+        return Fernet(encryption_key)
+    except ImportError:
+        logger.warning("cryptography is not installed, local secret cache disabled")
+    except ValueError as e:
+        logger.warning(f"Invalid {KEY_ENV}, local secret cache disabled: {e}")
+    return None
+
+
+class SecretCache:
+    """
+    (region, secret_name) 별 SecretString 캐시
+
+    Usage:
+        cache = SecretCache(lambda name, region: client.get_secret_value(SecretId=name)['SecretString'])
+        secret = json.loads(cache.get('my/secret', 'ap-northeast-2'))
+    """
+
+    def __init__(self, fetch, ttl: float = None, refresh_ratio: float = DEFAULT_REFRESH_RATIO,
+                 stale_grace: float = None, disk_dir=None, encryption_key=None):
+        """
+        Args:
+            fetch: (secret_name, region_name) -> SecretString
+            ttl: 캐시 유효 시간 (초, 기본 GS_SECRET_CACHE_TTL 또는 3600)
+            refresh_ratio: ttl 중 이 비율이 지나면 백그라운드 갱신
+            stale_grace: 갱신 실패 시 만료된 값을 더 쓸 수 있는 시간 (초, 기본 ttl)
+            disk_dir / encryption_key: 암호화 로컬 캐시 위치 / Fernet key (기본: 환경 변수)
+        """
+        self.fetch = fetch
+        self.ttl = float(ttl if ttl is not None else os.environ.get(TTL_ENV, DEFAULT_TTL_SECONDS))
+        self.refresh_after = self.ttl * refresh_ratio
+        self.stale_grace = self.ttl if stale_grace is None else stale_grace
+        self._fernet = _make_fernet(encryption_key or os.environ.get(KEY_ENV))
+        self.disk_dir = Path(disk_dir) if disk_dir else _default_disk_dir()
+        if self._fernet is None:
+            self.disk_dir = None
+
+        self._entries = {}      # {(region, name): (secret_string, fetched_at)}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._refreshing = set()
+        self._failures = {}     # {(region, name): (연속 실패 횟수, 다음 재시도 가능 시각)}
+
+    # ── 조회 ────────────────────────────────────────────────────
+
+    def get(self, secret_name: str, region_name: str = None) -> str:
+        """SecretString 반환 (캐시가 없거나 만료됐으면 Secrets Manager 호출)"""
+        key = (region_name or '', secret_name)
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.time() - entry[1]
+            if age < self.refresh_after:
+                return entry[0]
+            if age < self.ttl:
+                if not self._backing_off(key):
+                    self._refresh_async(key)
+                return entry[0]
+
+        with self._key_lock(key):
+            # 대기하는 동안 다른 스레드가 갱신했으면 그 값을 사용
+            entry = self._entries.get(key) or self._read_disk(key)
+            if entry is not None and time.time() - entry[1] < self.ttl:
+                self._entries[key] = entry
+                return entry[0]
+            stale = entry is not None and time.time() - entry[1] < self.ttl + self.stale_grace
+            if stale and self._backing_off(key):
+                # 최근 갱신에 실패했으면 backoff 가 끝날 때까지 호출하지 않고 이전 값 사용
+                return entry[0]
+            try:
+                return self._load(key)
+            except Exception as e:
+                delay = self._record_failure(key)
+                if stale:
+                    logger.warning(f"Secret refresh failed, using cached value for {secret_name} "
+                                   f"(retry in {delay:.0f}s): {e}")
+                    return entry[0]
+                raise
+
+    def invalidate(self, secret_name: str = None, region_name: str = None):
+        """캐시 삭제 (secret_name 미지정 시 전체, rotation 직후 등에 사용)"""
+        with self._lock:
+            if secret_name is None:
+                self._entries.clear()
+                self._failures.clear()
+            else:
+                self._entries.pop((region_name or '', secret_name), None)
+                self._failures.pop((region_name or '', secret_name), None)
+        if self.disk_dir is None:
+            return
+        if secret_name is None:
+            paths = list(self.disk_dir.glob('*.secret')) if self.disk_dir.is_dir() else []
+        else:
+            paths = [self._disk_path((region_name or '', secret_name))]
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    # ── 갱신 ────────────────────────────────────────────────────
+
+    def _key_lock(self, key) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _load(self, key) -> str:
+        region_name, secret_name = key
+        value = self.fetch(secret_name, region_name or None)
+        entry = (value, time.time())
+        self._entries[key] = entry
+        with self._lock:
+            self._failures.pop(key, None)
+        self._write_disk(key, entry)
+        return value
+
+    def _record_failure(self, key) -> float:
+        """실패 기록 → 다음 재시도까지 대기 시간 (초)"""
+        with self._lock:
+            count = self._failures.get(key, (0, 0))[0] + 1
+            delay = min(FAILURE_BACKOFF_MAX_SECONDS, FAILURE_BACKOFF_SECONDS * 2 ** (count - 1))
+            self._failures[key] = (count, time.time() + delay)
+        return delay
+
+    def _backing_off(self, key) -> bool:
+        failure = self._failures.get(key)
+        return failure is not None and time.time() < failure[1]
+
+    def _refresh_async(self, key):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(target=self._refresh, args=(key,), daemon=True, name='secret-refresh').start()
+
+    def _refresh(self, key):
+        try:
+            with self._key_lock(key):
+                self._load(key)
+        except Exception as e:  # 만료 전까지는 기존 값을 계속 사용
+            self._record_failure(key)
+            logger.warning(f"Background secret refresh failed for {key[1]}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    # ── 암호화 로컬 캐시 ────────────────────────────────────────
+
+    def _disk_path(self, key):
+        if self.disk_dir is None:
+            return None
+        digest = hashlib.sha256(f"{key[0]}:{key[1]}".encode('utf-8')).hexdigest()[:32]
+        return self.disk_dir / f"{digest}.secret"
+
+    def _read_disk(self, key):
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            token = path.read_bytes()
+            # 갱신 실패 시 stale 값으로 쓸 수 있도록 ttl + stale_grace 까지 유효
+            data = json.loads(self._fernet.decrypt(token, ttl=int(self.ttl + self.stale_grace)))
+            return data['value'], data['fetched_at']
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # 만료 (InvalidToken) / 키 변경 / 손상된 파일은 무시
+            logger.debug(f"Ignoring local secret cache {path}: {e}")
+            return None
+
+    def _write_disk(self, key, entry):
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            token = self._fernet.encrypt(json.dumps({'value': entry[0], 'fetched_at': entry[1]}).encode('utf-8'))
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(token)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write local secret cache: {e}")
@@ -6,6 +6,9 @@ import os
 import shutil
 from time import strftime
 
+from aws_clients import get_client
+from secret_cache import SecretCache
+
 import logging
 
 # metric.py 모듈 로거 설정
@@ -30,28 +33,27 @@ def load_yaml(path: str) -> dict:
     
     with open(path, 'r') as f:
         return yaml.safe_load(f)
-    
 
-def get_secret(secret_name, secret_key, region_name):
 
-    # Create a Secrets Manager client
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
+def _fetch_secret_string(secret_name, region_name):
+    client = get_client('secretsmanager', region_name)
+    return client.get_secret_value(SecretId=secret_name)['SecretString']
+
+
+# Secrets Manager 캐시 (TTL / 백그라운드 갱신, GS_SECRET_CACHE_KEY 가 있으면 암호화 로컬 캐시)
+secret_cache = SecretCache(_fetch_secret_string)
+
+
+def get_secret(secret_name, secret_key, region_name):
 
     try:
-        get_secret_value_response = client.get_secret_value(
-            SecretId=secret_name
-        )
+        secret = secret_cache.get(secret_name, region_name)
     except ClientError as e:
         # For a list of exceptions thrown, see
         # https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetSecretValue.html
         logger.error(e)
         raise e
 
-    secret = get_secret_value_response['SecretString']
     secret = json.loads(secret)
 
     # Your code goes here.
@@ -72,8 +74,8 @@ def download_s3_file(s3_url, local_folder):
     file_name = os.path.basename(s3_key)
     local_file_path = os.path.join(local_folder, file_name)
 
-    # S3 클라이언트 생성
-    s3 = boto3.client('s3')
+    # S3 클라이언트 (공용)
+    s3 = get_client('s3')
 
     try:
         # 타겟 디렉토리
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+bench_ddb_store.py - DDBStore 저장 / 조회 처리량 벤치마크 (로컬 backend, AWS 불필요)
+
+ddb_local.LocalTable 위에서 모델 / 데이터셋 / 차트를 크기별로 put / get 하며
+소요 시간, 처리량 (MB/s), 요청 수, 소비 용량 (WCU / RCU) 을 측정합니다.
+--latency-ms 로 요청당 네트워크 왕복을, --unprocessed-rate 로 throttling 을 흉내 내면
+청크 크기 / 병렬도 (--workers) 조정과 회귀 확인을 오프라인에서 할 수 있습니다.
+
+Usage:
+    python bench_ddb_store.py                                          # in-memory, 기본 크기
+    python bench_ddb_store.py --model-mb 1 10 50 --workers 1 4 8 16 --latency-ms 8
+    python bench_ddb_store.py --backend sqlite:/tmp/ddb_bench.db --compression zlib
+    python bench_ddb_store.py --repeat 5 --json ddb_bench.json
+"""
+
+import sys
+import json
+import random
+import argparse
+import statistics
+import time
+
+from botocore.exceptions import ClientError
+
+from ddb_local import LocalTable
+from ddb_store import DDBStore
+
+DEFAULT_MODEL_MB = (0.1, 1.0, 10.0)
+DEFAULT_DATASET_KB = (50, 200, 500)
+DEFAULT_CHART_KB = (20, 60)
+DEFAULT_WORKERS = (1, 8)
+DEFAULT_REPEAT = 3
+MB = 1024 * 1024
+
+RUN_PK = "RUN#bench#project#experiment#run"
+EXP_PK = "EXP#bench#project#experiment"
+CHART_NAMES = ("feature_importance", "roc_curve", "confusion_matrix", "learning_curve", "feature_impact_summary")
+
+
+# ── 테스트 데이터 ──────────────────────────────────────────────────────────
+
+def make_model(size_bytes: int, rng: random.Random) -> dict:
+    """절반은 난수 (가중치), 절반은 반복 텍스트 (트리 구조) 인 모델 흉내 객체"""
+    half = size_bytes // 2
+    line = "split_feature=12 threshold=0.532100 left_child=3 right_child=4 leaf_value=-0.0123\n"
+    return {"weights": rng.randbytes(half), "trees": (line * (half // len(line) + 1))[:half]}
+
+
+def make_csv(size_bytes: int, rng: random.Random) -> tuple:
+    """숫자 컬럼 CSV bytes 와 행 수"""
+    rows = ["f0,f1,f2,f3,f4,label"]
+    total = len(rows[0]) + 1
+    while total < size_bytes:
+        row = ",".join(f"{rng.uniform(-100, 100):.4f}" for _ in range(5)) + f",{rng.randint(0, 1)}"
+        rows.append(row)
+        total += len(row) + 1
+    return ("\n".join(rows) + "\n").encode("utf-8"), len(rows) - 1
+
+
+def make_charts(size_bytes: int, rng: random.Random) -> dict:
+    """PNG 처럼 압축이 거의 안 되는 차트 bytes 5개"""
+    return {name: b"\x89PNG\r\n\x1a\n" + rng.randbytes(size_bytes) for name in CHART_NAMES}
+
+
+# ── 측정 ───────────────────────────────────────────────────────────────────
+
+def make_table(args) -> LocalTable:
+    path = args.backend.split(":", 1)[1] if args.backend.startswith("sqlite:") else ":memory:"
+    return LocalTable(path, latency_ms=args.latency_ms, unprocessed_rate=args.unprocessed_rate, seed=args.seed)
+
+
+def measure(table: LocalTable, fn, repeat: int) -> dict:
+    """fn 을 repeat 번 실행한 시간 (ms) 과 1회당 요청 수 / 소비 용량"""
+    timings = []
+    table.reset_stats()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    stats = table.stats
+    return {
+        "median_ms":   round(statistics.median(timings), 1),
+        "min_ms":      round(min(timings), 1),
+        "requests":    {op: round(n / repeat, 1) for op, n in sorted(stats["requests"].items())},
+        "write_units": round(stats["write_units"] / repeat, 1),
+        "read_units":  round(stats["read_units"] / repeat, 1),
+        "unprocessed": round(stats["unprocessed"] / repeat, 1),
+    }
+
+
+def _throughput(size_bytes: int, timing: dict) -> float:
+    return round(size_bytes / MB / (timing["median_ms"] / 1000), 1) if timing["median_ms"] else 0.0
+
+
+def _failed(case: dict, error: Exception) -> dict:
+    code = error.response["Error"]["Code"] if isinstance(error, ClientError) else type(error).__name__
+    return {**case, "error": f"{code}: {error}"}
+
+
+def bench_models(store: DDBStore, table: LocalTable, args, rng: random.Random) -> list:
+    results = []
+    for size_mb in args.model_mb:
+        model = make_model(int(size_mb * MB), rng)
+        for workers in args.workers:
+            case = {"kind": "model", "size_mb": size_mb, "workers": workers}
+            try:
+                put = measure(table, lambda: store.put_model_chunked(
+                    RUN_PK, EXP_PK, model, "bench", "v1", max_workers=workers), args.repeat)
+                get = measure(table, lambda: store.get_model(RUN_PK, max_workers=workers), args.repeat)
+            except (ClientError, RuntimeError, ValueError) as e:
+                results.append(_failed(case, e))
+                continue
+            commit = store.get_model_commit(RUN_PK)
+            results.append({**case, "chunks": int(commit["total_chunks"]),
+                            "stored_mb": round(int(commit.get("stored_bytes", commit["size_bytes"])) / MB, 2),
+                            "put": {**put, "mb_per_s": _throughput(int(size_mb * MB), put)},
+                            "get": {**get, "mb_per_s": _throughput(int(size_mb * MB), get)}})
+    return results
+
+
+def bench_datasets(store: DDBStore, table: LocalTable, args, rng: random.Random) -> list:
+    results = []
+    for size_kb in args.dataset_kb:
+        csv_bytes, row_count = make_csv(size_kb * 1024, rng)
+        case = {"kind": "dataset", "size_mb": round(len(csv_bytes) / MB, 2), "rows": row_count}
+        try:
+            put = measure(table, lambda: store.put_dataset_split(EXP_PK, "train", "v1", csv_bytes, row_count),
+                          args.repeat)
+            get = measure(table, lambda: store.get_dataset_split(EXP_PK, "train"), args.repeat)
+        except (ClientError, RuntimeError, ValueError) as e:
+            results.append(_failed(case, e))
+            continue
+        results.append({**case, "put": {**put, "mb_per_s": _throughput(len(csv_bytes), put)},
+                        "get": {**get, "mb_per_s": _throughput(len(csv_bytes), get)}})
+    return results
+
+
+def bench_charts(store: DDBStore, table: LocalTable, args, rng: random.Random) -> list:
+    results = []
+    for size_kb in args.chart_kb:
+        charts = make_charts(size_kb * 1024, rng)
+        total = sum(len(b) for b in charts.values())
+        case = {"kind": "charts", "size_mb": round(total / MB, 2), "chart_kb": size_kb}
+        try:
+            put = measure(table, lambda: store.put_charts(RUN_PK, EXP_PK, charts), args.repeat)
+            get = measure(table, lambda: [store.get_chart_bytes(RUN_PK, name) for name in CHART_NAMES],
+                          args.repeat)
+        except (ClientError, RuntimeError, ValueError) as e:
+            results.append(_failed(case, e))
+            continue
+        results.append({**case, "put": {**put, "mb_per_s": _throughput(total, put)},
+                        "get": {**get, "mb_per_s": _throughput(total, get)}})
+    return results
+
+
+# ── 출력 ───────────────────────────────────────────────────────────────────
+
+def print_result(result: dict):
+    label = f"{result['kind']:<8} {result['size_mb']:>7.2f} MB"
+    if "workers" in result:
+        label += f"  workers={result['workers']:<3}"
+    if "error" in result:
+        print(f"  ❌ {label}  {result['error']}")
+        return
+    extra = f"  chunks={result['chunks']} stored={result['stored_mb']:.2f} MB" if "chunks" in result else ""
+    print(f"  ✅ {label}{extra}")
+    for op in ("put", "get"):
+        timing = result[op]
+        requests = ", ".join(f"{name}={n:g}" for name, n in timing["requests"].items())
+        print(f"      {op}: {timing['median_ms']:8.1f} ms  {timing['mb_per_s']:7.1f} MB/s  "
+              f"WCU={timing['write_units']:g} RCU={timing['read_units']:g}  [{requests}]")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark DDBStore against a local DynamoDB stand-in")
+    parser.add_argument("--backend", default="memory", help="memory | sqlite:<path> (default: memory)")
+    parser.add_argument("--model-mb", type=float, nargs="*", default=list(DEFAULT_MODEL_MB),
+                        help=f"Model sizes in MB (default: {' '.join(map(str, DEFAULT_MODEL_MB))})")
+    parser.add_argument("--dataset-kb", type=int, nargs="*", default=list(DEFAULT_DATASET_KB),
+                        help=f"CSV sizes in KB (default: {' '.join(map(str, DEFAULT_DATASET_KB))})")
+    parser.add_argument("--chart-kb", type=int, nargs="*", default=list(DEFAULT_CHART_KB),
+                        help=f"Per-chart sizes in KB (default: {' '.join(map(str, DEFAULT_CHART_KB))})")
+    parser.add_argument("--workers", type=int, nargs="*", default=list(DEFAULT_WORKERS),
+                        help=f"max_workers values for model put/get (default: {' '.join(map(str, DEFAULT_WORKERS))})")
+    parser.add_argument("--compression", default=None, help="zstd | zlib (default: DDBStore default)")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="DDBStore read-through cache entries (default: 0, measure uncached reads)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per request")
+    parser.add_argument("--unprocessed-rate", type=float, default=0.0,
+                        help="Probability that a batch item/key comes back unprocessed")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"Runs per case (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for payloads and throttling")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    args.repeat = max(1, args.repeat)
+    rng = random.Random(args.seed)
+    table = make_table(args)
+    store = DDBStore(compression=args.compression, table=table, cache_size=args.cache_size)
+
+    print(f"⏱️  DDBStore benchmark  (backend={args.backend}, compression={store.compression}, "
+          f"latency={args.latency_ms:g} ms, unprocessed={args.unprocessed_rate:g}, repeat={args.repeat})")
+    results = bench_models(store, table, args, rng) + bench_datasets(store, table, args, rng) \
+        + bench_charts(store, table, args, rng)
+    for result in results:
+        print_result(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "compression": store.compression, "results": results},
+                      f, indent=2, ensure_ascii=False)
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
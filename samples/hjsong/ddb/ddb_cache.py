@@ -0,0 +1,146 @@
+"""
+DDBStore 조회 결과 read-through 캐시 (in-memory LRU + 선택적 디스크 저장)
+
+(테이블, experiment_id, entity_type) 별로 decode 가 끝난 값 (conf dict, DataFrame, 차트 bytes 등) 과
+그 아이템의 version (saved_at / uploaded_at) 을 보관합니다.
+  - 재조회 시 version 속성만 projection 으로 읽어 비교하고, 같으면 캐시 값을 사용 (전송 / decode 생략)
+  - ttl 을 주면 그 시간 동안은 version 확인도 생략 (기본 0: 다른 프로세스의 저장을 바로 반영)
+  - disk_dir 를 주면 pickle 로 함께 저장 (커널 재시작 후에도 재사용, 로드 후 첫 조회는 항상 version 확인)
+반환 값은 복사본이므로 호출한 쪽에서 DataFrame / dict 를 수정해도 캐시는 바뀌지 않습니다.
+"""
+
+import copy
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_TTL_SECONDS = 0    # 매 조회마다 version 확인
+
+
+class CacheEntry:
+    __slots__ = ("value", "version", "checked_at")
+
+    def __init__(self, value, version: str, checked_at: float):
+        self.value = value
+        self.version = version
+        self.checked_at = checked_at
+
+
+class ItemCache:
+    """키별 (값, version) LRU 캐시"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL_SECONDS,
+                 disk_dir: str = None):
+        """
+        Args:
+            max_entries: 메모리에 둘 최대 아이템 수 (오래 안 쓴 것부터 제거)
+            ttl: version 확인 없이 캐시 값을 믿는 시간 (초, 0 이면 매번 확인)
+            disk_dir: 디스크 캐시 위치 (없으면 메모리만 사용)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ── 조회 / 저장 ───────────────────────────────────────────────────────
+
+    def lookup(self, key: tuple):
+        """CacheEntry 또는 None (메모리에 없으면 디스크에서 읽고, 이 경우 checked_at=0)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.checked_at < self.ttl
+
+    def touch(self, key: tuple):
+        """version 이 그대로임을 확인한 시점 기록"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.checked_at = time.time()
+
+    def store(self, key: tuple, value, version: str):
+        entry = CacheEntry(value, version, time.time())
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+
+    def invalidate(self, key: tuple = None):
+        """key 삭제 (미지정 시 전체, 디스크 캐시 포함)"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        if self.disk_dir is None:
+            return
+        if key is None:
+            paths = list(self.disk_dir.glob("*.pkl")) if self.disk_dir.is_dir() else []
+        else:
+            paths = [self._disk_path(key)]
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def copy_value(value):
+        """캐시 값을 호출한 쪽에 넘길 때 사용하는 복사본 (bytes / str 은 그대로)"""
+        if isinstance(value, (bytes, str)):
+            return value
+        return copy.deepcopy(value)
+
+    def _remember(self, key: tuple, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # ── 디스크 캐시 ───────────────────────────────────────────────────────
+
+    def _disk_path(self, key: tuple) -> Path:
+        digest = hashlib.sha256("\x00".join(key).encode("utf-8")).hexdigest()[:32]
+        return self.disk_dir / f"{digest}.pkl"
+
+    def _read_disk(self, key: tuple):
+        if self.disk_dir is None:
+            return None
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # 손상된 파일 / 버전이 다른 pandas 등은 무시하고 다시 조회
+            print(f"   [WARN] 디스크 캐시 무시 ({key[1]} / {key[2]}): {e}")
+            return None
+        if data.get("key") != key:
+            return None
+        return CacheEntry(data["value"], data["version"], 0.0)
+
+    def _write_disk(self, key: tuple, entry: CacheEntry):
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"key": key, "version": entry.version, "value": entry.value}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"   [WARN] 디스크 캐시 저장 실패 ({key[1]} / {key[2]}): {e}")
@@ -0,0 +1,402 @@
+"""
+DDBStore 용 로컬 DynamoDB 대체 backend (SQLite / in-memory)
+
+실제 테이블 없이 DDBStore 를 실행 / 벤치마크할 수 있도록, boto3 Table 리소스 중
+DDBStore 가 사용하는 부분 (put_item / get_item / delete_item / query,
+meta.client.batch_write_item / batch_get_item / describe_table) 을 같은 인터페이스로 구현합니다.
+
+지원하는 DynamoDB 동작:
+  - 키 스키마: experiment_id (HASH) / entity_type (RANGE), range key 는 UTF-8 바이트 순 정렬
+  - 아이템 400KB 한도 (초과 시 ValidationException)
+  - BatchWriteItem 25개 / 16MB 요청, BatchGetItem 100개 키 / 16MB 응답 (초과분은 UnprocessedKeys)
+  - Query 1MB 페이지 + Limit (LastEvaluatedKey / ExclusiveStartKey), ProjectionExpression
+  - TypeSerializer 로 저장하므로 float 는 거부되고, 숫자는 Decimal / 바이너리는 Binary 로 반환
+  - 선택: 요청당 지연 (latency_ms), 일부 요청을 UnprocessedItems / UnprocessedKeys 로 돌려주는
+    비율 (unprocessed_rate) 로 네트워크 왕복과 throttling 을 흉내
+  - 요청 수 / 소비 용량 (WCU, RCU) 집계 (stats)
+
+Usage:
+    from ddb_local import LocalTable
+    store = DDBStore(table=LocalTable())                                # in-memory
+    store = DDBStore(table=LocalTable("ddb_local.db", latency_ms=5))    # SQLite 파일
+"""
+
+import math
+import pickle
+import random
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+from ddb_store import TABLE_NAME
+
+HASH_KEY  = "experiment_id"
+RANGE_KEY = "entity_type"
+
+MAX_ITEM_BYTES        = 400 * 1024
+MAX_BATCH_WRITE_ITEMS = 25
+MAX_BATCH_GET_KEYS    = 100
+MAX_BATCH_BYTES       = 16 * 1024 * 1024
+MAX_QUERY_PAGE_BYTES  = 1024 * 1024
+
+_serializer   = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+class ResourceNotFoundException(ClientError):
+    """boto3 client.exceptions.ResourceNotFoundException 대응"""
+
+
+def _error(code: str, message: str, operation: str) -> ClientError:
+    cls = ResourceNotFoundException if code == "ResourceNotFoundException" else ClientError
+    return cls({"Error": {"Code": code, "Message": message}}, operation)
+
+
+# ── 아이템 직렬화 / 크기 계산 ───────────────────────────────────────────────
+
+def _serialize(item: dict) -> dict:
+    return {name: _serializer.serialize(value) for name, value in item.items()}
+
+
+def _deserialize(wire: dict) -> dict:
+    return {name: _deserializer.deserialize(value) for name, value in wire.items()}
+
+
+def _value_size(value: dict) -> int:
+    """AttributeValue 크기 (DynamoDB 아이템 크기 계산 규칙 근사)"""
+    (kind, v), = value.items()
+    if kind == "S":
+        return len(v.encode("utf-8"))
+    if kind == "N":
+        digits = len(v.lstrip("-").replace(".", "").strip("0")) or 1
+        return (digits + 1) // 2 + 1
+    if kind == "B":
+        return len(v)
+    if kind in ("BOOL", "NULL"):
+        return 1
+    if kind == "SS":
+        return sum(len(s.encode("utf-8")) for s in v)
+    if kind == "NS":
+        return sum(_value_size({"N": n}) for n in v)
+    if kind == "BS":
+        return sum(len(b) for b in v)
+    if kind == "M":
+        return 3 + sum(len(k.encode("utf-8")) + _value_size(x) + 1 for k, x in v.items())
+    if kind == "L":
+        return 3 + sum(_value_size(x) + 1 for x in v)
+    raise ValueError(f"Unknown attribute type: {kind}")
+
+
+def item_size(wire: dict) -> int:
+    """직렬화된 아이템 크기 (속성 이름 + 값, bytes)"""
+    return sum(len(name.encode("utf-8")) + _value_size(value) for name, value in wire.items())
+
+
+def _project(item: dict, projection: str, names: dict = None) -> dict:
+    """ProjectionExpression (최상위 속성, #name placeholder 지원) 적용"""
+    if not projection:
+        return item
+    attrs = [(names or {}).get(a.strip(), a.strip()) for a in projection.split(",")]
+    return {a: item[a] for a in attrs if a in item}
+
+
+# ── Key 조건 해석 ──────────────────────────────────────────────────────────
+
+def _key_condition(condition, operation: str = "Query"):
+    """boto3 Key 조건 → (partition key 값, entity_type 조건 함수 목록)"""
+    expr = condition.get_expression()
+    if expr["operator"] == "AND":
+        pk, predicates = None, []
+        for part in expr["values"]:
+            part_pk, part_predicates = _key_condition(part, operation)
+            pk = part_pk if part_pk is not None else pk
+            predicates.extend(part_predicates)
+        return pk, predicates
+
+    name, op, args = expr["values"][0].name, expr["operator"], expr["values"][1:]
+    if name == HASH_KEY:
+        if op != "=":
+            raise _error("ValidationException", "Query key condition not supported", operation)
+        return args[0], []
+    if name != RANGE_KEY:
+        raise _error("ValidationException", f"Query condition missed key schema element: {name}", operation)
+    predicate = {
+        "=":           lambda sk: sk == args[0],
+        "<":           lambda sk: sk < args[0],
+        "<=":          lambda sk: sk <= args[0],
+        ">":           lambda sk: sk > args[0],
+        ">=":          lambda sk: sk >= args[0],
+        "BETWEEN":     lambda sk: args[0] <= sk <= args[1],
+        "begins_with": lambda sk: sk.startswith(args[0]),
+    }.get(op)
+    if predicate is None:
+        raise _error("ValidationException", f"Unsupported key condition operator: {op}", operation)
+    return None, [predicate]
+
+
+# ── 테이블 ─────────────────────────────────────────────────────────────────
+
+class LocalTable:
+    """SQLite (기본 in-memory) 로 구현한 DynamoDB 테이블 리소스 대체"""
+
+    def __init__(self, path: str = ":memory:", name: str = TABLE_NAME,
+                 latency_ms: float = 0.0, unprocessed_rate: float = 0.0, seed: int = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본 ':memory:')
+            name: 테이블 이름 (batch 요청의 RequestItems 키)
+            latency_ms: 요청마다 추가할 지연 (네트워크 왕복 흉내, 병렬도 튜닝용)
+            unprocessed_rate: batch 요청에서 각 아이템 / 키를 미처리로 돌려줄 확률 (throttling 흉내)
+            seed: unprocessed_rate 난수 seed
+        """
+        self.name = name
+        self.latency = latency_ms / 1000
+        self.unprocessed_rate = unprocessed_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " pk TEXT NOT NULL, sk TEXT NOT NULL, item BLOB NOT NULL, size INTEGER NOT NULL,"
+            " PRIMARY KEY (pk, sk))"
+        )
+        self._conn.commit()
+        self.meta = SimpleNamespace(client=LocalClient(self))
+        self.reset_stats()
+
+    # ── 통계 ──────────────────────────────────────────────────────────────
+
+    def reset_stats(self):
+        self.stats = {"requests": {}, "write_units": 0.0, "read_units": 0.0, "unprocessed": 0}
+
+    def _record(self, operation: str, write_units: float = 0.0, read_units: float = 0.0):
+        with self._lock:
+            self.stats["requests"][operation] = self.stats["requests"].get(operation, 0) + 1
+            self.stats["write_units"] += write_units
+            self.stats["read_units"] += read_units
+
+    def _wait(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    @staticmethod
+    def _read_units(size: int, consistent: bool) -> float:
+        return math.ceil(max(size, 1) / 4096) * (1.0 if consistent else 0.5)
+
+    # ── 저장소 ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _key_of(key: dict, operation: str):
+        pk, sk = key.get(HASH_KEY), key.get(RANGE_KEY)
+        if not isinstance(pk, str) or not isinstance(sk, str) or not pk or not sk:
+            raise _error("ValidationException",
+                         "The provided key element does not match the schema", operation)
+        return pk, sk
+
+    def _validated(self, item: dict, operation: str):
+        """Python 아이템 → (pk, sk, 직렬화 아이템, 크기), 400KB 초과 시 ValidationException"""
+        pk, sk = self._key_of(item, operation)
+        try:
+            wire = _serialize(item)
+        except TypeError as e:   # float 등 지원하지 않는 타입
+            raise _error("ValidationException", str(e), operation) from e
+        size = item_size(wire)
+        if size > MAX_ITEM_BYTES:
+            raise _error("ValidationException",
+                         f"Item size has exceeded the maximum allowed size ({size} bytes)", operation)
+        return pk, sk, wire, size
+
+    def _store(self, pk, sk, wire, size):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO items (pk, sk, item, size) VALUES (?, ?, ?, ?)",
+                               (pk, sk, pickle.dumps(wire), size))
+            self._conn.commit()
+
+    def _remove(self, pk, sk):
+        with self._lock:
+            self._conn.execute("DELETE FROM items WHERE pk = ? AND sk = ?", (pk, sk))
+            self._conn.commit()
+
+    def _load(self, pk, sk):
+        """(직렬화 아이템, 크기) 또는 None"""
+        with self._lock:
+            row = self._conn.execute("SELECT item, size FROM items WHERE pk = ? AND sk = ?",
+                                     (pk, sk)).fetchone()
+        return (pickle.loads(row[0]), row[1]) if row else None
+
+    def item_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    # ── Table 리소스 API ──────────────────────────────────────────────────
+
+    def put_item(self, Item: dict, **kwargs):
+        self._wait()
+        pk, sk, wire, size = self._validated(Item, "PutItem")
+        self._store(pk, sk, wire, size)
+        self._record("PutItem", write_units=math.ceil(size / 1024))
+        return {}
+
+    def get_item(self, Key: dict, ConsistentRead: bool = False, ProjectionExpression: str = None,
+                 ExpressionAttributeNames: dict = None, **kwargs):
+        self._wait()
+        loaded = self._load(*self._key_of(Key, "GetItem"))
+        self._record("GetItem", read_units=self._read_units(loaded[1] if loaded else 0, ConsistentRead))
+        if loaded is None:
+            return {}
+        return {"Item": _project(_deserialize(loaded[0]), ProjectionExpression, ExpressionAttributeNames)}
+
+    def delete_item(self, Key: dict, **kwargs):
+        self._wait()
+        pk, sk = self._key_of(Key, "DeleteItem")
+        loaded = self._load(pk, sk)
+        self._remove(pk, sk)
+        self._record("DeleteItem", write_units=math.ceil(max(loaded[1] if loaded else 0, 1) / 1024))
+        return {}
+
+    def query(self, KeyConditionExpression, ExclusiveStartKey: dict = None, Limit: int = None,
+              ProjectionExpression: str = None, ExpressionAttributeNames: dict = None,
+              ScanIndexForward: bool = True, ConsistentRead: bool = False, **kwargs):
+        """
+        partition 1개 조회. 읽은 아이템 크기 합이 1MB 에 닿거나 Limit 개를 채우면 멈추고
+        LastEvaluatedKey 를 돌려줍니다 (실제 DynamoDB 처럼 마지막 페이지가 비어 있을 수 있음).
+        """
+        self._wait()
+        pk, predicates = _key_condition(KeyConditionExpression)
+        if pk is None:
+            raise _error("ValidationException", "Query condition missed key schema element: experiment_id", "Query")
+        order = "ASC" if ScanIndexForward else "DESC"
+        with self._lock:
+            rows = self._conn.execute(f"SELECT sk, size FROM items WHERE pk = ? ORDER BY sk {order}",
+                                      (pk,)).fetchall()
+        sort_keys = [(sk, size) for sk, size in rows if all(p(sk) for p in predicates)]
+        if ExclusiveStartKey:
+            start = ExclusiveStartKey[RANGE_KEY]
+            sort_keys = [(sk, size) for sk, size in sort_keys if (sk > start if ScanIndexForward else sk < start)]
+
+        page, page_bytes, last_key = [], 0, None
+        for sk, size in sort_keys:
+            loaded = self._load(pk, sk)
+            if loaded is None:   # 조회 사이 삭제된 아이템
+                continue
+            page.append(_project(_deserialize(loaded[0]), ProjectionExpression, ExpressionAttributeNames))
+            page_bytes += loaded[1]
+            if page_bytes >= MAX_QUERY_PAGE_BYTES or (Limit and len(page) >= Limit):
+                last_key = {HASH_KEY: pk, RANGE_KEY: sk}
+                break
+
+        self._record("Query", read_units=self._read_units(page_bytes, ConsistentRead))
+        resp = {"Items": page, "Count": len(page), "ScannedCount": len(page)}
+        if last_key:
+            resp["LastEvaluatedKey"] = last_key
+        return resp
+
+
+# ── Client (table.meta.client) ─────────────────────────────────────────────
+
+class LocalClient:
+    """resource client 중 batch / describe API (Python 타입 입출력)"""
+
+    def __init__(self, table: LocalTable):
+        self._table = table
+        self.exceptions = SimpleNamespace(ResourceNotFoundException=ResourceNotFoundException)
+
+    def _requests_for(self, request_items: dict, operation: str):
+        if set(request_items) != {self._table.name}:
+            raise _error("ResourceNotFoundException",
+                         f"Requested resource not found: {sorted(request_items)}", operation)
+        return request_items[self._table.name]
+
+    def _unprocessed(self) -> bool:
+        table = self._table
+        return table.unprocessed_rate > 0 and table._random.random() < table.unprocessed_rate
+
+    def describe_table(self, TableName: str, **kwargs):
+        if TableName != self._table.name:
+            raise _error("ResourceNotFoundException", f"Table not found: {TableName}", "DescribeTable")
+        return {"Table": {
+            "TableName":   self._table.name,
+            "TableStatus": "ACTIVE",
+            "ItemCount":   self._table.item_count(),
+            "KeySchema": [
+                {"AttributeName": HASH_KEY,  "KeyType": "HASH"},
+                {"AttributeName": RANGE_KEY, "KeyType": "RANGE"},
+            ],
+        }}
+
+    def batch_write_item(self, RequestItems: dict, **kwargs):
+        operation = "BatchWriteItem"
+        table     = self._table
+        requests  = self._requests_for(RequestItems, operation)
+        if not 1 <= len(requests) <= MAX_BATCH_WRITE_ITEMS:
+            raise _error("ValidationException",
+                         f"Too many items requested for the BatchWriteItem call ({len(requests)})", operation)
+
+        prepared, seen, total_bytes = [], set(), 0
+        for request in requests:
+            if "PutRequest" in request:
+                pk, sk, wire, size = table._validated(request["PutRequest"]["Item"], operation)
+                prepared.append((request, pk, sk, wire, size))
+                total_bytes += size
+            else:
+                pk, sk = table._key_of(request["DeleteRequest"]["Key"], operation)
+                prepared.append((request, pk, sk, None, 0))
+            if (pk, sk) in seen:
+                raise _error("ValidationException", "Provided list of item keys contains duplicates", operation)
+            seen.add((pk, sk))
+        if total_bytes > MAX_BATCH_BYTES:
+            raise _error("ValidationException", "Request size exceeds the 16MB limit", operation)
+
+        table._wait()
+        unprocessed, write_units = [], 0
+        for request, pk, sk, wire, size in prepared:
+            if self._unprocessed():
+                unprocessed.append(request)
+                continue
+            if wire is None:
+                table._remove(pk, sk)
+            else:
+                table._store(pk, sk, wire, size)
+            write_units += max(1, math.ceil(size / 1024))
+        table._record(operation, write_units=write_units)
+        with table._lock:
+            table.stats["unprocessed"] += len(unprocessed)
+        return {"UnprocessedItems": {table.name: unprocessed} if unprocessed else {}}
+
+    def batch_get_item(self, RequestItems: dict, **kwargs):
+        operation  = "BatchGetItem"
+        table      = self._table
+        spec       = self._requests_for(RequestItems, operation)
+        keys       = spec["Keys"]
+        consistent = spec.get("ConsistentRead", False)
+        if not 1 <= len(keys) <= MAX_BATCH_GET_KEYS:
+            raise _error("ValidationException",
+                         f"Too many items requested for the BatchGetItem call ({len(keys)})", operation)
+        parsed = [table._key_of(key, operation) for key in keys]
+        if len(set(parsed)) != len(parsed):
+            raise _error("ValidationException", "Provided list of item keys contains duplicates", operation)
+
+        table._wait()
+        items, unprocessed, response_bytes, read_units = [], [], 0, 0.0
+        for key, (pk, sk) in zip(keys, parsed):
+            if response_bytes >= MAX_BATCH_BYTES or self._unprocessed():
+                unprocessed.append(key)
+                continue
+            loaded = table._load(pk, sk)
+            if loaded is None:
+                continue
+            items.append(_project(_deserialize(loaded[0]), spec.get("ProjectionExpression"),
+                                  spec.get("ExpressionAttributeNames")))
+            response_bytes += loaded[1]
+            read_units += table._read_units(loaded[1], consistent)
+        table._record(operation, read_units=read_units)
+        with table._lock:
+            table.stats["unprocessed"] += len(unprocessed)
+        return {
+            "Responses": {table.name: items},
+            "UnprocessedKeys": {table.name: {**spec, "Keys": unprocessed}} if unprocessed else {},
+        }
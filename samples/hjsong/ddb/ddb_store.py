@@ -11,23 +11,106 @@ DynamoDB 전용 스토어 유틸리티
 
   experiment_id: RUN#{user_id}#{project}#{experiment}#{run_id}
     entity_type: MANIFEST / METRICS / DATA_REF / CONFIG /
-                 MODEL#chunk_{n} / CHARTS / EXPLAINABILITY / REPORT
+                 MODEL#COMMIT / MODEL#{version}#chunk_{n} / CHARTS / EXPLAINABILITY / REPORT
+                 (MODEL#chunk_{n} : commit marker 도입 이전 형식, 읽기만 지원)
+
+모델 저장 (put_model_chunked):
+  청크를 새 version 으로 병렬 batch 저장 → 모두 성공하면 MODEL#COMMIT marker 를 새 version 으로 교체
+  → 이전 version 청크 삭제. 읽기는 marker 가 가리키는 version 만 조합하므로 저장 중이거나
+  실패한 모델의 청크는 보이지 않습니다.
+
+모델 읽기 (get_model):
+  marker 의 version / total_chunks 로 청크 키를 바로 만들어 BatchGetItem 을 병렬 호출하고,
+  받은 청크를 미리 할당한 버퍼의 제 위치에 채웁니다. 청크 수 / 크기 / sha256 checksum 을
+  확인한 뒤에만 unpickle 합니다.
+
+조회 캐시 (get_experiment_conf / get_dataset_split / get_run_metrics / get_chart_bytes):
+  decode 된 값을 ddb_cache.ItemCache 에 보관하고 uploaded_at / saved_at 으로 변경 여부를 확인합니다.
+  같은 DDBStore 로 다시 저장하면 해당 키는 바로 무효화됩니다.
+
+저장 형식 (format 필드):
+  pickle_zstd / pickle_zlib : 압축한 pickle 을 Binary 속성에 저장 (청크 ~380KB, 모델)
+  csv_zstd / csv_zlib       : 압축한 CSV 를 Binary 속성에 저장 (데이터셋)
+  binary                    : 차트 PNG 원본을 Binary 속성에 저장 (PNG 는 이미 압축됨)
+  pickle_base64 / (format 없음) : 이전 형식 (base64 문자열), 읽기만 지원
+  zstd 는 zstandard 가 설치돼 있을 때 사용하고, 없으면 zlib 으로 저장합니다.
 """
 
 import base64
+import hashlib
 import io
 import math
 import pickle
+import random
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
+from uuid import uuid4
 
 import boto3
 import pandas as pd
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
+from ddb_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS, ItemCache
+
+try:
+    import zstandard
+except ImportError:  # zstandard 가 없으면 zlib 으로 저장
+    zstandard = None
+
 TABLE_NAME = "gsretail-mlops-edu-hjsong"
-CHUNK_SIZE = 250_000  # base64 문자 단위 청크 크기 (~187KB raw)
+CHUNK_SIZE = 250_000  # pickle_base64 (이전 형식) 청크 크기, base64 문자 단위
+BINARY_CHUNK_SIZE = 380_000     # Binary 청크 크기 (400KB 아이템 한도 - 키/메타 속성 여유분)
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 6
+FORMAT_BINARY = "binary"
+
+MODEL_COMMIT_ENTITY = "MODEL#COMMIT"
+LEGACY_CHUNK_PREFIX = "MODEL#chunk_"
+BATCH_WRITE_SIZE = 25           # BatchWriteItem 1회 최대 아이템 수
+BATCH_GET_SIZE = 40             # BatchGetItem 1회 키 수 (40 x 380KB < 16MB 응답 한도)
+DEFAULT_WRITE_WORKERS = 8       # 병렬 BatchWriteItem 요청 수
+DEFAULT_READ_WORKERS = 8        # 병렬 BatchGetItem 요청 수
+DEFAULT_MAX_RETRIES = 8         # UnprocessedItems / throttling 재시도 횟수
+RETRY_BASE_SECONDS = 0.05       # 재시도 대기 (지수 백오프 + jitter)
+MODEL_READ_ATTEMPTS = 3         # 읽는 중 새 version 이 commit 된 경우 재시도 횟수
+THROTTLE_CODES = {"ProvisionedThroughputExceededException", "ThrottlingException",
+                  "RequestLimitExceeded", "InternalServerError"}
+
+
+# ── 압축 헬퍼 ──────────────────────────────────────────────────────────────
+
+def _default_compression() -> str:
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def _compress(raw: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("compression='zstd' requires the zstandard package")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    if compression == "zlib":
+        return zlib.compress(raw, ZLIB_LEVEL)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def _decode_payload(data, fmt: str) -> bytes:
+    """format 필드에 맞게 저장된 값 → 원본 bytes (pickle_base64 / csv_b64 이전 형식 포함)"""
+    if not fmt or fmt.endswith("_base64"):
+        return base64.b64decode(data)
+    data = bytes(data)   # boto3 Binary → bytes
+    if fmt.endswith("_zstd"):
+        if zstandard is None:
+            raise RuntimeError(f"format '{fmt}' requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if fmt.endswith("_zlib"):
+        return zlib.decompress(data)
+    if fmt == FORMAT_BINARY:
+        return data
+    raise ValueError(f"Unsupported format: {fmt}")
 
 
 # ── 타입 변환 헬퍼 ──────────────────────────────────────────────────────────
@@ -62,11 +145,28 @@ def _from_ddb(obj):
 class DDBStore:
     """gsretail-mlops-edu-hjsong DynamoDB 테이블 전용 스토어"""
 
-    def __init__(self, region: str = "us-east-1"):
+    def __init__(self, region: str = "us-east-1", compression: str = None, table=None,
+                 cache_size: int = DEFAULT_MAX_ENTRIES, cache_ttl: float = DEFAULT_TTL_SECONDS,
+                 cache_dir: str = None):
+        """
+        compression: 모델 / 데이터셋 저장 시 압축 방식 ('zstd' | 'zlib',
+                     기본: zstandard 가 설치돼 있으면 zstd, 없으면 zlib)
+        table: boto3 Table 대신 사용할 backend (예: ddb_local.LocalTable), 없으면 실제 테이블
+        cache_size: 조회 캐시에 둘 최대 아이템 수 (0 이면 캐시 미사용)
+        cache_ttl: 변경 확인 없이 캐시 값을 쓰는 시간 (초, 기본 0: 매 조회마다 saved_at / uploaded_at 확인)
+        cache_dir: 조회 캐시를 디스크에도 저장할 위치 (커널 재시작 후 재사용)
+        """
+        self.cache = ItemCache(cache_size, cache_ttl, cache_dir) if cache_size else None
         self.region = region
-        self.ddb = boto3.resource("dynamodb", region_name=region)
-        self.client = boto3.client("dynamodb", region_name=region)
-        self.table = self.ddb.Table(TABLE_NAME)
+        self.compression = compression or _default_compression()
+        if table is None:
+            self.ddb = boto3.resource("dynamodb", region_name=region)
+            self.client = boto3.client("dynamodb", region_name=region)
+            self.table = self.ddb.Table(TABLE_NAME)
+        else:
+            self.ddb = None
+            self.client = table.meta.client
+            self.table = table
 
     # ── 키 생성 ──────────────────────────────────────────────────────────────
 
@@ -137,13 +237,13 @@ class DDBStore:
             "uploaded_at":   now,
             "uploaded_by":   meta_config.get("user_id", ""),
         }))
+        self._invalidate(exp_pk, "CONF")
 
     def put_dataset_split(self, exp_pk: str, split: str, version: str,
                           csv_bytes: bytes, row_count: int):
         """experiment_id=EXP#... / entity_type=DATA#{split}"""
-        import hashlib
         now = datetime.utcnow().isoformat()
-        csv_b64   = base64.b64encode(csv_bytes).decode("utf-8")
+        data      = _compress(csv_bytes, self.compression)
         checksum  = "sha256:" + hashlib.sha256(csv_bytes).hexdigest()[:16] + "..."
         self.table.put_item(Item={
             "experiment_id": exp_pk,
@@ -152,26 +252,30 @@ class DDBStore:
             "version":       version,
             "row_count":     row_count,
             "size_bytes":    len(csv_bytes),
+            "stored_bytes":  len(data),
             "checksum":      checksum,
-            "csv_b64":       csv_b64,
+            "format":        f"csv_{self.compression}",
+            "data":          data,
             "uploaded_at":   now,
         })
+        self._invalidate(exp_pk, f"DATA#{split}")
 
     # ── 실험 데이터 읽기 ──────────────────────────────────────────────────────
 
     def get_experiment_conf(self, exp_pk: str) -> dict:
         """CONF 아이템 → {env_yml, meta_yml, model_yml, ...}"""
-        resp = self.table.get_item(Key={"experiment_id": exp_pk, "entity_type": "CONF"})
-        if "Item" not in resp:
-            raise KeyError(f"CONF not found: experiment_id={exp_pk}")
-        return _from_ddb(resp["Item"])
+        return self._get_cached(exp_pk, "CONF", "uploaded_at", _from_ddb)
 
     def get_dataset_split(self, exp_pk: str, split: str) -> pd.DataFrame:
         """DATA#{split} 아이템 → pd.DataFrame"""
-        resp = self.table.get_item(Key={"experiment_id": exp_pk, "entity_type": f"DATA#{split}"})
-        if "Item" not in resp:
-            raise KeyError(f"DATA#{split} not found: experiment_id={exp_pk}")
-        csv_bytes = base64.b64decode(resp["Item"]["csv_b64"])
+        return self._get_cached(exp_pk, f"DATA#{split}", "uploaded_at", self._decode_dataset)
+
+    @staticmethod
+    def _decode_dataset(item: dict) -> pd.DataFrame:
+        if "csv_b64" in item:   # format 필드 도입 이전 형식
+            csv_bytes = base64.b64decode(item["csv_b64"])
+        else:
+            csv_bytes = _decode_payload(item["data"], item["format"])
         return pd.read_csv(io.BytesIO(csv_bytes))
 
     # ── Run 결과 쓰기 ─────────────────────────────────────────────────────────
@@ -196,7 +300,9 @@ class DDBStore:
             "entity_type":    "METRICS",
             "experiment_key": exp_pk,
             **metrics,
+            "saved_at":       datetime.utcnow().isoformat(),
         }))
+        self._invalidate(run_pk, "METRICS")
 
     def put_run_data_ref(self, run_pk: str, exp_pk: str, ref: dict):
         """experiment_id=RUN#... / entity_type=DATA_REF"""
@@ -217,27 +323,69 @@ class DDBStore:
         }))
 
     def put_model_chunked(self, run_pk: str, exp_pk: str, model_obj,
-                          algorithm: str, suffix: str) -> int:
-        """모델 pickle → base64 → 250KB 청킹 후 저장. 청크 수 반환."""
-        pkl_bytes    = pickle.dumps(model_obj)
-        b64_str      = base64.b64encode(pkl_bytes).decode("utf-8")
-        total_chunks = math.ceil(len(b64_str) / CHUNK_SIZE)
+                          algorithm: str, suffix: str,
+                          max_workers: int = DEFAULT_WRITE_WORKERS) -> int:
+        """
+        모델 pickle → 압축 (zstd / zlib) → ~380KB Binary 청킹 후 저장. 청크 수 반환.
+
+        청크는 새 version 키로 BatchWriteItem (25개 단위) 을 max_workers 개 병렬 전송하고,
+        전부 저장된 뒤에만 MODEL#COMMIT marker 를 갱신합니다. 중간에 실패하면 marker 는
+        이전 모델을 그대로 가리키고, 이번에 쓴 청크는 정리합니다.
+        """
+        pkl_bytes    = pickle.dumps(model_obj, protocol=pickle.HIGHEST_PROTOCOL)
+        data         = _compress(pkl_bytes, self.compression)
+        fmt          = f"pickle_{self.compression}"
+        total_chunks = max(1, math.ceil(len(data) / BINARY_CHUNK_SIZE))
         now          = datetime.utcnow().isoformat()
+        version      = f"{datetime.utcnow():%Y%m%d%H%M%S}-{uuid4().hex[:8]}"
 
-        for i in range(total_chunks):
-            chunk_data = b64_str[i * CHUNK_SIZE: (i + 1) * CHUNK_SIZE]
-            self.table.put_item(Item={
-                "experiment_id":  run_pk,
-                "entity_type":    f"MODEL#chunk_{i:03d}",
-                "experiment_key": exp_pk,
-                "chunk_index":    i,
-                "total_chunks":   total_chunks,
-                "algorithm":      algorithm,
-                "suffix":         suffix,
-                "format":         "pickle_base64",
-                "data":           chunk_data,
-                "saved_at":       now,
-            })
+        chunks = [{
+            "experiment_id":  run_pk,
+            "entity_type":    self._chunk_entity(version, i),
+            "experiment_key": exp_pk,
+            "model_version":  version,
+            "chunk_index":    i,
+            "total_chunks":   total_chunks,
+            "algorithm":      algorithm,
+            "suffix":         suffix,
+            "format":         fmt,
+            "data":           data[i * BINARY_CHUNK_SIZE: (i + 1) * BINARY_CHUNK_SIZE],
+            "saved_at":       now,
+        } for i in range(total_chunks)]
+
+        try:
+            self._batch_write([{"PutRequest": {"Item": item}} for item in chunks], max_workers)
+        except Exception:
+            self._delete_model_version(run_pk, version, max_workers)
+            raise
+
+        # 모든 청크가 저장된 뒤 marker 교체 (단일 put_item 이므로 원자적)
+        previous = self.get_model_commit(run_pk)
+        self.table.put_item(Item={
+            "experiment_id":  run_pk,
+            "entity_type":    MODEL_COMMIT_ENTITY,
+            "experiment_key": exp_pk,
+            "model_version":  version,
+            "total_chunks":   total_chunks,
+            "chunk_size":     BINARY_CHUNK_SIZE,
+            "algorithm":      algorithm,
+            "suffix":         suffix,
+            "format":         fmt,
+            "size_bytes":     len(pkl_bytes),
+            "stored_bytes":   len(data),
+            "checksum":       "sha256:" + hashlib.sha256(pkl_bytes).hexdigest(),
+            "saved_at":       now,
+            "committed_at":   datetime.utcnow().isoformat(),
+        })
+
+        # 이전 version / marker 도입 이전 형식의 청크 정리 (실패해도 marker 는 이미 새 version)
+        try:
+            if previous:
+                self._delete_model_version(run_pk, previous["model_version"], max_workers)
+            else:
+                self._delete_entities(run_pk, LEGACY_CHUNK_PREFIX, max_workers)
+        except Exception as e:
+            print(f"   [WARN] 이전 모델 청크 정리 실패 (experiment_id={run_pk}): {e}")
         return total_chunks
 
     def put_charts(self, run_pk: str, exp_pk: str, charts_bytes: dict):
@@ -252,7 +400,7 @@ class DDBStore:
         now = datetime.utcnow().isoformat()
 
         training_charts = {
-            name: base64.b64encode(bts).decode("utf-8")
+            name: bts
             for name, bts in charts_bytes.items()
             if name in training_names
         }
@@ -261,12 +409,14 @@ class DDBStore:
                 "experiment_id":  run_pk,
                 "entity_type":    "CHARTS",
                 "experiment_key": exp_pk,
+                "format":         FORMAT_BINARY,
                 "charts":         training_charts,
                 "saved_at":       now,
             })
+            self._invalidate(run_pk, "CHARTS")
 
         expl_charts = {
-            name: base64.b64encode(bts).decode("utf-8")
+            name: bts
             for name, bts in charts_bytes.items()
             if name not in training_names
         }
@@ -275,9 +425,11 @@ class DDBStore:
                 "experiment_id":  run_pk,
                 "entity_type":    "EXPLAINABILITY",
                 "experiment_key": exp_pk,
+                "format":         FORMAT_BINARY,
                 "charts":         expl_charts,
                 "saved_at":       now,
             })
+            self._invalidate(run_pk, "EXPLAINABILITY")
 
     def put_report(self, run_pk: str, exp_pk: str, html_content: str):
         """experiment_id=RUN#... / entity_type=REPORT"""
@@ -290,36 +442,222 @@ class DDBStore:
             "saved_at":       datetime.utcnow().isoformat(),
         })
 
+    # ── 조회 캐시 ────────────────────────────────────────────────────────────
+
+    def _get_cached(self, pk: str, entity_type: str, version_attr: str, decode):
+        """
+        (pk, entity_type) 아이템을 decode 한 값 (read-through 캐시)
+
+        캐시가 ttl 을 넘겼으면 version_attr 만 projection 으로 읽어 비교합니다.
+        (RCU 는 아이템 크기만큼 소비되지만 전송 / decode 는 생략)
+        version_attr 가 없는 이전 아이템은 캐시하지 않습니다.
+        """
+        key = {"experiment_id": pk, "entity_type": entity_type}
+        cache_key = (self.table.name, pk, entity_type)
+        entry = self.cache.lookup(cache_key) if self.cache is not None else None
+        if entry is not None:
+            if self.cache.is_fresh(entry):
+                return self.cache.copy_value(entry.value)
+            resp = self.table.get_item(Key=key, ProjectionExpression=version_attr)
+            if resp.get("Item", {}).get(version_attr) == entry.version:
+                self.cache.touch(cache_key)
+                return self.cache.copy_value(entry.value)
+
+        resp = self.table.get_item(Key=key)
+        if "Item" not in resp:
+            self._invalidate(pk, entity_type)
+            raise KeyError(f"{entity_type} not found: experiment_id={pk}")
+        value   = decode(resp["Item"])
+        version = resp["Item"].get(version_attr)
+        if self.cache is not None and version is not None:
+            self.cache.store(cache_key, value, version)
+            return self.cache.copy_value(value)
+        return value
+
+    def _invalidate(self, pk: str, entity_type: str):
+        if self.cache is not None:
+            self.cache.invalidate((self.table.name, pk, entity_type))
+
+    def clear_cache(self):
+        """조회 캐시 전체 삭제 (디스크 캐시 포함)"""
+        if self.cache is not None:
+            self.cache.invalidate()
+
+    # ── 모델 청크 저장 / 삭제 헬퍼 ────────────────────────────────────────────
+
+    @staticmethod
+    def _chunk_entity(version: str, index: int) -> str:
+        return f"MODEL#{version}#chunk_{index:05d}"
+
+    def _batch_write(self, requests: list, max_workers: int = DEFAULT_WRITE_WORKERS):
+        """
+        Put/DeleteRequest 목록을 25개 단위 BatchWriteItem 으로 병렬 전송
+
+        table.batch_writer 는 UnprocessedItems 를 대기 없이 곧바로 다시 보내므로,
+        throttling 시에도 지수 백오프 + jitter 로 재시도하도록 직접 전송합니다.
+        """
+        batches = [requests[i:i + BATCH_WRITE_SIZE] for i in range(0, len(requests), BATCH_WRITE_SIZE)]
+        if not batches:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            for _ in executor.map(self._write_batch, batches):
+                pass
+
+    def _write_batch(self, batch: list):
+        """BatchWriteItem 1회분 전송 (UnprocessedItems / throttling 은 백오프 후 재시도)"""
+        client  = self.table.meta.client   # resource client: 파이썬 타입 그대로 직렬화
+        pending = batch
+        for attempt in range(DEFAULT_MAX_RETRIES + 1):
+            try:
+                resp    = client.batch_write_item(RequestItems={self.table.name: pending})
+                pending = resp.get("UnprocessedItems", {}).get(self.table.name, [])
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in THROTTLE_CODES:
+                    raise
+            if not pending:
+                return
+            if attempt < DEFAULT_MAX_RETRIES:
+                time.sleep(random.uniform(0, RETRY_BASE_SECONDS * (2 ** attempt)))
+        raise RuntimeError(f"BatchWriteItem: {len(pending)} item(s) still unprocessed "
+                           f"after {DEFAULT_MAX_RETRIES} retries")
+
+    def _get_batch(self, keys: list) -> list:
+        """BatchGetItem 1회분 조회 (UnprocessedKeys / throttling 은 백오프 후 재시도), 없는 키는 결과에서 빠짐"""
+        client  = self.table.meta.client
+        pending = keys
+        items   = []
+        for attempt in range(DEFAULT_MAX_RETRIES + 1):
+            try:
+                resp    = client.batch_get_item(RequestItems={self.table.name: {"Keys": pending, "ConsistentRead": True}})
+                items.extend(resp.get("Responses", {}).get(self.table.name, []))
+                pending = resp.get("UnprocessedKeys", {}).get(self.table.name, {}).get("Keys", [])
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in THROTTLE_CODES:
+                    raise
+            if not pending:
+                return items
+            if attempt < DEFAULT_MAX_RETRIES:
+                time.sleep(random.uniform(0, RETRY_BASE_SECONDS * (2 ** attempt)))
+        raise RuntimeError(f"BatchGetItem: {len(pending)} key(s) still unprocessed "
+                           f"after {DEFAULT_MAX_RETRIES} retries")
+
+    def _query_entities(self, run_pk: str, prefix: str, projection: str = None) -> list:
+        """entity_type 이 prefix 로 시작하는 아이템 전체 (페이지네이션, strongly consistent)"""
+        kwargs = {
+            "KeyConditionExpression": Key("experiment_id").eq(run_pk) & Key("entity_type").begins_with(prefix),
+            "ConsistentRead": True,
+        }
+        if projection:
+            kwargs["ProjectionExpression"] = projection
+        items = []
+        while True:
+            resp = self.table.query(**kwargs)
+            items.extend(resp["Items"])
+            if "LastEvaluatedKey" not in resp:
+                return items
+            kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+    def _delete_entities(self, run_pk: str, prefix: str, max_workers: int = DEFAULT_WRITE_WORKERS):
+        items = self._query_entities(run_pk, prefix, projection="experiment_id, entity_type")
+        self._batch_write([{"DeleteRequest": {"Key": {
+            "experiment_id": run_pk, "entity_type": item["entity_type"],
+        }}} for item in items], max_workers)
+
+    def _delete_model_version(self, run_pk: str, version: str, max_workers: int = DEFAULT_WRITE_WORKERS):
+        self._delete_entities(run_pk, f"MODEL#{version}#chunk_", max_workers)
+
     # ── Run 결과 읽기 ─────────────────────────────────────────────────────────
 
-    def get_model(self, run_pk: str):
-        """청크 아이템들을 순서대로 조합해 model 객체 반환"""
-        resp  = self.table.query(
-            KeyConditionExpression=Key("experiment_id").eq(run_pk) & Key("entity_type").begins_with("MODEL#chunk_")
+    def get_model_commit(self, run_pk: str):
+        """MODEL#COMMIT marker (commit 된 모델이 없으면 None)"""
+        resp = self.table.get_item(
+            Key={"experiment_id": run_pk, "entity_type": MODEL_COMMIT_ENTITY}, ConsistentRead=True,
         )
-        items = sorted(resp["Items"], key=lambda x: int(x["chunk_index"]))
+        return resp.get("Item")
+
+    def get_model(self, run_pk: str, max_workers: int = DEFAULT_READ_WORKERS):
+        """commit 된 version 의 청크를 병렬로 읽어 검증 후 model 객체 반환"""
+        for _ in range(MODEL_READ_ATTEMPTS):
+            commit = self.get_model_commit(run_pk)
+            if commit is None:
+                return self._get_legacy_model(run_pk)
+            pkl_bytes = self._read_model_version(run_pk, commit, max_workers)
+            if pkl_bytes is not None:
+                return pickle.loads(pkl_bytes)
+            # 읽는 사이 새 version 이 commit 되어 이전 청크가 정리된 경우 → marker 부터 다시 읽기
+        raise RuntimeError(f"Model chunks changed while reading: experiment_id={run_pk}")
+
+    def _read_model_version(self, run_pk: str, commit: dict, max_workers: int = DEFAULT_READ_WORKERS):
+        """
+        marker 가 가리키는 version 의 청크 → 검증된 pickle bytes (청크가 사라졌으면 None)
+
+        base64 청크는 각각 독립적으로 decode 되므로 원본 크기 버퍼에 바로 풀고,
+        압축 청크는 압축본 크기 버퍼에 모은 뒤 한 번에 해제합니다.
+        """
+        version = commit["model_version"]
+        total   = int(commit["total_chunks"])
+        fmt     = commit.get("format", "pickle_base64")
+        encoded = fmt == "pickle_base64"
+        chunk_size = int(commit.get("chunk_size", CHUNK_SIZE if encoded else BINARY_CHUNK_SIZE))
+        step    = chunk_size // 4 * 3 if encoded else chunk_size
+        size    = int(commit["size_bytes"] if encoded else commit["stored_bytes"])
+
+        buffer   = bytearray(size)
+        view     = memoryview(buffer)
+        received = {}   # {chunk_index: 버퍼에 채운 길이}
+
+        def fetch(keys):
+            for item in self._get_batch(keys):
+                index = int(item["chunk_index"])
+                data  = base64.b64decode(item["data"]) if encoded else bytes(item["data"])
+                start = index * step
+                if index >= total or start + len(data) > size:
+                    raise ValueError(f"Model chunk {index} out of range: experiment_id={run_pk}")
+                view[start:start + len(data)] = data
+                received[index] = len(data)
+
+        keys = [{"experiment_id": run_pk, "entity_type": self._chunk_entity(version, i)} for i in range(total)]
+        batches = [keys[i:i + BATCH_GET_SIZE] for i in range(0, total, BATCH_GET_SIZE)]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            for _ in executor.map(fetch, batches):
+                pass
+
+        if len(received) != total:
+            return None
+        if sum(received.values()) != size:
+            raise ValueError(f"Model size mismatch: experiment_id={run_pk}, "
+                             f"expected {size} bytes, got {sum(received.values())}")
+        pkl_bytes = bytes(buffer) if encoded else _decode_payload(buffer, fmt)
+        checksum  = commit.get("checksum")
+        if checksum and checksum != "sha256:" + hashlib.sha256(pkl_bytes).hexdigest():
+            raise ValueError(f"Model checksum mismatch: experiment_id={run_pk}, version={version}")
+        return pkl_bytes
+
+    def _get_legacy_model(self, run_pk: str):
+        """marker 도입 이전 형식 (MODEL#chunk_{n}) 모델 읽기"""
+        items = sorted(self._query_entities(run_pk, LEGACY_CHUNK_PREFIX), key=lambda x: int(x["chunk_index"]))
         if not items:
             raise KeyError(f"Model chunks not found: experiment_id={run_pk}")
-        b64_str = "".join(item["data"] for item in items)
-        return pickle.loads(base64.b64decode(b64_str))
+        total = int(items[0].get("total_chunks", len(items)))
+        if [int(item["chunk_index"]) for item in items] != list(range(total)):
+            raise ValueError(f"Model chunks incomplete: experiment_id={run_pk}, "
+                             f"expected {total}, got {len(items)}")
+        # 청크 크기가 4의 배수라 청크별로 decode 가능 (base64 전체 문자열을 만들지 않음)
+        return pickle.loads(b"".join(base64.b64decode(item["data"]) for item in items))
 
     def get_run_metrics(self, run_pk: str) -> dict:
-        resp = self.table.get_item(Key={"experiment_id": run_pk, "entity_type": "METRICS"})
-        if "Item" not in resp:
-            raise KeyError(f"METRICS not found: experiment_id={run_pk}")
-        return _from_ddb(resp["Item"])
+        return self._get_cached(run_pk, "METRICS", "saved_at", _from_ddb)
 
     def get_chart_bytes(self, run_pk: str, chart_name: str) -> bytes:
         """chart_name: 'feature_importance'|'roc_curve'|'confusion_matrix'|
                        'learning_curve'|'feature_impact_summary'"""
-        et   = "EXPLAINABILITY" if chart_name == "feature_impact_summary" else "CHARTS"
-        resp = self.table.get_item(Key={"experiment_id": run_pk, "entity_type": et})
-        if "Item" not in resp:
-            raise KeyError(f"{et} not found: experiment_id={run_pk}")
-        charts = resp["Item"]["charts"]
+        et     = "EXPLAINABILITY" if chart_name == "feature_impact_summary" else "CHARTS"
+        charts = self._get_cached(run_pk, et, "saved_at", lambda item: {
+            name: _decode_payload(value, item.get("format")) for name, value in item["charts"].items()
+        })
         if chart_name not in charts:
             raise KeyError(f"Chart '{chart_name}' not found in {et}")
-        return base64.b64decode(charts[chart_name])
+        return charts[chart_name]
 
     def get_report_html(self, run_pk: str) -> str:
         resp = self.table.get_item(Key={"experiment_id": run_pk, "entity_type": "REPORT"})
@@ -328,9 +666,15 @@ class DDBStore:
         return resp["Item"]["content"]
 
     def list_run_items(self, run_pk: str) -> list:
-        """RUN experiment_id 아래의 모든 entity_type 목록 반환"""
-        resp = self.table.query(
-            KeyConditionExpression=Key("experiment_id").eq(run_pk),
-            ProjectionExpression="entity_type",
-        )
-        return [item["entity_type"] for item in resp["Items"]]
+        """RUN experiment_id 아래의 모든 entity_type 목록 반환 (모델 청크가 1MB 를 넘어도 전부)"""
+        kwargs = {
+            "KeyConditionExpression": Key("experiment_id").eq(run_pk),
+            "ProjectionExpression":   "entity_type",
+        }
+        entity_types = []
+        while True:
+            resp = self.table.query(**kwargs)
+            entity_types.extend(item["entity_type"] for item in resp["Items"])
+            if "LastEvaluatedKey" not in resp:
+                return entity_types
+            kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
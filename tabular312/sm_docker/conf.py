@@ -1,30 +1,22 @@
 import pprint
 pp = pprint.PrettyPrinter(indent=4)
-import boto3
 import os
 
+from aws_identity import get_identity
+
 
 log_table_name = 'automl-logs'
 kernel_name = "conda_tabular312"
 
 
 def get_info():
-    # STS 클라이언트 생성
-    sts_client = boto3.client('sts')
-
-    # 현재 AWS 계정 ID 가져오기
-    response = sts_client.get_caller_identity()
-    target_account_id = response['Account']
+    # 계정 ID / 리전 (memo → 환경 변수 / SageMaker 메타데이터 → 디스크 캐시 → STS 순으로 조회)
+    identity = get_identity(default_region='ap-northeast-2')
+    target_account_id = identity['account_id']
 
     print(f"AWS Account ID: {target_account_id}")
 
-    # Boto3 세션 생성
-    session = boto3.Session()
-
-    # 현재 세션의 리전 정보 가져오기
-    target_region = session.region_name
-    if target_region is None:
-        target_region = 'ap-northeast-2'
+    target_region = identity['region_name']
 
     print(f"AWS Region: {target_region}")
     
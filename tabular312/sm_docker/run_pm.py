@@ -7,10 +7,6 @@ import pickle
 import traceback
 import argparse
 import warnings
-import boto3
-from botocore.exceptions import ClientError
-import papermill as pm
-from papermill.exceptions import PapermillExecutionError
 import pprint
 
 import run_pm_utils as utils
@@ -28,7 +24,7 @@ def upload_file_to_s3(local_path: str, bucket: str, prefix: str) -> str:
     if not os.path.isfile(local_path):
         raise FileNotFoundError(f"Local file not found: {local_path}")
 
-    s3 = boto3.client("s3")
+    s3 = utils.get_s3_client()
 
     filename = os.path.basename(local_path)
     prefix = prefix.strip("/")
@@ -41,13 +37,17 @@ def upload_file_to_s3(local_path: str, bucket: str, prefix: str) -> str:
 
     try:
         s3.upload_file(local_path, bucket, key, ExtraArgs=extra_args or None)
-    except ClientError as e:
+    except s3.exceptions.ClientError as e:
         raise RuntimeError(f"S3 upload failed: {e}") from e
 
     return f"s3://{bucket}/{key}"
     
 
 def run_papermill(input_nb, output_dir):
+    # papermill 은 실행 시점에 import (모듈 import / CLI 기동 시간 단축)
+    import papermill as pm
+    from papermill.exceptions import PapermillExecutionError
+
     os.chdir(output_dir)
     output_nb = input_nb.replace('.ipynb', '_output.ipynb')
     try:
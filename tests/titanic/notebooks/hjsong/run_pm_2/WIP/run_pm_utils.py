@@ -17,6 +17,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from aws_clients import get_client
+
 
 # ============================================================
 # YAML Loaders  (로컬 / S3 모두 지원)
@@ -41,7 +43,7 @@ def _parse_s3_uri(s3_uri: str):
 def load_yaml_from_s3(s3_uri: str) -> dict:
     """S3의 yml 파일을 직접 메모리로 로드"""
     bucket, key = _parse_s3_uri(s3_uri)
-    s3_client = boto3.client('s3')
+    s3_client = get_client('s3')
     obj = s3_client.get_object(Bucket=bucket, Key=key)
     content = obj['Body'].read().decode('utf-8')
     return yaml.safe_load(content) or {}
@@ -184,7 +186,7 @@ class LocalConfig:
 
 def ensure_bucket_exists(bucket: str, region: str = "ap-northeast-2") -> bool:
     """S3 버킷이 없으면 생성"""
-    s3_client = boto3.client('s3', region_name=region)
+    s3_client = get_client('s3', region)
     try:
         s3_client.head_bucket(Bucket=bucket)
         print(f"✓ Bucket exists: {bucket}")
@@ -213,7 +215,7 @@ def ensure_bucket_exists(bucket: str, region: str = "ap-northeast-2") -> bool:
 
 def download_from_s3(bucket: str, s3_prefix: str, local_dir: str, dry_run: bool = False) -> List[str]:
     """S3 prefix 하위 전체를 로컬로 다운로드"""
-    s3_client = boto3.client('s3')
+    s3_client = get_client('s3')
     downloaded = []
     try:
         paginator = s3_client.get_paginator('list_objects_v2')
@@ -240,7 +242,7 @@ def upload_to_s3(local_path: str, bucket: str, s3_key: str, dry_run: bool = Fals
     if dry_run:
         print(f"  [DRY RUN] {local_path} -> {s3_uri}")
     else:
-        boto3.client('s3').upload_file(local_path, bucket, s3_key)
+        get_client('s3').upload_file(local_path, bucket, s3_key)
         print(f"  ✓ Uploaded: {s3_uri}")
     return s3_uri
 
@@ -0,0 +1,71 @@
+"""
+aws_clients.py - 프로세스 공용 boto3 Session / client / resource
+
+client 생성은 호출마다 수십 ms (credential / endpoint 해석) 가 걸리므로
+(service, region) 별로 처음 쓸 때 한 번만 만들고 connection pool 을 재사용합니다.
+run_pm_utils.py / back2 utils.py 등 헬퍼 모듈은 모두 이 모듈의 get_client 를 사용하므로
+pool 크기 / 재시도 방식은 AWS_CLIENT_CONFIG 한 곳에서만 바꾸면 됩니다.
+import 시점에는 boto3 로딩 / client 생성을 하지 않습니다 (모두 최초 사용 시).
+
+이 파일은 bin/aws_clients.py 가 원본이며, 각 배포 디렉토리에 같은 내용으로 복사해 사용합니다.
+"""
+
+import threading
+
+AWS_CLIENT_CONFIG = dict(
+    max_pool_connections=32,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=10,
+    read_timeout=60,
+)
+
+_lock = threading.RLock()
+_session = None
+_clients = {}
+_resources = threading.local()   # resource 는 thread-safe 하지 않으므로 스레드별로 보관
+
+
+def client_config():
+    """공용 botocore Config (AWS_CLIENT_CONFIG)"""
+    from botocore.config import Config
+    return Config(**AWS_CLIENT_CONFIG)
+
+
+def get_session():
+    """프로세스 공용 boto3 Session (최초 호출 시 생성)"""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                import boto3
+                _session = boto3.session.Session()
+    return _session
+
+
+def get_client(service_name: str, region_name: str = None):
+    """(service, region) 별 공용 client (thread-safe, 최초 호출 시 생성)"""
+    key = (service_name, region_name)
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                client = get_session().client(service_name, region_name=region_name,
+                                              config=client_config())
+                _clients[key] = client
+    return client
+
+
+def get_resource(service_name: str, region_name: str = None):
+    """(service, region) 별 공용 resource (스레드마다 1개, 최초 호출 시 생성)"""
+    cache = getattr(_resources, 'cache', None)
+    if cache is None:
+        cache = _resources.cache = {}
+    key = (service_name, region_name)
+    if key not in cache:
+        with _lock:
+            cache[key] = get_session().resource(service_name, region_name=region_name,
+                                                config=client_config())
+    return cache[key]
+
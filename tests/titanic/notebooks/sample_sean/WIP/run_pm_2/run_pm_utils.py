@@ -13,6 +13,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from aws_clients import get_client
+
 
 # ============================================================
 # Configuration Classes
@@ -111,7 +113,7 @@ class LocalConfig:
 def ensure_bucket_exists(bucket: str, region: str = None) -> bool:
     """S3 버킷이 없으면 생성"""
     region = region or OutputConfig.REGION
-    s3_client = boto3.client('s3', region_name=region)
+    s3_client = get_client('s3', region)
     
     try:
         s3_client.head_bucket(Bucket=bucket)
@@ -142,7 +144,7 @@ def ensure_bucket_exists(bucket: str, region: str = None) -> bool:
 
 def download_from_s3(bucket: str, s3_prefix: str, local_dir: str, dry_run: bool = False) -> List[str]:
     """S3에서 로컬로 다운로드"""
-    s3_client = boto3.client('s3')
+    s3_client = get_client('s3')
     downloaded = []
     
     try:
@@ -176,7 +178,7 @@ def upload_to_s3(local_path: str, bucket: str, s3_key: str, dry_run: bool = Fals
     if dry_run:
         print(f"  [DRY RUN] {local_path} -> {s3_uri}")
     else:
-        s3_client = boto3.client('s3')
+        s3_client = get_client('s3')
         s3_client.upload_file(local_path, bucket, s3_key)
         print(f"  ✓ Uploaded: {s3_uri}")
     